@@ -1,5 +1,6 @@
 """PnL service package."""
 
 from .app import PnLService, PricingError
+from .history import PnLHistory
 
-__all__ = ["PnLService", "PricingError"]
+__all__ = ["PnLService", "PnLHistory", "PricingError"]
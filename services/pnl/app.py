@@ -2,105 +2,135 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
-from dataclasses import dataclass, field
+import time
 from decimal import Decimal
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 import backoff
 
-from .exceptions import PricingError
-
-
-@dataclass
-class Position:
-    """Represents an open trading position."""
-
-    quantity: Decimal = Decimal("0")
-    avg_price: Decimal = Decimal("0")
-    realized: Decimal = Decimal("0")
-    last_price: Decimal = Decimal("0")
-
-    def update(self, qty: Decimal, price: Decimal) -> None:
-        same_side = self.quantity * qty >= 0
-        if same_side:
-            total_qty = self.quantity + qty
-            if total_qty:
-                self.avg_price = (
-                    (self.avg_price * self.quantity) + (price * qty)
-                ) / total_qty
-            self.quantity = total_qty
-        else:
-            closed = min(abs(qty), abs(self.quantity))
-            sign = Decimal("1") if self.quantity > 0 else Decimal("-1")
-            self.realized += (price - self.avg_price) * closed * sign
-            self.quantity += qty
-            if self.quantity == 0:
-                self.avg_price = Decimal("0")
-            if abs(qty) > closed:
-                self.avg_price = price
-        self.last_price = price
-
-    def mark(self, price: Decimal) -> None:
-        if price <= 0:
-            raise PricingError(f"invalid price {price}")
-        self.last_price = price
+from shared.positions import Position, PositionStore
 
-    @property
-    def unrealized(self) -> Decimal:
-        return (self.last_price - self.avg_price) * self.quantity
+from .exceptions import PricingError
+from .history import PnLHistory
+from .marks import MarkMetrics, decode_mark, epoch
 
 
 class PnLService:
     """Tracks portfolio P&L in real time."""
 
-    def __init__(self) -> None:
-        self.positions: Dict[str, Position] = {}
-        self.history: List[Dict[str, float]] = []
+    def __init__(self, history: Optional[PnLHistory] = None) -> None:
+        self.positions = PositionStore()
+        self.history = history or PnLHistory()
+        self._price_listeners: List[Callable[[str, Decimal], None]] = []
+        self._prices: Dict[str, Decimal] = {}
+        self._prices_view = MappingProxyType(self._prices)
+        self.price_version = 0
+        self.mark_metrics = MarkMetrics()
 
     @property
-    def prices(self) -> Dict[str, Decimal]:
-        """Current marked prices for all positions."""
-        return {sym: pos.last_price for sym, pos in self.positions.items()}
+    def prices(self) -> Mapping[str, Decimal]:
+        """Live read-only view of the marked price of every position.
+
+        ``price_version`` increases whenever an entry changes.
+        """
+        return self._prices_view
+
+    def add_price_listener(self, listener: Callable[[str, Decimal], None]) -> None:
+        """Call ``listener(symbol, price)`` whenever a position is re-marked."""
+        self._price_listeners.append(listener)
 
     def on_fill(self, symbol: str, qty: Decimal, price: Decimal) -> None:
-        pos = self.positions.setdefault(symbol, Position())
+        pos = self.positions.setdefault(symbol)
         pos.update(qty, price)
+        self._set_price(symbol, pos.last_price)
 
     def on_price(self, symbol: str, price: Decimal) -> None:
         pos = self.positions.get(symbol)
         if not pos:
             return
+        if price <= 0:
+            raise PricingError(f"invalid price {price}")
         pos.mark(price)
-
-    def snapshot(self) -> Dict[str, float]:
-        realized = sum(p.realized for p in self.positions.values())
-        unrealized = sum(p.unrealized for p in self.positions.values())
-        snap = {
-            "realized": float(realized),
-            "unrealized": float(unrealized),
-            "total": float(realized + unrealized),
-        }
-        self.history.append(snap)
-        return snap
+        self._set_price(symbol, price)
+
+    def _set_price(self, symbol: str, price: Decimal) -> None:
+        self._prices[symbol] = price
+        self.price_version += 1
+        for listener in self._price_listeners:
+            listener(symbol, price)
+
+    def snapshot(self, timestamp: Optional[float] = None) -> Dict[str, float]:
+        """Current totals, also recorded in ``history`` at ``timestamp``."""
+        realized, unrealized = self.positions.totals()
+        total = realized + unrealized
+        self.history.append(time.time() if timestamp is None else timestamp, realized, unrealized, total)
+        return {"realized": realized, "unrealized": unrealized, "total": total}
+
+    def apply_marks(self, messages: Iterable[Any]) -> int:
+        """Mark positions from a batch of raw market messages.
+
+        Only the latest valid price per symbol is applied; malformed
+        messages are counted in ``mark_metrics`` and skipped. Lag is measured
+        from the timestamp of the first message, the oldest in the batch.
+        Returns the number of positions marked; prices of symbols without
+        a position are ignored.
+        """
+        start = time.perf_counter()
+        now = time.time()
+        m = self.mark_metrics
+        latest: Dict[str, Decimal] = {}
+        first_ts: Any = None
+        size = 0
+        for raw in messages:
+            size += 1
+            try:
+                symbol, price, ts = decode_mark(raw)
+            except PricingError:
+                m.malformed += 1
+                continue
+            latest[symbol] = price
+            if first_ts is None:
+                first_ts = ts
+        marked = 0
+        for symbol, price in latest.items():
+            if symbol in self.positions:
+                self.on_price(symbol, price)
+                marked += 1
+        m.messages += size
+        m.batches += 1
+        m.marks += marked
+        m.last_batch_size = size
+        if first_ts is not None:
+            try:
+                m.last_lag = max(0.0, now - epoch(first_ts))
+                m.max_lag = max(m.max_lag, m.last_lag)
+            except (TypeError, ValueError):
+                pass  # an unparseable timestamp only costs this lag sample
+        m.busy += time.perf_counter() - start
+        return marked
 
     @backoff.on_exception(backoff.expo, Exception, max_tries=3)
-    async def listen_market_data(self, channel: str = "market") -> None:
-        import redis.asyncio as aioredis
+    async def listen_market_data(self, channel: str = "market", redis: Any = None, max_batch: int = 1000) -> None:
+        """Drain pending market messages and apply them in batches."""
+        if redis is None:
+            import redis.asyncio as aioredis
 
-        url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        redis = aioredis.from_url(url)
+            redis = aioredis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
         pubsub = redis.pubsub()
         await pubsub.subscribe(channel)
-        async for msg in pubsub.listen():
-            if msg.get("type") != "message":
-                continue
-            try:
-                data = json.loads(msg["data"])
-                symbol = data["symbol"]
-                price = Decimal(str(data["price"]))
-                self.on_price(symbol, price)
-            except (KeyError, ValueError) as exc:
-                raise PricingError("invalid pricing data") from exc
-
+        try:
+            while True:
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if msg is None:
+                    continue
+                batch = [msg["data"]]
+                while len(batch) < max_batch:
+                    msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0)
+                    if msg is None:
+                        break
+                    batch.append(msg["data"])
+                self.apply_marks(batch)
+        finally:
+            await pubsub.unsubscribe(channel)
@@ -0,0 +1,111 @@
+"""Bounded, downsampled PnL snapshot history."""
+from __future__ import annotations
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+COLUMNS: Tuple[str, ...] = ("timestamp", "realized", "unrealized", "total")
+DEFAULT_CAPACITY = int(os.getenv("PNL_HISTORY_CAPACITY", "86400"))
+# Seconds per bucket of the coarser tiers kept next to the raw snapshots.
+DEFAULT_RESOLUTIONS: Tuple[int, ...] = (60, 3600)
+
+
+class _Ring:
+    """Up to ``capacity`` float64 rows, oldest overwritten first.
+
+    Storage starts at ``initial`` rows and doubles until it reaches
+    ``capacity``, so tiers that only ever see a few buckets stay small.
+    """
+
+    def __init__(self, capacity: int, initial: int = 64) -> None:
+        self.capacity = capacity
+        self.rows = np.zeros((min(capacity, initial), len(COLUMNS)))
+        self.start = 0
+        self.count = 0
+
+    def append(self, row: Sequence[float]) -> None:
+        if self.count == len(self.rows) < self.capacity:
+            # Nothing has wrapped yet, so the rows are in order from 0.
+            grown = np.zeros((min(self.capacity, 2 * len(self.rows)), len(COLUMNS)))
+            grown[: self.count] = self.rows
+            self.rows = grown
+        capacity = len(self.rows)
+        idx = (self.start + self.count) % capacity
+        if self.count < capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % capacity
+        self.rows[idx] = row
+
+    def last(self) -> np.ndarray:
+        return self.rows[(self.start + self.count - 1) % len(self.rows)]
+
+    def segments(self) -> List[np.ndarray]:
+        end = self.start + self.count
+        if end <= len(self.rows):
+            return [self.rows[self.start : end]]
+        return [self.rows[self.start :], self.rows[: end - len(self.rows)]]
+
+
+class PnLHistory:
+    """Ring buffers of timestamped ``(realized, unrealized, total)`` rows.
+
+    Every snapshot lands in the raw tier. Each coarser tier keeps the last
+    snapshot of every ``resolution``-second bucket, stamped with the bucket
+    start. Timestamps must not go backwards; earlier ones are clamped.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        resolutions: Sequence[int] = DEFAULT_RESOLUTIONS,
+    ) -> None:
+        self.resolutions = (0,) + tuple(sorted(resolutions))
+        self._tiers = {res: _Ring(capacity) for res in self.resolutions}
+
+    def __len__(self) -> int:
+        return self._tiers[0].count
+
+    def append(self, timestamp: float, realized: float, unrealized: float, total: float) -> None:
+        raw = self._tiers[0]
+        if raw.count:
+            timestamp = max(timestamp, float(raw.last()[0]))
+        raw.append((timestamp, realized, unrealized, total))
+        for res in self.resolutions[1:]:
+            ring = self._tiers[res]
+            bucket = timestamp - timestamp % res
+            row = (bucket, realized, unrealized, total)
+            if ring.count and ring.last()[0] == bucket:
+                ring.last()[:] = row
+            else:
+                ring.append(row)
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        raw = self._tiers[0]
+        if not raw.count:
+            return None
+        return dict(zip(COLUMNS, raw.last().tolist()))
+
+    def query(
+        self,
+        start: float = float("-inf"),
+        end: float = float("inf"),
+        resolution: int = 0,
+    ) -> np.ndarray:
+        """Rows with ``start <= timestamp <= end`` in time order, as a copy.
+
+        ``resolution`` selects the tier: 0 for raw snapshots or one of
+        ``resolutions`` in seconds.
+        """
+        ring = self._tiers.get(resolution)
+        if ring is None:
+            raise ValueError(f"unknown resolution {resolution}")
+        parts = []
+        for seg in ring.segments():
+            ts = seg[:, 0]
+            lo = np.searchsorted(ts, start, side="left")
+            hi = np.searchsorted(ts, end, side="right")
+            parts.append(seg[lo:hi])
+        return np.concatenate(parts)
@@ -0,0 +1,66 @@
+"""Decoding and metrics for batched mark-to-market."""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Tuple
+
+from .exceptions import PricingError
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads
+
+
+@dataclass
+class MarkMetrics:
+    """Counters for the market data consumer."""
+
+    messages: int = 0
+    malformed: int = 0
+    batches: int = 0
+    marks: int = 0
+    last_batch_size: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    busy: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Messages handled per second of processing time."""
+        return self.messages / self.busy if self.busy else 0.0
+
+
+def epoch(value: Any) -> float:
+    """Seconds since the epoch from a numeric or ISO-8601 timestamp."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    ts = datetime.fromisoformat(value)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def decode_mark(raw: Any) -> Tuple[str, Decimal, Any]:
+    """Return ``(symbol, price, raw timestamp or None)`` from a market message.
+
+    Accepts ``{"symbol", "price"}`` marks as well as ``market_tick.json``
+    ticks, whose ``last`` is used as the price.
+    """
+    try:
+        msg = _loads(raw)
+        symbol = msg["symbol"]
+        if not isinstance(symbol, str):
+            raise TypeError("symbol must be a string")
+        value = msg["price"] if "price" in msg else msg["last"]
+        price = Decimal(value if isinstance(value, str) else str(value))
+        if not price.is_finite() or price <= 0:
+            raise ValueError(f"invalid price {price}")
+        return symbol, price, msg.get("timestamp")
+    except (KeyError, TypeError, ValueError, ArithmeticError) as exc:
+        raise PricingError("invalid pricing data") from exc
@@ -29,6 +29,7 @@ base_mod = importlib.util.module_from_spec(base_spec)
 base_spec.loader.exec_module(base_mod)
 
 RiskManager = app_mod.RiskManager
+RiskSequencer = app_mod.RiskSequencer
 Order = base_mod.Order
 
-__all__ = ["RiskManager", "Order", "exceptions_mod"]
+__all__ = ["RiskManager", "RiskSequencer", "Order", "exceptions_mod"]
@@ -3,21 +3,28 @@ from __future__ import annotations
 
 import os
 import asyncio
+import time
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
 from .circuit_breakers.drawdown import DrawdownCircuitBreaker
 from .exceptions import CircuitBreakerTripped, RiskLimitBreached, ValidationError
-from .limits.base import Order
+from .limits.base import BaseLimit, Order
 from .limits.concentration import ConcentrationLimit
 from .limits.daily_loss import DailyLossLimit
 from .limits.drawdown import DrawdownLimit
 from .limits.position import PositionLimit
 from .limits.velocity import VelocityLimit
-from .monitors.portfolio import Portfolio, Position
+from .monitors.portfolio import Portfolio, Position, Projection
 from .monitors.realtime import RealTimeMonitor
 from services.pnl import PnLService
 from .reporting.reporter import Reporter
+from .scenarios import ScenarioEngine
+from .sequencer import RiskSequencer
+
+# Orders projected before the first limit scan of a basket; the run
+# doubles while orders pass and restarts at this size after a rejection.
+_FIRST_RUN = 64
 
 
 class RiskManager:
@@ -27,9 +34,13 @@ class RiskManager:
         self,
         pnl_service: Optional[PnLService] = None,
         alert_queue: Optional[asyncio.Queue[str]] = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self.portfolio = Portfolio()
         self.pnl_service = pnl_service or PnLService()
+        for sym, price in self.pnl_service.prices.items():
+            self.portfolio.mark(sym, price)
+        self.pnl_service.add_price_listener(self.portfolio.mark)
         self.alerts = RealTimeMonitor(alert_queue or asyncio.Queue())
         self.limits: List = [
             PositionLimit(
@@ -41,6 +52,8 @@ class RiskManager:
             VelocityLimit(
                 int(os.getenv("VELOCITY_LIMIT", "10")),
                 int(os.getenv("VELOCITY_WINDOW", "60")),
+                os.getenv("VELOCITY_PER_SYMBOL", "false").lower() == "true",
+                clock,
             ),
             DrawdownLimit(Decimal(os.getenv("DRAWDOWN_LIMIT", "500"))),
         ]
@@ -51,19 +64,116 @@ class RiskManager:
         ]
         self.reporter = Reporter()
 
-    async def validate_order(self, order: Order) -> None:
+    def check_order(self, order: Order) -> Optional[str]:
+        """Return the first breach reason, or commit ``order`` to every limit.
+
+        The synchronous core of ``validate_order`` without alerting, for
+        callers such as backtests that run outside an event loop. Tripped
+        circuit breakers still raise.
+        """
         for cb in self.circuit_breakers:
             cb.check(self.portfolio)
+        prices = self.pnl_service.prices
         for limit in self.limits:
-            reason = limit.check(order, self.portfolio, self.pnl_service.prices)
+            reason = limit.check(order, self.portfolio, prices)
             if reason:
-                await self.alerts.alert(reason)
-                raise RiskLimitBreached(reason)
+                return reason
+        for limit in self.limits:
+            limit.commit(order)
+        return None
 
-    async def on_fill(self, order: Order) -> None:
+    async def validate_order(self, order: Order) -> None:
+        reason = self.check_order(order)
+        if reason:
+            await self.alerts.alert(reason)
+            raise RiskLimitBreached(reason)
+
+    async def validate_orders(self, batch: Sequence[Order]) -> List[Optional[str]]:
+        """Check a basket of orders against one portfolio snapshot.
+
+        Later orders see the effect of the accepted ones before them, with
+        positions valued at the P&L service's market prices. Returns the
+        breach reason per order, or None when it passed; alerts for all
+        breaches are sent together.
+
+        Each limit scans a projection of the basket in one pass, assuming
+        every order is accepted, and the run restarts after the first
+        rejection, so a basket costs a few comparisons per order and limit.
+        Baskets with a limit that cannot scan are checked order by order
+        against a trial portfolio.
+        """
+        for cb in self.circuit_breakers:
+            cb.check(self.portfolio)
+        prices = self.pnl_service.prices
+        orders = list(batch)
+        if all(type(limit).scan is not BaseLimit.scan for limit in self.limits):
+            verdicts = self._scan_orders(orders, prices)
+        else:
+            verdicts = self._check_orders(orders, prices)
+        breaches = [v for v in verdicts if v]
+        if breaches:
+            await self.alerts.alert_many(breaches)
+        return verdicts
+
+    def _scan_orders(self, orders: List[Order], prices: Dict[str, Decimal]) -> List[Optional[str]]:
+        verdicts: List[Optional[str]] = [None] * len(orders)
+        projection = Projection(self.portfolio)
+        start, size = 0, _FIRST_RUN
+        while start < len(orders):
+            end = min(len(orders), start + size)
+            projection.run(orders, start, end)
+            stop, reason = end, None
+            for limit in self.limits:
+                breach = limit.scan(orders, projection, prices, stop)
+                if breach is not None:
+                    stop, reason = breach
+            for limit in self.limits:
+                limit.accept(orders, projection, stop)
+            projection.accept(stop)
+            if reason is None:
+                start, size = end, size * 2
+            else:
+                verdicts[stop] = reason
+                start, size = stop + 1, _FIRST_RUN
+        return verdicts
+
+    def _check_orders(self, orders: List[Order], prices: Dict[str, Decimal]) -> List[Optional[str]]:
+        trial = self.portfolio.trial()
+        verdicts: List[Optional[str]] = []
+        for order in orders:
+            reason = None
+            for limit in self.limits:
+                reason = limit.check(order, trial, prices)
+                if reason:
+                    break
+            else:
+                for limit in self.limits:
+                    limit.commit(order)
+                trial.update(order.symbol, order.quantity, order.price)
+            verdicts.append(reason)
+        return verdicts
+
+    def reserve(self, order: Order) -> None:
+        """Count an accepted, unfilled order against the limits."""
         self.portfolio.update(order.symbol, order.quantity, order.price)
+
+    def release(self, order: Order) -> None:
+        """Drop the exposure ``reserve`` took for an order that will not fill."""
+        self.portfolio.update(order.symbol, -order.quantity, order.price)
+
+    def record_fill(self, order: Order, reserved: bool = False) -> None:
+        """Apply a fill to the risk portfolio and the P&L positions.
+
+        With ``reserved`` the risk portfolio already holds the order and
+        only the P&L positions are updated.
+        """
+        if not reserved:
+            self.portfolio.update(order.symbol, order.quantity, order.price)
         self.pnl_service.on_fill(order.symbol, order.quantity, order.price)
 
+    async def on_fill(self, order: Order) -> None:
+        self.record_fill(order)
+
     async def report(self) -> dict:
         return await self.reporter.snapshot(self.portfolio)
 
@@ -82,6 +192,10 @@ class RiskManager:
             pnl += pos.quantity * (pos.last_price + shock - pos.last_price)
         return pnl
 
+    def scenarios(self) -> ScenarioEngine:
+        """Scenario engine over the current marked positions."""
+        return ScenarioEngine.from_store(self.pnl_service.positions)
+
     def rebalance(self, targets: Dict[str, Decimal]) -> List[Order]:
         """Generate orders to match target quantities."""
         orders: List[Order] = []
@@ -4,9 +4,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
-from ..monitors.portfolio import Portfolio
+from ..monitors.portfolio import Portfolio, Projection
 
 
 @dataclass
@@ -28,3 +28,23 @@ class BaseLimit(ABC):
     ) -> Optional[str]:
         """Return reason string if breached."""
 
+    def commit(self, order: Order) -> None:
+        """Record an order that passed every limit."""
+
+    def scan(
+        self, orders: Sequence[Order], projection: Projection, prices: Dict[str, Decimal], stop: int
+    ) -> Optional[Tuple[int, str]]:
+        """First breach in ``orders[projection.start:stop]`` as ``(index, reason)``.
+
+        ``projection`` holds each order's pre-trade state assuming every
+        earlier one is accepted. Limits that leave this unimplemented make
+        ``validate_orders`` check each order against a trial portfolio.
+        """
+        raise NotImplementedError
+
+    def accept(self, orders: Sequence[Order], projection: Projection, stop: int) -> None:
+        """Record ``orders[projection.start:stop]``, which passed every limit."""
+        if type(self).commit is BaseLimit.commit:
+            return
+        for i in range(projection.start, stop):
+            self.commit(orders[i])
@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 from .base import BaseLimit, Order
-from ..monitors.portfolio import Portfolio
+from ..monitors.portfolio import Portfolio, Projection
 
 
 class ConcentrationLimit(BaseLimit):
@@ -17,19 +17,23 @@ class ConcentrationLimit(BaseLimit):
     def check(
         self, order: Order, portfolio: Portfolio, prices: Dict[str, Decimal]
     ) -> Optional[str]:
-        total_value = sum(
-            abs(p.quantity * prices.get(sym, p.avg_price))
-            for sym, p in portfolio.positions.items()
-        ) + abs(order.quantity * prices.get(order.symbol, order.price))
+        order_value = abs(order.quantity * prices.get(order.symbol, order.price))
+        total_value = portfolio.gross_notional + order_value
         if total_value == 0:
             return None
-        existing = portfolio.positions.get(order.symbol)
-        existing_value = (
-            abs(existing.quantity * prices.get(order.symbol, existing.avg_price))
-            if existing
-            else Decimal("0")
-        )
-        sym_value = existing_value + abs(order.quantity * prices.get(order.symbol, order.price))
-        if (sym_value / total_value) > self.max_percent:
+        sym_value = portfolio.notional(order.symbol) + order_value
+        if sym_value > self.max_percent * total_value:
             return "concentration limit"
         return None
+
+    def scan(
+        self, orders: Sequence[Order], projection: Projection, prices: Dict[str, Decimal], stop: int
+    ) -> Optional[Tuple[int, str]]:
+        start, max_percent = projection.start, self.max_percent
+        notionals, gross = projection.notional, projection.gross_notional
+        for i in range(start, stop):
+            order = orders[i]
+            order_value = abs(order.quantity * prices.get(order.symbol, order.price))
+            if notionals[i - start] + order_value > max_percent * (gross[i - start] + order_value):
+                return i, "concentration limit"
+        return None
@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 from .base import BaseLimit, Order
-from ..monitors.portfolio import Portfolio
+from ..monitors.portfolio import Portfolio, Projection
 
 
 class DailyLossLimit(BaseLimit):
@@ -20,3 +20,12 @@ class DailyLossLimit(BaseLimit):
         if portfolio.pnl < -self.max_loss:
             return "daily loss limit"
         return None
+
+    def scan(
+        self, orders: Sequence[Order], projection: Projection, prices: Dict[str, Decimal], stop: int
+    ) -> Optional[Tuple[int, str]]:
+        floor = -self.max_loss
+        pnls = projection.pnl[: stop - projection.start]
+        if not pnls or min(pnls) >= floor:
+            return None
+        return projection.start + next(i for i, pnl in enumerate(pnls) if pnl < floor), "daily loss limit"
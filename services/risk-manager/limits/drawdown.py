@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 from .base import BaseLimit, Order
-from ..monitors.portfolio import Portfolio
+from ..monitors.portfolio import Portfolio, Projection
 
 
 class DrawdownLimit(BaseLimit):
@@ -25,3 +25,23 @@ class DrawdownLimit(BaseLimit):
         if drawdown > self.max_drawdown:
             return "drawdown limit"
         return None
+
+    def scan(
+        self, orders: Sequence[Order], projection: Projection, prices: Dict[str, Decimal], stop: int
+    ) -> Optional[Tuple[int, str]]:
+        # The watermark only moves in ``accept``: a later limit may still
+        # cut the run short and undo the PnL seen past the cut.
+        high = self.high_watermark
+        pnls = projection.pnl
+        for i in range(projection.start, stop):
+            pnl = pnls[i - projection.start]
+            if pnl > high:
+                high = pnl
+            if high - pnl > self.max_drawdown:
+                return i, "drawdown limit"
+        return None
+
+    def accept(self, orders: Sequence[Order], projection: Projection, stop: int) -> None:
+        seen = projection.pnl[: stop - projection.start]
+        if seen:
+            self.high_watermark = max(self.high_watermark, max(seen))
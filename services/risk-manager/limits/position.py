@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 from .base import BaseLimit, Order
-from ..monitors.portfolio import Portfolio
+from ..monitors.portfolio import Portfolio, Projection
 
 
 class PositionLimit(BaseLimit):
@@ -22,7 +22,19 @@ class PositionLimit(BaseLimit):
         current = sym_qty.quantity if sym_qty else Decimal("0")
         if abs(current + order.quantity) > self.symbol_limit:
             return "symbol position limit"
-        total = sum(abs(p.quantity) for p in portfolio.positions.values())
-        if total + abs(order.quantity) > self.total_limit:
+        if portfolio.gross_quantity + abs(order.quantity) > self.total_limit:
             return "total position limit"
         return None
+
+    def scan(
+        self, orders: Sequence[Order], projection: Projection, prices: Dict[str, Decimal], stop: int
+    ) -> Optional[Tuple[int, str]]:
+        start = projection.start
+        quantities, gross = projection.quantity, projection.gross_quantity
+        for i in range(start, stop):
+            qty = orders[i].quantity
+            if abs(quantities[i - start] + qty) > self.symbol_limit:
+                return i, "symbol position limit"
+            if gross[i - start] + abs(qty) > self.total_limit:
+                return i, "total position limit"
+        return None
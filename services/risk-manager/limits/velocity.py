@@ -1,29 +1,76 @@
 """Velocity limits."""
 from __future__ import annotations
 
+from decimal import Decimal
 import time
-from collections import deque
-from typing import Deque, Dict, Optional
+from collections import Counter
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from shared.utils.gcra import GCRALimiter
 
 from .base import BaseLimit, Order
-from ..monitors.portfolio import Portfolio
+from ..monitors.portfolio import Portfolio, Projection
+
+GLOBAL_KEY = "*"
 
 
 class VelocityLimit(BaseLimit):
-    """Limit number of trades per time window."""
+    """Limit number of trades per time window, overall or per symbol.
 
-    def __init__(self, max_trades: int, window_sec: int) -> None:
+    Orders only count against the window once every limit has passed.
+    """
+
+    def __init__(
+        self,
+        max_trades: int,
+        window_sec: int,
+        per_symbol: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self.max_trades = max_trades
         self.window_sec = window_sec
-        self.history: Deque[float] = deque()
+        self.per_symbol = per_symbol
+        self.limiter = GCRALimiter(max_trades, window_sec, clock)
+
+    def _key(self, order: Order) -> str:
+        return order.symbol if self.per_symbol else GLOBAL_KEY
 
     def check(
         self, order: Order, portfolio: Portfolio, prices: Dict[str, Decimal]
     ) -> Optional[str]:
-        now = time.time()
-        self.history.append(now)
-        while self.history and now - self.history[0] > self.window_sec:
-            self.history.popleft()
-        if len(self.history) > self.max_trades:
+        if not self.limiter.check(self._key(order)):
             return "velocity limit"
         return None
+
+    def commit(self, order: Order) -> None:
+        self.limiter.consume(self._key(order))
+
+    def scan(
+        self, orders: Sequence[Order], projection: Projection, prices: Dict[str, Decimal], stop: int
+    ) -> Optional[Tuple[int, str]]:
+        start = projection.start
+        now = self.limiter.clock()
+        if not self.per_symbol:
+            cut = start + self.limiter.headroom(GLOBAL_KEY, now)
+            return (cut, "velocity limit") if cut < stop else None
+        left: Dict[str, int] = {}
+        for i in range(start, stop):
+            symbol = orders[i].symbol
+            room = left.get(symbol)
+            if room is None:
+                room = self.limiter.headroom(symbol, now)
+            if not room:
+                return i, "velocity limit"
+            left[symbol] = room - 1
+        return None
+
+    def accept(self, orders: Sequence[Order], projection: Projection, stop: int) -> None:
+        if stop == projection.start:
+            return
+        now = self.limiter.clock()
+        if not self.per_symbol:
+            self.limiter.consume(GLOBAL_KEY, now, stop - projection.start)
+            return
+        counts = Counter(orders[i].symbol for i in range(projection.start, stop))
+        for key, count in counts.items():
+            self.limiter.consume(key, now, count)
@@ -1,35 +1,220 @@
 """Portfolio monitoring utilities."""
 from __future__ import annotations
 
+from collections.abc import ItemsView, KeysView, ValuesView
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
+from shared.positions import Position, PositionStore
 
-@dataclass
-class Position:
-    """Represents an open position."""
+ZERO = Decimal("0")
+
+
+class _Layer(dict):
+    """Local entries over a base mapping that is never modified.
+
+    Base values are pulled into the layer (through ``copy`` if given) the
+    first time they are read. The number of local keys that shadow a base
+    key is kept up to date, so ``len`` is O(1).
+    """
+
+    def __init__(self, base: Mapping[str, Any], copy: Optional[Callable[[Any], Any]] = None) -> None:
+        super().__init__()
+        self.base = base
+        self.copy = copy
+        self._shadowed = 0
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if not dict.__contains__(self, key) and key in self.base:
+            self._shadowed += 1
+        dict.__setitem__(self, key, value)
+
+    def __missing__(self, key: str) -> Any:
+        value = self.base[key]
+        if self.copy is not None:
+            value = self.copy(value)
+        self[key] = value
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
-    quantity: Decimal = Decimal("0")
-    avg_price: Decimal = Decimal("0")
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self.base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from dict.__iter__(self)
+        yield from (k for k in self.base if not dict.__contains__(self, k))
+
+    def __len__(self) -> int:
+        return len(self.base) + dict.__len__(self) - self._shadowed
+
+    def keys(self) -> KeysView:  # type: ignore[override]
+        return KeysView(self)
+
+    def items(self) -> ItemsView:  # type: ignore[override]
+        return ItemsView(self)
+
+    def values(self) -> ValuesView:  # type: ignore[override]
+        return ValuesView(self)
 
 
 @dataclass
 class Portfolio:
-    """Simple in-memory portfolio tracker."""
+    """Simple in-memory portfolio tracker.
+
+    ``gross_quantity`` and ``gross_notional`` are maintained incrementally
+    so limit checks do not have to scan every position. Notional values use
+    the latest ``mark`` for a symbol, falling back to its average price.
+    """
 
-    positions: Dict[str, Position] = field(default_factory=dict)
+    positions: PositionStore = field(default_factory=PositionStore)
     pnl: Decimal = Decimal("0")
+    gross_quantity: Decimal = Decimal("0")
+    gross_notional: Decimal = Decimal("0")
+    marks: Dict[str, Decimal] = field(default_factory=dict)
+    _notional: Dict[str, Decimal] = field(default_factory=dict, repr=False)
 
     def update(self, symbol: str, quantity: Decimal, price: Decimal) -> None:
         pos = self.positions.setdefault(symbol, Position())
-        new_qty = pos.quantity + quantity
-        if new_qty == 0:
-            pos.quantity = Decimal("0")
-            pos.avg_price = Decimal("0")
-        else:
-            pos.avg_price = (
-                (pos.avg_price * pos.quantity + price * quantity) / new_qty
-            )
-            pos.quantity = new_qty
+        old_qty = pos.quantity
+        pos.update(quantity, price)
         self.pnl += -price * quantity
+        self.gross_quantity += abs(pos.quantity) - abs(old_qty)
+        self._revalue(symbol, pos)
+
+    def trial(self) -> "Portfolio":
+        """Scratch portfolio layered over this one.
+
+        Positions are copied on first access, so creating a trial is O(1)
+        and updating it never touches the original.
+        """
+        return Portfolio(
+            positions=_Layer(self.positions, Position.copy),
+            pnl=self.pnl,
+            gross_quantity=self.gross_quantity,
+            gross_notional=self.gross_notional,
+            marks=_Layer(self.marks),
+            _notional=_Layer(self._notional),
+        )
+
+    def mark(self, symbol: str, price: Decimal) -> None:
+        """Record the latest price for ``symbol`` in O(1)."""
+        self.marks[symbol] = price
+        pos = self.positions.get(symbol)
+        if pos is not None:
+            self._revalue(symbol, pos)
+
+    def notional(self, symbol: str) -> Decimal:
+        """Absolute marked value of one position."""
+        return self._notional.get(symbol, ZERO)
+
+    def _revalue(self, symbol: str, pos: Position) -> None:
+        value = abs(pos.quantity * self.marks.get(symbol, pos.avg_price))
+        self.gross_notional += value - self._notional.get(symbol, ZERO)
+        self._notional[symbol] = value
+
+    def recompute(self) -> Tuple[Decimal, Decimal]:
+        """Full-scan ``(gross_quantity, gross_notional)`` for verification."""
+        quantity = sum((abs(p.quantity) for p in self.positions.values()), Decimal("0"))
+        notional = sum(
+            (abs(p.quantity * self.marks.get(sym, p.avg_price)) for sym, p in self.positions.items()),
+            Decimal("0"),
+        )
+        return quantity, notional
+
+
+_Held = Tuple[Decimal, Decimal, Decimal, Optional[Position]]
+
+
+class Projection:
+    """Pre-trade state of each order in a basket if every order is accepted.
+
+    ``run`` fills one entry per order in ``quantity`` (the symbol's
+    position), ``notional``, ``gross_quantity``, ``gross_notional`` and
+    ``pnl``, indexed from ``start``. Once the first rejected order is known,
+    ``accept`` keeps the orders before it and the next ``run`` continues
+    from that state. Positions are valued at the portfolio marks, which
+    follow market prices, or at their average price when a symbol has no
+    mark, exactly as ``Portfolio.update`` would. The portfolio itself is
+    never modified.
+    """
+
+    def __init__(self, portfolio: Portfolio) -> None:
+        self.portfolio = portfolio
+        self.start = 0
+        self.quantity: List[Decimal] = []
+        self.notional: List[Decimal] = []
+        self.gross_quantity: List[Decimal] = []
+        self.gross_notional: List[Decimal] = []
+        self.pnl: List[Decimal] = []
+        # symbol -> (quantity, its absolute value, notional, position); the
+        # position is only kept current for symbols valued at their average
+        # price.
+        self._held: Dict[str, _Held] = {}
+        # (symbol, state before) per projected order, to undo rejected runs.
+        self._undo: List[Tuple[str, Optional[_Held]]] = []
+        self._totals = (portfolio.gross_quantity, portfolio.gross_notional, portfolio.pnl)
+
+    def run(self, orders: Sequence[Any], start: int, end: int) -> None:
+        """Project ``orders[start:end]`` from the accepted state."""
+        portfolio = self.portfolio
+        marks, positions, notionals_of = portfolio.marks, portfolio.positions, portfolio._notional
+        held = self._held
+        self.start = start
+        self.quantity, self.notional = quantities, notionals = [], []
+        self.gross_quantity, self.gross_notional, self.pnl = gross_quantities, gross_notionals, pnls = [], [], []
+        self._undo = undo = []
+        gross_quantity, gross_notional, pnl = self._totals
+        for i in range(start, end):
+            order = orders[i]
+            symbol, quantity, price = order.symbol, order.quantity, order.price
+            state = held.get(symbol)
+            undo.append((symbol, state))
+            if state is None:
+                pos = positions.get(symbol)
+                qty = pos.quantity if pos is not None else ZERO
+                state = (qty, abs(qty), notionals_of.get(symbol, ZERO), pos)
+            qty, size, value, pos = state
+            quantities.append(qty)
+            notionals.append(value)
+            gross_quantities.append(gross_quantity)
+            gross_notionals.append(gross_notional)
+            pnls.append(pnl)
+            qty += quantity
+            mark = marks.get(symbol)
+            if mark is None:
+                pos = pos.copy() if pos is not None else Position()
+                pos.update(quantity, price)
+                mark = pos.avg_price
+            new_size = abs(qty)
+            new_value = abs(qty * mark)
+            gross_quantity += new_size - size
+            gross_notional += new_value - value
+            pnl -= price * quantity
+            held[symbol] = (qty, new_size, new_value, pos)
+        self._totals = (gross_quantity, gross_notional, pnl)
+
+    def accept(self, stop: int) -> None:
+        """Keep the orders of the last run before index ``stop``."""
+        count = stop - self.start
+        if count == len(self._undo):
+            return
+        held = self._held
+        for symbol, state in reversed(self._undo[count:]):
+            if state is None:
+                del held[symbol]
+            else:
+                held[symbol] = state
+        self._totals = (self.gross_quantity[count], self.gross_notional[count], self.pnl[count])
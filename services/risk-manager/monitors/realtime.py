@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+from typing import Iterable
 
 
 @dataclass
@@ -14,3 +15,8 @@ class RealTimeMonitor:
     async def alert(self, message: str) -> None:
         """Send alert asynchronously."""
         await self.queue.put(message)
+
+    async def alert_many(self, messages: Iterable[str]) -> None:
+        """Send several alerts in one call."""
+        for message in messages:
+            await self.queue.put(message)
@@ -0,0 +1,82 @@
+"""Vectorized scenario analysis over open positions."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.positions import PositionStore
+
+from .exceptions import RiskError
+
+
+@dataclass
+class ScenarioResult:
+    """PnL per scenario with its tail statistics, losses as positive numbers."""
+
+    pnl: np.ndarray
+    confidence: float
+    var: float
+    expected_shortfall: float
+
+
+class ScenarioEngine:
+    """Revalue a portfolio under many return scenarios at once.
+
+    Scenarios are rows of a ``(scenarios, positions)`` matrix of simple
+    returns, one column per entry of ``symbols``. Each scenario's PnL is the
+    row dotted with the marked notional of every position.
+    """
+
+    def __init__(self, symbols: Sequence[str], quantities: np.ndarray, prices: np.ndarray) -> None:
+        self.symbols = list(symbols)
+        self.exposure = np.asarray(quantities, dtype=np.float64) * np.asarray(prices, dtype=np.float64)
+        if self.exposure.shape != (len(self.symbols),):
+            raise RiskError("quantities and prices must have one entry per symbol")
+
+    @classmethod
+    def from_store(cls, store: PositionStore) -> "ScenarioEngine":
+        n = len(store.symbols)
+        return cls(store.symbols, store.quantities[:n].copy(), store.last_prices[:n].copy())
+
+    def evaluate(self, returns: np.ndarray, confidence: float = 0.99) -> ScenarioResult:
+        returns = np.asarray(returns)
+        if returns.ndim != 2 or returns.shape[1] != len(self.symbols):
+            raise RiskError(f"expected a (scenarios, {len(self.symbols)}) return matrix")
+        if not len(returns):
+            raise RiskError("no scenarios")
+        dtype = returns.dtype if returns.dtype in (np.float32, np.float64) else np.float64
+        pnl = (returns @ self.exposure.astype(dtype, copy=False)).astype(np.float64, copy=False)
+        var, es = tail_risk(pnl, confidence)
+        return ScenarioResult(pnl=pnl, confidence=confidence, var=var, expected_shortfall=es)
+
+
+def tail_risk(pnl: np.ndarray, confidence: float = 0.99) -> Tuple[float, float]:
+    """Value at risk and expected shortfall of a PnL sample."""
+    if not 0 < confidence < 1:
+        raise RiskError("confidence must be between 0 and 1")
+    var = -float(np.quantile(pnl, 1 - confidence))
+    tail = pnl[pnl <= -var]
+    return var, -float(tail.mean())
+
+
+def historical(prices: np.ndarray) -> np.ndarray:
+    """Replay shocks: period returns of a ``(periods, positions)`` price history."""
+    prices = np.asarray(prices, dtype=np.float64)
+    return prices[1:] / prices[:-1] - 1
+
+
+def sigma_grid(vol: np.ndarray, k: float = 3.0, steps: int = 13) -> np.ndarray:
+    """Parametric shocks moving every position by ``-k..k`` of its volatility."""
+    ks = np.linspace(-k, k, steps)
+    return ks[:, None] * np.asarray(vol, dtype=np.float64)[None, :]
+
+
+def monte_carlo(
+    cov: np.ndarray, n: int, seed: Optional[int] = None, dtype: type = np.float64
+) -> np.ndarray:
+    """``n`` correlated normal return draws with covariance ``cov``."""
+    factor = np.linalg.cholesky(np.asarray(cov, dtype=np.float64)).astype(dtype)
+    z = np.random.default_rng(seed).standard_normal((n, len(factor)), dtype=dtype)
+    return z @ factor.T
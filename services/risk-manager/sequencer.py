@@ -0,0 +1,121 @@
+"""Single-writer sequencing of risk state changes."""
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from .exceptions import RiskError
+from .limits.base import Order
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .app import RiskManager
+
+SUBMIT = "submit"
+FILL = "fill"
+CANCEL = "cancel"
+
+Request = Tuple[str, Order, asyncio.Future]
+
+
+class RiskSequencer:
+    """Apply order checks and fills to a ``RiskManager`` one at a time.
+
+    Any number of producer tasks may await ``submit``, ``fill`` and
+    ``cancel``; a single writer task handles the requests in arrival order.
+    An accepted order is reserved against the limits before the next
+    request is looked at, so two orders can never both pass a limit that
+    only one of them fits. The reservation turns into a position on
+    ``fill`` and is dropped on ``cancel``; orders are matched by identity,
+    so pass the same ``Order`` object to all three.
+    """
+
+    def __init__(self, manager: "RiskManager", maxsize: int = 0) -> None:
+        self.manager = manager
+        self._queue: asyncio.Queue[Optional[Request]] = asyncio.Queue(maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._working: Dict[int, Order] = {}
+
+    def start(self) -> None:
+        if self._task is None:
+            self._closed = False
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop taking requests, finish the queued ones and stop the writer."""
+        if self._task is None:
+            return
+        self._closed = True
+        await self._queue.put(None)
+        try:
+            await self._task
+        finally:
+            self._task = None
+            self._fail_pending()
+
+    async def submit(self, order: Order) -> None:
+        """Validate ``order`` and reserve its exposure if accepted.
+
+        Raises the same exceptions as ``RiskManager.validate_order``.
+        """
+        await self._request(SUBMIT, order)
+
+    async def fill(self, order: Order) -> None:
+        """Book an execution of a submitted order, or of one placed elsewhere."""
+        await self._request(FILL, order)
+
+    async def cancel(self, order: Order) -> None:
+        """Release the reservation of a submitted order that will not fill."""
+        await self._request(CANCEL, order)
+
+    async def _request(self, op: str, order: Order) -> None:
+        if self._task is None or self._closed:
+            raise RiskError("sequencer not started")
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, order, fut))
+        if self._task is None:
+            # Closed while waiting for room; nothing will read the queue.
+            self._fail_pending()
+        await fut
+
+    def _fail_pending(self) -> None:
+        while not self._queue.empty():
+            request = self._queue.get_nowait()
+            if request is not None and not request[2].done():
+                request[2].set_exception(RiskError("sequencer closed"))
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                request = await self._queue.get()
+                if request is None:
+                    return
+                await self._handle(*request)
+        finally:
+            self._fail_pending()
+
+    async def _handle(self, op: str, order: Order, fut: asyncio.Future) -> None:
+        error: Optional[BaseException] = RiskError("sequencer closed")
+        try:
+            await self._apply(op, order)
+            error = None
+        except Exception as exc:
+            error = exc
+        finally:
+            # Also runs when the writer is cancelled mid-request.
+            if not fut.done():
+                if error is None:
+                    fut.set_result(None)
+                else:
+                    fut.set_exception(error)
+
+    async def _apply(self, op: str, order: Order) -> None:
+        if op == SUBMIT:
+            await self.manager.validate_order(order)
+            self.manager.reserve(order)
+            self._working[id(order)] = order
+        elif op == FILL:
+            reserved = self._working.pop(id(order), None) is order
+            self.manager.record_fill(order, reserved=reserved)
+        elif self._working.pop(id(order), None) is order:
+            self.manager.release(order)
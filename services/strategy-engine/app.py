@@ -2,21 +2,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
-import backoff
-import pandas as pd
 import redis.asyncio as aioredis
 from fastapi import FastAPI, HTTPException, Request
 from shared.validation.fastapi import ValidationMiddleware
 from shared.security.auth.fastapi import AuthMiddleware
 from pydantic import BaseModel, Field
 
+from .dispatch import MarketQueue, StrategyDispatcher, from_env as dispatch_from_env
+from .marketdata.ticks import TickIngestor
+from .signals.models import Signal
+from .signals.publisher import SignalPublisher
 from .strategies.base import BaseStrategy
-from .strategies.loader import load_strategy, LoaderError
+from .strategies.loader import load_strategy, LoaderError, SandboxedStrategy
 
 
 class EngineError(Exception):
@@ -57,13 +58,16 @@ app.add_middleware(ValidationMiddleware, schemas={"/strategies": "strategy_reque
 
 @app.post("/strategies")
 async def add_strategy(req: StrategyRequest, request: Request) -> Dict[str, str]:
-    data = request.scope.get("state", {}).get("validated")
-    payload = data or req.dict()
+    state = request.scope.get("state", {})
+    payload = state.get("validated") or req.dict()
+    # Strategies of different token subjects never share a sandbox worker.
+    owner = str(state.get("claims", {}).get("sub", ""))
     try:
         strat = load_strategy(
             payload["path"],
             payload["path"].split(".")[-1],
             Decimal(payload["position_size"]),
+            owner=owner,
             **payload.get("params", {}),
         )
     except LoaderError as exc:
@@ -77,23 +81,68 @@ async def list_strategies() -> List[str]:
     return manager.list()
 
 
-@backoff.on_exception(backoff.expo, aioredis.RedisError, max_tries=3)
-async def publish_signal(redis: aioredis.Redis, signal: Dict[str, str]) -> None:
-    await redis.publish("signals", json.dumps(signal))
+def _window(strat: BaseStrategy) -> Optional[int]:
+    """Rows ``strat`` reads to decide the latest tick; None if it does not say."""
+    try:
+        return max(int(strat.lookback), 0) + 1
+    except NotImplementedError:
+        return None
+
+
+def _history(ingestor: TickIngestor, symbol: str) -> Callable[[BaseStrategy], Any]:
+    """Per-strategy input for the latest ``symbol`` tick.
+
+    Sandboxed strategies get a ``HistoryRef`` their worker maps itself;
+    in-process strategies get the same rows as a zero-copy frame.
+    """
+
+    def build(strat: BaseStrategy) -> Any:
+        window = _window(strat)
+        if isinstance(strat, SandboxedStrategy):
+            return ingestor.ref(symbol, window)
+        return ingestor.frame(symbol, window)
+
+    return build
+
+
+async def _evaluate_market_data(
+    publisher: SignalPublisher,
+    ingestor: TickIngestor,
+    queue: MarketQueue,
+    dispatcher: StrategyDispatcher,
+) -> None:
+    while True:
+        symbol = await queue.get()
+        data = _history(ingestor, symbol)
+
+        async def publish(signal: Signal, symbol: str = symbol) -> None:
+            signal.symbol = signal.symbol or symbol
+            await publisher.publish(signal)
+
+        dispatcher.dispatch(manager.values(), data, publish)
+        await asyncio.sleep(0)
 
 
 async def listen_market_data() -> None:
     redis = get_redis()
     pubsub = redis.pubsub()
     await pubsub.subscribe("market")
-    async for msg in pubsub.listen():
-        if msg.get("type") != "message":
-            continue
-        try:
-            data = pd.read_json(msg["data"])
-        except ValueError:
-            continue
-        for strat in manager.values():
-            signal = strat.generate_signal(data)
-            if signal:
-                await publish_signal(redis, signal.__dict__)
+    ingestor = TickIngestor()
+    queue, dispatcher = dispatch_from_env()
+    publisher = SignalPublisher.from_env(redis)
+    publisher.start()
+    evaluator = asyncio.create_task(_evaluate_market_data(publisher, ingestor, queue, dispatcher))
+    try:
+        async for msg in pubsub.listen():
+            if msg.get("type") != "message":
+                continue
+            if evaluator.done():
+                evaluator.result()
+            symbol = ingestor.ingest(msg["data"])
+            if symbol is not None:
+                queue.put_nowait(symbol, symbol)
+    finally:
+        evaluator.cancel()
+        dispatcher.shutdown()
+        ingestor.close()
+        await publisher.close()
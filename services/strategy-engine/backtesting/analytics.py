@@ -0,0 +1,177 @@
+"""Vectorized performance metrics for backtest results."""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .engine import BacktestResult, equity_curve
+
+# Daily bars by default; pass the bar frequency for anything else.
+PERIODS_PER_YEAR = 252.0
+
+
+class AnalyticsError(Exception):
+    """Raised when metrics cannot be computed for the given data."""
+
+
+def _ratio(num: float, den: float) -> float:
+    return num / den if den > 0 else math.nan
+
+
+def _bar_times(data: pd.DataFrame) -> Optional[pd.DatetimeIndex]:
+    if isinstance(data.index, pd.DatetimeIndex):
+        return data.index
+    if "timestamp" in data.columns:
+        return pd.DatetimeIndex(pd.to_datetime(data["timestamp"].to_numpy(), unit="s"))
+    return None
+
+
+@dataclass
+class Performance:
+    """Equity curve and summary metrics of one backtest.
+
+    Series are float64 arrays aligned with the bars. ``returns`` are bar
+    PnL changes over ``capital``, so with the default of 1 they are PnL
+    in quote currency; Sharpe and Sortino do not depend on the scale.
+    ``win_rate`` is the share of position legs, from one fill to the next
+    with a non-zero position, that made money after costs.
+    """
+
+    equity: np.ndarray
+    returns: np.ndarray
+    drawdown: np.ndarray
+    fills: np.ndarray
+    traded: np.ndarray
+    times: Optional[pd.DatetimeIndex]
+    periods_per_year: float
+    profit: float
+    sharpe: float
+    sortino: float
+    max_drawdown: float
+    turnover: float
+    win_rate: float
+    trades: int
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "profit": self.profit,
+            "sharpe": self.sharpe,
+            "sortino": self.sortino,
+            "max_drawdown": self.max_drawdown,
+            "turnover": self.turnover,
+            "win_rate": self.win_rate,
+            "trades": self.trades,
+        }
+
+    def rolling(self, window: int) -> pd.DataFrame:
+        """Trailing ``window``-bar return, Sharpe, Sortino and drawdown per bar."""
+        returns = pd.Series(self.returns)
+        roll = returns.rolling(window)
+        scale = math.sqrt(self.periods_per_year)
+        std = roll.std()
+        downside = np.sqrt((returns.clip(upper=0.0) ** 2).rolling(window).mean())
+        mean = roll.mean()
+        equity = pd.Series(self.equity)
+        frame = pd.DataFrame(
+            {
+                "return": roll.sum(),
+                "sharpe": (mean / std.where(std > 0)) * scale,
+                "sortino": (mean / downside.where(downside > 0)) * scale,
+                "drawdown": equity.rolling(window).max() - equity,
+            }
+        )
+        if self.times is not None:
+            frame.index = self.times
+        return frame
+
+    def rollup(self, freq: str = "D") -> pd.DataFrame:
+        """Return, its volatility, worst drawdown and fills per calendar period.
+
+        ``freq`` is a pandas period alias such as ``D``, ``W`` or ``M``.
+        Needs a ``DatetimeIndex`` or an epoch-seconds ``timestamp`` column.
+        """
+        if self.times is None:
+            raise AnalyticsError("rollups need bar timestamps")
+        frame = pd.DataFrame(
+            {
+                "return": self.returns,
+                "drawdown": self.drawdown,
+                "trades": self.fills,
+                "turnover": self.traded,
+            }
+        )
+        groups = frame.groupby(self.times.to_period(freq))
+        out = groups.agg(
+            **{"return": ("return", "sum")},
+            volatility=("return", "std"),
+            max_drawdown=("drawdown", "max"),
+            trades=("trades", "sum"),
+            turnover=("turnover", "sum"),
+        )
+        out.index.name = "period"
+        return out
+
+
+def analyze(
+    result: BacktestResult,
+    data: pd.DataFrame,
+    capital: float = 1.0,
+    periods_per_year: float = PERIODS_PER_YEAR,
+) -> Performance:
+    """Build the equity curve of ``result`` over ``data`` and its metrics.
+
+    Everything is computed with array operations over bars and fills, so
+    the cost is a few passes over ``data`` however many trades there are.
+    Needs the ``arrays`` that ``run_vectorized`` and ``run_chunked`` fill
+    in; a result with trades but no arrays raises ``AnalyticsError``.
+    """
+    close = data["close"].to_numpy(dtype=np.float64)
+    if not len(close):
+        raise AnalyticsError("no bars to analyze")
+    arrays = result.arrays
+    if arrays is None and result.trades:
+        raise AnalyticsError("result has no trade arrays; use run_vectorized/run_chunked")
+    quantity = arrays.quantity if arrays is not None else 0.0
+    equity = equity_curve(arrays, close, quantity)
+    returns = np.diff(equity, prepend=0.0) / capital
+    drawdown = np.maximum.accumulate(np.maximum(equity, 0.0)) - equity
+    fills = np.zeros(len(close))
+    traded = np.zeros(len(close))
+    win_rate = math.nan
+    if arrays is not None and len(arrays.index):
+        fills[arrays.index] = 1.0
+        traded[arrays.index] = np.abs(arrays.price) * quantity
+        # A leg holds the position left by one fill until the next fill or
+        # the last bar; it also pays the costs of the fill that opened it.
+        held = np.cumsum(arrays.action * quantity)
+        ends = np.append(arrays.index[1:], len(close) - 1)
+        cash = np.diff(arrays.pnl, prepend=0.0)
+        costs = cash + arrays.action * quantity * arrays.price
+        legs = held * (close[ends] - arrays.price) + costs
+        open_legs = held != 0
+        if open_legs.any():
+            win_rate = float(np.mean(legs[open_legs] > 0))
+    scale = math.sqrt(periods_per_year)
+    mean = float(returns.mean())
+    std = float(returns.std(ddof=1)) if len(returns) > 1 else 0.0
+    downside = float(np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2)))
+    return Performance(
+        equity=equity,
+        returns=returns,
+        drawdown=drawdown,
+        fills=fills,
+        traded=traded,
+        times=_bar_times(data),
+        periods_per_year=periods_per_year,
+        profit=float(equity[-1]),
+        sharpe=_ratio(mean, std) * scale,
+        sortino=_ratio(mean, downside) * scale,
+        max_drawdown=float(drawdown.max()),
+        turnover=float(traded.sum()) / capital,
+        win_rate=win_rate,
+        trades=int(fills.sum()),
+    )
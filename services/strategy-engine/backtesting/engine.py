@@ -3,12 +3,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import List
+from typing import Dict, Iterable, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
-from ..signals.models import Signal
-from ..strategies.base import BaseStrategy
+from ..indicators.cache import IndicatorCache, indicator_cache
+from ..signals.generator import create_signal
+from ..signals.models import ACTION_CODES, Signal
+from ..strategies.base import BaseStrategy, StrategyError
+
+DECIMAL = "decimal"
+FLOAT = "float"
+FIXED = "fixed"
+# Fixed-point accounting resolution: 1e-8 of the quote currency.
+FIXED_SCALE = 10**8
+# Largest amount int64 ticks can hold, about 9.2e10 of the quote currency.
+FIXED_MAX = (2**63 - 1) // FIXED_SCALE
 
 
 @dataclass
@@ -19,12 +30,48 @@ class Trade:
     pnl: Decimal
 
 
+@dataclass
+class TradeArrays:
+    """Per-fill series from a vectorized run.
+
+    ``pnl`` is the cumulative cash after each fill and ``quantity`` the
+    size of every fill.
+    """
+
+    index: np.ndarray
+    action: np.ndarray
+    price: np.ndarray
+    pnl: np.ndarray
+    quantity: float = 1.0
+
+
 @dataclass
 class BacktestResult:
     """Aggregated metrics."""
 
     trades: List[Trade] = field(default_factory=list)
     profit: Decimal = Decimal("0")
+    arrays: Optional[TradeArrays] = None
+
+
+@dataclass
+class MultiResult:
+    """Per-strategy results of one pass plus the combined equity curve."""
+
+    results: Dict[str, BacktestResult]
+    curves: pd.DataFrame
+    equity: pd.Series
+    indicators: Dict[str, int] = field(default_factory=dict)
+
+
+def equity_curve(arrays: Optional[TradeArrays], close: np.ndarray, quantity: float) -> np.ndarray:
+    """Cash from fills plus the open position marked at every bar's close."""
+    cash = np.zeros(len(close))
+    held = np.zeros(len(close))
+    if arrays is not None and len(arrays.index):
+        cash[arrays.index] = np.diff(arrays.pnl, prepend=0.0)
+        held[arrays.index] = arrays.action * quantity
+    return np.cumsum(cash) + np.cumsum(held) * close
 
 
 class Backtester:
@@ -46,3 +93,209 @@ class Backtester:
                 result.profit -= cost + fee if signal.action == "BUY" else -(cost - fee)
                 result.trades.append(Trade(signal=signal, pnl=result.profit))
         return result
+
+    def run_vectorized(
+        self,
+        data: pd.DataFrame,
+        strategy: BaseStrategy,
+        numeric: str = DECIMAL,
+        trades: bool = True,
+    ) -> BacktestResult:
+        """Run a backtest from whole-series signals in a single pass.
+
+        Indicators are computed once by ``strategy.generate_signals`` and the
+        fills are priced as NumPy arrays, producing the same trades as ``run``
+        without re-evaluating every prefix of ``data``.
+
+        ``numeric`` selects the accounting arithmetic: ``decimal`` matches
+        ``run`` exactly, ``float`` uses float64 throughout and ``fixed``
+        prices each cash flow in float64, rounds it to ``1 / FIXED_SCALE``
+        and sums int64 ticks. The running total adds no error of its own,
+        but each flow may be off by half a tick, so the gap to ``decimal``
+        can still grow with the number of trades; totals beyond
+        ``FIXED_MAX`` raise ``OverflowError``. Fast modes convert to
+        Decimal only for ``profit`` and, when ``trades`` is set, the
+        ``Trade`` records; ``arrays`` always holds the float64 series.
+        """
+        actions = np.asarray(strategy.generate_signals(data))
+        idx = np.flatnonzero(actions)
+        if not len(idx):
+            return BacktestResult()
+        buys = actions[idx] == ACTION_CODES["BUY"]
+        closes = data["close"].to_numpy()[idx]
+        pnl = self._pnl(closes, buys, strategy.position_size, numeric)
+        return self._result(idx, actions[idx], closes, pnl, strategy.position_size, numeric, trades)
+
+    def run_chunked(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        strategy: BaseStrategy,
+        numeric: str = DECIMAL,
+        trades: bool = True,
+    ) -> BacktestResult:
+        """``run_vectorized`` over history streamed as consecutive frames.
+
+        ``chunks`` may be any iterable of frames in time order, such as
+        ``pd.read_csv(path, chunksize=n)`` or ``HistoryStore.partitions``.
+        The last ``strategy.lookback`` rows of each chunk are carried into
+        the next one so rolling windows continue across the boundary. Only
+        the carried rows and the current chunk are held at once, plus the
+        fills. Cash flows are accumulated in the same order as a single
+        pass, so the result is identical to ``run_vectorized`` on the
+        concatenated data. ``TradeArrays.index`` counts rows from the start
+        of the stream. Raises ``StrategyError`` for strategies that do not
+        declare a ``lookback``.
+        """
+        try:
+            lookback = max(int(strategy.lookback), 0)
+        except NotImplementedError:
+            raise StrategyError(
+                f"{type(strategy).__name__} does not declare a lookback, so chunks cannot be joined"
+            ) from None
+        qty = strategy.position_size
+        carry: Optional[pd.DataFrame] = None
+        offset = 0
+        pnl_start = None
+        parts = []
+        for chunk in chunks:
+            if not len(chunk):
+                continue
+            chunk = chunk.reset_index(drop=True)
+            frame = chunk if carry is None else pd.concat([carry, chunk], ignore_index=True)
+            skip = len(frame) - len(chunk)
+            actions = np.asarray(strategy.generate_signals(frame))[skip:]
+            idx = np.flatnonzero(actions)
+            if len(idx):
+                buys = actions[idx] == ACTION_CODES["BUY"]
+                closes = chunk["close"].to_numpy()[idx]
+                pnl = self._pnl(closes, buys, qty, numeric, pnl_start)
+                pnl_start = pnl[-1]
+                parts.append((idx + offset, actions[idx], closes, pnl))
+            offset += len(chunk)
+            carry = frame.iloc[len(frame) - min(lookback, len(frame)) :].copy() if lookback else None
+        if not parts:
+            return BacktestResult()
+        idx, actions, closes, pnl = (np.concatenate(column) for column in zip(*parts))
+        return self._result(idx, actions, closes, pnl, qty, numeric, trades)
+
+    def run_many(
+        self,
+        data: pd.DataFrame,
+        strategies: Sequence[BaseStrategy],
+        numeric: str = DECIMAL,
+        trades: bool = True,
+        cache: Optional[IndicatorCache] = None,
+    ) -> MultiResult:
+        """Backtest several strategies over ``data`` in one pass.
+
+        Indicator calls from every strategy go through one
+        ``IndicatorCache``, so a series shared by several strategies, such
+        as a common moving-average window, is computed once. ``curves``
+        holds each strategy's equity per bar and ``equity`` their sum;
+        unlike ``profit`` these mark open positions at the close.
+        ``indicators`` reports the cache hits and misses.
+        """
+        names = [s.name for s in strategies]
+        if len(set(names)) != len(names):
+            raise ValueError("strategy names must be unique")
+        results: Dict[str, BacktestResult] = {}
+        with indicator_cache(cache) as shared:
+            for strategy in strategies:
+                results[strategy.name] = self.run_vectorized(data, strategy, numeric, trades)
+        close = data["close"].to_numpy(dtype=np.float64)
+        curves = pd.DataFrame(
+            {
+                s.name: equity_curve(results[s.name].arrays, close, float(s.position_size))
+                for s in strategies
+            },
+            index=data.index,
+        )
+        return MultiResult(
+            results=results,
+            curves=curves,
+            equity=curves.sum(axis=1).rename("equity"),
+            indicators=shared.stats(),
+        )
+
+    def _result(
+        self,
+        idx: np.ndarray,
+        actions: np.ndarray,
+        closes: np.ndarray,
+        pnl: np.ndarray,
+        qty: Decimal,
+        numeric: str,
+        trades: bool,
+    ) -> BacktestResult:
+        """Package cumulative fill PnL from ``_pnl`` as a ``BacktestResult``."""
+        result = BacktestResult()
+        buys = actions == ACTION_CODES["BUY"]
+        if numeric == FIXED:
+            totals = pnl.astype(object) / Decimal(FIXED_SCALE) if trades else None
+            result.profit = Decimal(int(pnl[-1])) / Decimal(FIXED_SCALE)
+            pnl = pnl / FIXED_SCALE
+        elif numeric == FLOAT:
+            totals = [Decimal(str(v)) for v in pnl] if trades else None
+            result.profit = Decimal(str(pnl[-1]))
+        else:
+            totals = pnl
+            result.profit = pnl[-1]
+            pnl = pnl.astype(np.float64)
+        result.arrays = TradeArrays(
+            index=idx,
+            action=actions.astype(np.int8),
+            price=closes.astype(np.float64),
+            pnl=pnl,
+            quantity=float(qty),
+        )
+        if trades:
+            for close, is_buy, total in zip(closes, buys, totals):
+                signal = create_signal("BUY" if is_buy else "SELL", Decimal(str(close)), qty)
+                result.trades.append(Trade(signal=signal, pnl=total))
+        return result
+
+    def _pnl(
+        self, closes: np.ndarray, buys: np.ndarray, qty: Decimal, numeric: str, start: object = None
+    ) -> np.ndarray:
+        """Cumulative PnL after each fill in the requested arithmetic.
+
+        ``start`` continues the running total of an earlier call, summing in
+        the same order as one call over all the fills.
+        """
+        if numeric == DECIMAL:
+            prices = np.array([Decimal(str(c)) for c in closes], dtype=object)
+            fills = prices * (1 + self.slippage)
+            cost = fills * qty
+            fee = cost * self.commission
+            cash = np.where(buys, -(cost + fee), cost - fee)
+        elif numeric in (FLOAT, FIXED):
+            cost = closes.astype(np.float64) * (1 + float(self.slippage)) * float(qty)
+            fee = cost * float(self.commission)
+            cash = np.where(buys, -(cost + fee), cost - fee)
+            if numeric == FIXED:
+                # Bounds every partial sum, so the int64 cumsum cannot wrap.
+                reach = float(np.abs(cash).sum()) + abs(int(start or 0)) / FIXED_SCALE
+                if reach >= FIXED_MAX:
+                    raise OverflowError(f"fixed-point PnL may exceed {FIXED_MAX}; use decimal or float")
+                cash = np.rint(cash * FIXED_SCALE).astype(np.int64)
+        else:
+            raise ValueError(f"unknown numeric mode {numeric}")
+        if start is None:
+            return np.cumsum(cash)
+        return np.cumsum(np.concatenate([np.array([start], dtype=cash.dtype), cash]))[1:]
+
+    def numeric_deviation(self, data: pd.DataFrame, strategy: BaseStrategy, numeric: str = FLOAT) -> Decimal:
+        """Largest absolute gap between ``numeric`` and Decimal cumulative PnL."""
+        actions = np.asarray(strategy.generate_signals(data))
+        idx = np.flatnonzero(actions)
+        if not len(idx):
+            return Decimal("0")
+        buys = actions[idx] == ACTION_CODES["BUY"]
+        closes = data["close"].to_numpy()[idx]
+        exact = self._pnl(closes, buys, strategy.position_size, DECIMAL)
+        fast = self._pnl(closes, buys, strategy.position_size, numeric)
+        if numeric == FIXED:
+            approx = [Decimal(int(v)) / Decimal(FIXED_SCALE) for v in fast]
+        else:
+            approx = [Decimal(float(v)) for v in fast]
+        return max(abs(a - e) for a, e in zip(approx, exact))
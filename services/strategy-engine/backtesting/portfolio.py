@@ -0,0 +1,232 @@
+"""Event-driven backtests over many symbols with shared position accounting."""
+from __future__ import annotations
+
+import importlib
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from services.pnl import PnLService
+from shared.positions import PositionStore
+
+from ..signals.models import Signal
+from ..strategies.base import BaseStrategy
+
+# A feed is a frame with ``timestamp`` and ``close`` columns, or any
+# time-ordered iterable of ``(timestamp, price)`` pairs.
+Feed = Union[pd.DataFrame, Iterable[Tuple[float, float]]]
+Event = Tuple[float, int, float]
+
+ZERO = Decimal("0")
+# Pairs per feed that ``merge_events`` reads at a time from iterable feeds.
+MERGE_CHUNK = 65536
+_EMPTY = np.empty(0)
+
+
+class PortfolioError(Exception):
+    """Raised when a portfolio backtest cannot be set up."""
+
+
+@dataclass
+class Fill:
+    """One simulated execution."""
+
+    signal: Signal
+    price: Decimal
+    fee: Decimal
+
+
+@dataclass
+class PortfolioResult:
+    """Fills, risk rejections and final positions of a portfolio run."""
+
+    fills: List[Fill] = field(default_factory=list)
+    rejected: List[Tuple[Signal, str]] = field(default_factory=list)
+    positions: PositionStore = field(default_factory=PositionStore)
+    fees: Decimal = ZERO
+    events: int = 0
+    risk: Any = None
+
+    @property
+    def realized(self) -> Decimal:
+        return sum((p.realized for p in self.positions.values()), ZERO)
+
+    @property
+    def unrealized(self) -> Decimal:
+        return sum((p.unrealized for p in self.positions.values()), ZERO)
+
+    @property
+    def profit(self) -> Decimal:
+        """Realized plus marked unrealized PnL, net of fees."""
+        return self.realized + self.unrealized - self.fees
+
+
+def merge_events(feeds: Mapping[str, Feed]) -> Iterator[Event]:
+    """Time-ordered ``(timestamp, symbol_index, price)`` across ``feeds``.
+
+    Ties go to the symbol listed first. Frames are merged with one stable
+    sort, which runs the k-way merge of the already sorted inputs in C.
+    Other feeds are read ``MERGE_CHUNK`` pairs at a time and sorted the
+    same way up to the earliest timestamp a feed may still deliver, so
+    generators and chunked readers are never materialized whole.
+    """
+    if all(isinstance(feed, pd.DataFrame) for feed in feeds.values()):
+        for symbol, frame in feeds.items():
+            missing = {"timestamp", "close"} - set(frame.columns)
+            if missing:
+                raise PortfolioError(f"{symbol} feed is missing {sorted(missing)}")
+        return _merge(
+            [f["timestamp"].to_numpy(dtype=np.float64) for f in feeds.values()],
+            [f["close"].to_numpy(dtype=np.float64) for f in feeds.values()],
+        )
+    return _merge_chunks([_chunks(feed) for feed in feeds.values()])
+
+
+def _merge(ts: List[np.ndarray], prices: List[np.ndarray]) -> Iterator[Event]:
+    ids = np.repeat(np.arange(len(ts)), [len(t) for t in ts])
+    stamps = np.concatenate(ts)
+    order = np.argsort(stamps, kind="stable")
+    return zip(stamps[order].tolist(), ids[order].tolist(), np.concatenate(prices)[order].tolist())
+
+
+def _chunks(feed: Feed) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    if isinstance(feed, pd.DataFrame):
+        yield feed["timestamp"].to_numpy(dtype=np.float64), feed["close"].to_numpy(dtype=np.float64)
+        return
+    pairs = iter(feed)
+    while True:
+        flat = np.fromiter(itertools.chain.from_iterable(itertools.islice(pairs, MERGE_CHUNK)), np.float64)
+        if not len(flat):
+            return
+        if len(flat) % 2:
+            raise PortfolioError("feeds must yield (timestamp, price) pairs")
+        yield flat[0::2], flat[1::2]
+
+
+def _merge_chunks(sources: List[Iterator[Tuple[np.ndarray, np.ndarray]]]) -> Iterator[Event]:
+    ts = [_EMPTY] * len(sources)
+    prices = [_EMPTY] * len(sources)
+    live = [True] * len(sources)
+    while True:
+        for i, source in enumerate(sources):
+            # Read past the first buffered timestamp so the horizon moves.
+            while live[i] and (not len(ts[i]) or ts[i][0] == ts[i][-1]):
+                chunk = next(source, None)
+                if chunk is None:
+                    live[i] = False
+                else:
+                    ts[i] = np.concatenate([ts[i], chunk[0]])
+                    prices[i] = np.concatenate([prices[i], chunk[1]])
+        # A live feed delivers nothing earlier than its last buffered event.
+        limits = [t[-1] for t, on in zip(ts, live) if on]
+        if not limits:
+            yield from _merge(ts, prices)
+            return
+        horizon = min(limits)
+        cuts = [int(np.searchsorted(t, horizon, side="left")) for t in ts]
+        yield from _merge([t[:c] for t, c in zip(ts, cuts)], [p[:c] for p, c in zip(prices, cuts)])
+        ts = [t[c:] for t, c in zip(ts, cuts)]
+        prices = [p[c:] for p, c in zip(prices, cuts)]
+
+
+class PortfolioBacktester:
+    """Replay many symbols through per-symbol strategy subscriptions.
+
+    Each bar is routed to the ``on_price`` of the strategies subscribed to
+    its symbol. Signals fill at the bar's close plus ``slippage`` and are
+    booked through a fresh ``PnLService`` per run, so positions, realized
+    and unrealized PnL follow the live accounting. Positions are marked
+    lazily, before each order and at the end, to keep bars that trade
+    nothing cheap.
+
+    With ``risk`` set every order first goes through a ``RiskManager``
+    configured from the environment like the live service, with its
+    velocity window on simulated time; breaches are recorded in
+    ``PortfolioResult.rejected`` instead of being filled.
+    """
+
+    def __init__(self, slippage: Decimal = ZERO, commission: Decimal = ZERO, risk: bool = False) -> None:
+        self.slippage = slippage
+        self.commission = commission
+        self.risk = risk
+        self._routes: Dict[str, List[Callable[[float], Optional[Signal]]]] = {}
+        self._now = 0.0
+
+    def clock(self) -> float:
+        """Timestamp of the event being replayed."""
+        return self._now
+
+    def subscribe(self, symbol: str, strategy: BaseStrategy) -> None:
+        """Feed ``symbol`` bars to ``strategy``; use one instance per symbol."""
+        self._routes.setdefault(symbol, []).append(strategy.on_price)
+
+    def run(self, feeds: Mapping[str, Feed]) -> PortfolioResult:
+        unknown = set(self._routes) - set(feeds)
+        if unknown:
+            raise PortfolioError(f"no feed for subscribed symbols {sorted(unknown)}")
+        symbols = list(feeds)
+        routes = [tuple(self._routes.get(symbol, ())) for symbol in symbols]
+        last = [0.0] * len(symbols)
+        book = PnLService()
+        risk = importlib.import_module("services.risk-manager") if self.risk else None
+        manager = risk.RiskManager(book, clock=self.clock) if risk else None
+        result = PortfolioResult(positions=book.positions, risk=manager)
+        marked: Dict[str, float] = {}
+        index = {symbol: i for i, symbol in enumerate(symbols)}
+        events = 0
+        for ts, sid, price in merge_events(feeds):
+            events += 1
+            last[sid] = price
+            for handler in routes[sid]:
+                signal = handler(price)
+                if signal is not None:
+                    self._now = ts
+                    self._mark(book, last, index, marked)
+                    self._order(signal, symbols[sid], ts, book, risk, manager, result)
+                    marked.pop(symbols[sid], None)
+        self._mark(book, last, index, marked)
+        result.events = events
+        return result
+
+    @staticmethod
+    def _mark(book: PnLService, last: List[float], index: Dict[str, int], marked: Dict[str, float]) -> None:
+        for symbol in book.positions:
+            price = last[index[symbol]]
+            if marked.get(symbol) != price and price > 0:
+                marked[symbol] = price
+                book.on_price(symbol, Decimal(str(price)))
+
+    def _order(
+        self,
+        signal: Signal,
+        symbol: str,
+        ts: float,
+        book: PnLService,
+        risk: Any,
+        manager: Any,
+        result: PortfolioResult,
+    ) -> None:
+        signal.symbol = symbol
+        signal.timestamp = datetime.fromtimestamp(ts, timezone.utc)
+        price = signal.price * (1 + self.slippage)
+        qty = signal.quantity if signal.action == "BUY" else -signal.quantity
+        if manager is not None:
+            order = risk.Order(symbol=symbol, quantity=qty, price=price, side=signal.action)
+            try:
+                reason = manager.check_order(order)
+            except risk.exceptions_mod.RiskError as exc:
+                reason = str(exc)
+            if reason:
+                result.rejected.append((signal, reason))
+                return
+            manager.record_fill(order)
+        else:
+            book.on_fill(symbol, qty, price)
+        fee = price * signal.quantity * self.commission
+        result.fees += fee
+        result.fills.append(Fill(signal=signal, price=price, fee=fee))
@@ -0,0 +1,159 @@
+"""Parallel parameter sweeps over the vectorized backtester."""
+from __future__ import annotations
+
+import itertools
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..indicators.cache import IndicatorCache, indicator_cache
+from ..strategies.loader import resolve_strategy
+from .analytics import analyze
+from .engine import Backtester
+
+Params = Dict[str, Any]
+
+# Per-process state set by ``_init_worker``.
+_data: Optional[pd.DataFrame] = None
+_shm: Optional[shared_memory.SharedMemory] = None
+_cache = IndicatorCache()
+
+
+class SweepError(Exception):
+    """Raised when a sweep cannot be set up."""
+
+
+def parameter_grid(grid: Mapping[str, Sequence[Any]]) -> List[Params]:
+    """Every combination of the values in ``grid``."""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def random_sample(grid: Mapping[str, Sequence[Any]], n: int, seed: Optional[int] = None) -> List[Params]:
+    """``n`` distinct combinations drawn uniformly from ``grid``.
+
+    Samples flat indices into the grid and decodes each one, so the cost
+    depends on ``n`` rather than on the size of the grid. Index ``i`` is
+    ``parameter_grid(grid)[i]``.
+    """
+    names = list(grid)
+    axes = [list(values) for values in grid.values()]
+    total = 1
+    for axis in axes:
+        total *= len(axis)
+    rng = random.Random(seed)
+    if total <= sys.maxsize:
+        picks = rng.sample(range(total), min(n, total))
+    else:
+        # Too many combinations for sample(); draw with rejection instead.
+        seen: set = set()
+        picks = []
+        while len(picks) < n:
+            flat = rng.randrange(total)
+            if flat not in seen:
+                seen.add(flat)
+                picks.append(flat)
+    return [_decode(names, axes, flat) for flat in picks]
+
+
+def _decode(names: List[str], axes: List[List[Any]], flat: int) -> Params:
+    # Mixed-radix digits, last axis fastest, like itertools.product.
+    params: Params = {}
+    for name, axis in zip(reversed(names), reversed(axes)):
+        flat, digit = divmod(flat, len(axis))
+        params[name] = axis[digit]
+    return {name: params[name] for name in names}
+
+
+def _share(data: pd.DataFrame) -> Tuple[shared_memory.SharedMemory, Tuple[str, ...], int]:
+    columns = tuple(c for c in data.columns if pd.api.types.is_numeric_dtype(data[c]))
+    values = data[list(columns)].to_numpy(dtype=np.float64).T
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+    return shm, columns, len(data)
+
+
+def _init_worker(name: str, columns: Tuple[str, ...], rows: int) -> None:
+    global _data, _shm
+    _shm = shared_memory.SharedMemory(name=name)
+    values = np.ndarray((len(columns), rows), dtype=np.float64, buffer=_shm.buf)
+    values.flags.writeable = False
+    _data = pd.DataFrame(values.T, columns=list(columns), copy=False)
+    _cache.clear()
+
+
+def _run_one(
+    path: str, params: Params, position_size: Decimal, slippage: Decimal, commission: Decimal
+) -> Tuple[Params, Decimal, int, Dict[str, float]]:
+    strat = resolve_strategy(path)("sweep", position_size, **params)
+    with indicator_cache(_cache):
+        result = Backtester(slippage, commission).run_vectorized(_data, strat)
+    perf = analyze(result, _data)
+    metrics = {"sharpe": perf.sharpe, "max_drawdown": perf.max_drawdown, "win_rate": perf.win_rate}
+    return params, result.profit, len(result.trades), metrics
+
+
+def _sort_key(params: Params) -> Tuple[str, ...]:
+    return tuple(f"{k}={params[k]!r}" for k in sorted(params))
+
+
+def run_sweep(
+    path: str,
+    data: pd.DataFrame,
+    combos: Sequence[Params],
+    position_size: Decimal = Decimal("1"),
+    slippage: Decimal = Decimal("0"),
+    commission: Decimal = Decimal("0"),
+    processes: Optional[int] = None,
+) -> pd.DataFrame:
+    """Backtest every parameter combination and rank them by profit.
+
+    ``data`` is copied once into shared memory and mapped by each worker;
+    indicator series are memoized per worker so combinations sharing a
+    window reuse it. Tasks are ordered by parameters so neighbouring
+    combinations tend to land on the same worker. Each row also carries
+    the Sharpe ratio, max drawdown and win rate from ``analyze``.
+    """
+    resolve_strategy(path)
+    if "close" not in data.columns:
+        raise SweepError("data needs a close column")
+    ordered = sorted(combos, key=_sort_key)
+    workers = max(1, min(processes or os.cpu_count() or 1, len(ordered) or 1))
+    chunk = max(1, len(ordered) // (workers * 4))
+    shm, columns, rows = _share(data)
+    try:
+        with ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(shm.name, columns, rows)
+        ) as pool:
+            results = list(
+                pool.map(
+                    _run_one,
+                    itertools.repeat(path),
+                    ordered,
+                    itertools.repeat(position_size),
+                    itertools.repeat(slippage),
+                    itertools.repeat(commission),
+                    chunksize=chunk,
+                )
+            )
+    finally:
+        shm.close()
+        shm.unlink()
+    table = pd.DataFrame(
+        [
+            {**params, "profit": profit, "trades": trades, **metrics}
+            for params, profit, trades, metrics in results
+        ]
+    )
+    if table.empty:
+        return table
+    table["profit"] = table["profit"].astype(object)
+    order = np.argsort([-float(p) for p in table["profit"]], kind="stable")
+    return table.iloc[order].reset_index(drop=True)
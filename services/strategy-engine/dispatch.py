@@ -0,0 +1,194 @@
+"""Concurrent strategy evaluation for the live market feed."""
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from shared.utils.logging_utils import get_logger
+
+from .signals.models import Signal
+from .strategies.base import BaseStrategy, StrategyError
+
+logger = get_logger(__name__)
+
+DROP_OLDEST = "drop-oldest"
+COALESCE = "coalesce"
+POLICIES = (DROP_OLDEST, COALESCE)
+
+
+class MarketQueue:
+    """Bounded hand-off between the pubsub reader and strategy evaluation.
+
+    When full, ``drop-oldest`` discards the oldest pending message while
+    ``coalesce`` keeps only the newest pending message per key (symbol).
+    """
+
+    def __init__(self, maxsize: int = 1000, policy: str = DROP_OLDEST) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"unknown queue policy {policy}")
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self._fifo: Deque[Any] = deque()
+        self._latest: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._fifo) + len(self._latest)
+
+    def put_nowait(self, item: Any, key: Optional[Hashable] = None) -> None:
+        """Enqueue without blocking the reader."""
+        if self.policy == COALESCE:
+            key = object() if key is None else key
+            if key in self._latest:
+                self.dropped += 1
+            elif len(self._latest) >= self.maxsize:
+                self._latest.popitem(last=False)
+                self.dropped += 1
+            self._latest[key] = item
+        else:
+            if len(self._fifo) >= self.maxsize:
+                self._fifo.popleft()
+                self.dropped += 1
+            self._fifo.append(item)
+        self._ready.set()
+
+    async def get(self) -> Any:
+        while not len(self):
+            self._ready.clear()
+            await self._ready.wait()
+        if self._latest:
+            return self._latest.popitem(last=False)[1]
+        return self._fifo.popleft()
+
+
+class StrategyDispatcher:
+    """Run strategies concurrently on a bounded executor with deadlines.
+
+    Each strategy has at most one call in flight: a strategy that is still
+    busy, including one whose call missed the deadline and was abandoned,
+    is skipped until that call returns. Python cannot stop a thread, so a
+    hung call keeps its executor thread; once every thread of the executor
+    is held by abandoned calls it is replaced with a fresh one, leaving at
+    most one stranded thread per hung strategy. Strategies that may hang
+    for good belong in the sandbox, whose worker is killed on timeout.
+    """
+
+    def __init__(self, max_workers: int = 8, deadline: float = 1.0) -> None:
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self.replaced = 0
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="strategy")
+        self._busy: Dict[int, "asyncio.Future[Any]"] = {}
+        self._stuck: Set["asyncio.Future[Any]"] = set()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def abandoned(self) -> int:
+        """Calls past their deadline still holding a thread of the executor."""
+        return len(self._stuck)
+
+    def _start(self, strat: BaseStrategy, data: Any) -> Optional["asyncio.Future[Any]"]:
+        key = id(strat)
+        if key in self._busy:
+            logger.debug("Strategy %s still busy, skipping", strat.name)
+            return None
+        loop = asyncio.get_running_loop()
+        call = loop.run_in_executor(self._executor, strat.generate_signal, data)
+        self._busy[key] = call
+        call.add_done_callback(lambda fut: self._finish(key, fut))
+        return call
+
+    def _finish(self, key: int, call: "asyncio.Future[Any]") -> None:
+        if self._busy.get(key) is call:
+            del self._busy[key]
+        self._stuck.discard(call)
+        if not call.cancelled():
+            call.exception()  # retrieved here if nobody awaited it
+
+    def _abandon(self, strat: BaseStrategy, call: "asyncio.Future[Any]") -> None:
+        logger.warning("Strategy %s missed its %.3fs deadline", strat.name, self.deadline)
+        self._stuck.add(call)
+        if len(self._stuck) >= self.max_workers:
+            logger.error("All %d strategy threads are hung, replacing the executor", self.max_workers)
+            # Calls still queued behind the hung ones are cancelled, which
+            # frees their strategies for the next message.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="strategy")
+            self._stuck.clear()
+            self.replaced += 1
+
+    async def _evaluate(self, strat: BaseStrategy, call: "asyncio.Future[Any]") -> Optional[Signal]:
+        try:
+            # Shielded so the call stays tracked until its thread returns.
+            return await asyncio.wait_for(asyncio.shield(call), self.deadline)
+        except asyncio.TimeoutError:
+            self._abandon(strat, call)
+        except StrategyError as exc:
+            logger.warning("Strategy %s failed: %s", strat.name, exc)
+        return None
+
+    async def run(self, strategies: Iterable[BaseStrategy], data: Any) -> AsyncIterator[Signal]:
+        """Yield signals in completion order."""
+        calls = [(strat, self._start(strat, data)) for strat in strategies]
+        pending = [self._evaluate(strat, call) for strat, call in calls if call is not None]
+        for done in asyncio.as_completed(pending):
+            signal = await done
+            if signal:
+                yield signal
+
+    def dispatch(
+        self,
+        strategies: Iterable[BaseStrategy],
+        data: Any,
+        sink: Callable[[Signal], Awaitable[None]],
+    ) -> int:
+        """Start every idle strategy on ``data`` without waiting for them.
+
+        ``data`` may also be a function of the strategy returning its input,
+        which is only built for strategies that start. Each signal is passed to ``sink`` as it completes, so the caller can
+        take the next message while slow strategies are still running.
+        Returns the number of strategies started.
+        """
+        started = 0
+        for strat in strategies:
+            if id(strat) in self._busy:
+                continue
+            call = self._start(strat, data(strat) if callable(data) else data)
+            if call is not None:
+                task = asyncio.create_task(self._deliver(strat, call, sink))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                started += 1
+        return started
+
+    async def _deliver(
+        self, strat: BaseStrategy, call: "asyncio.Future[Any]", sink: Callable[[Signal], Awaitable[None]]
+    ) -> None:
+        signal = await self._evaluate(strat, call)
+        if signal:
+            try:
+                await sink(signal)
+            except Exception:
+                logger.exception("Signal of strategy %s could not be delivered", strat.name)
+
+    def shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def from_env() -> Tuple[MarketQueue, StrategyDispatcher]:
+    """Build the queue and dispatcher from environment settings."""
+    queue = MarketQueue(
+        int(os.getenv("MARKET_QUEUE_SIZE", "1000")),
+        os.getenv("MARKET_QUEUE_POLICY", DROP_OLDEST),
+    )
+    dispatcher = StrategyDispatcher(
+        int(os.getenv("STRATEGY_WORKERS", "8")),
+        float(os.getenv("STRATEGY_DEADLINE", "1.0")),
+    )
+    return queue, dispatcher
@@ -1,13 +1,78 @@
 """Bollinger Bands indicator."""
 from __future__ import annotations
 
+import math
+from collections import deque
+from typing import Deque, Iterable, Tuple
+
+import numpy as np
 import pandas as pd
 
+from .cache import cached
+from .moving_average import RESYNC_INTERVAL, moving_average
+
 
 def bollinger_bands(series: pd.Series, window: int, num_std: float = 2.0) -> pd.DataFrame:
-    """Calculate Bollinger Bands."""
-    sma = series.rolling(window).mean()
-    std = series.rolling(window).std()
-    upper = sma + num_std * std
-    lower = sma - num_std * std
-    return pd.DataFrame({"upper": upper, "lower": lower})
+    """Calculate Bollinger Bands.
+
+    The middle band comes from ``cached(moving_average, ...)`` so it is
+    shared with any strategy using the same window. The bands are built
+    positionally and take ``series.index``, whatever index the cached
+    average carries.
+    """
+    sma = np.asarray(cached(moving_average, series, window), dtype=np.float64)
+    std = series.rolling(window).std().to_numpy(dtype=np.float64)
+    width = num_std * std
+    return pd.DataFrame({"upper": sma + width, "lower": sma - width}, index=series.index)
+
+
+class IncrementalBollingerBands:
+    """Bollinger Bands updated in O(1) per price.
+
+    Keeps a Welford-style rolling mean and sum of squared deviations so the
+    sample standard deviation matches ``bollinger_bands``.
+    """
+
+    def __init__(self, window: int, num_std: float = 2.0) -> None:
+        self.window = int(window)
+        self.num_std = float(num_std)
+        self._values: Deque[float] = deque(maxlen=self.window)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+        self.upper = math.nan
+        self.lower = math.nan
+
+    def bootstrap(self, history: Iterable[float]) -> Tuple[float, float]:
+        """Feed historical prices and return the latest bands."""
+        for price in history:
+            self.update(price)
+        return self.upper, self.lower
+
+    def update(self, price: float) -> Tuple[float, float]:
+        """Add one price and return the updated ``(upper, lower)`` bands."""
+        price = float(price)
+        if len(self._values) == self.window:
+            old = self._values[0]
+            self._values.append(price)
+            delta = price - old
+            old_mean = self._mean
+            self._mean += delta / self.window
+            self._m2 += delta * (price - self._mean + old - old_mean)
+        else:
+            self._values.append(price)
+            delta = price - self._mean
+            self._mean += delta / len(self._values)
+            self._m2 += delta * (price - self._mean)
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            self._mean = math.fsum(self._values) / len(self._values)
+            self._m2 = math.fsum((v - self._mean) ** 2 for v in self._values)
+        self._m2 = max(self._m2, 0.0)
+        if len(self._values) < self.window or self.window < 2:
+            self.upper = self.lower = math.nan
+        else:
+            std = math.sqrt(self._m2 / (self.window - 1))
+            self.upper = self._mean + self.num_std * std
+            self.lower = self._mean - self.num_std * std
+        return self.upper, self.lower
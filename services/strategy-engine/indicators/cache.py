@@ -0,0 +1,131 @@
+"""Memoized indicator computation."""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Frames built from shared history carry this attr so results computed on
+# different data versions are never shared, even if the values agree.
+VERSION_ATTR = "history_version"
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("INDICATOR_CACHE_ENTRIES", "1024"))
+DEFAULT_MAX_BYTES = int(os.getenv("INDICATOR_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+
+def _digest(values: np.ndarray) -> Tuple[str, bytes]:
+    if values.dtype.kind not in "biufcmM":
+        values = pd.util.hash_array(values)
+    return values.dtype.str, hashlib.sha1(np.ascontiguousarray(values), usedforsecurity=False).digest()
+
+
+def series_key(series: pd.Series) -> Tuple[Any, ...]:
+    """Fingerprint a series by version, length, index and a digest of its values.
+
+    Hashing the values costs one pass over the data, well below any
+    indicator it guards, and unlike a buffer address it cannot go stale when
+    a series is edited in place or its memory is reused. Results carry the
+    series index, so equal values under another index are another entry.
+    """
+    index = series.index
+    if isinstance(index, pd.RangeIndex):
+        index_key: Any = (index.start, index.stop, index.step)
+    else:
+        index_key = _digest(index.to_numpy())
+    return (series.attrs.get(VERSION_ATTR), len(series), index_key, *_digest(series.to_numpy()))
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return 0
+
+
+class IndicatorCache:
+    """LRU cache of indicator results bounded by entry count and bytes."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        value = compute()
+        size = _size(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self.bytes += size
+                self._evict()
+        return value
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_active: ContextVar[Optional[IndicatorCache]] = ContextVar("indicator_cache", default=None)
+
+
+def cached(func: Callable[..., Any], series: pd.Series, *params: Any) -> Any:
+    """Return ``func(series, *params)``, reusing results inside ``indicator_cache``."""
+    cache = _active.get()
+    if cache is None:
+        return func(series, *params)
+    key = (func.__module__, func.__qualname__, series_key(series), params)
+    return cache.get_or_compute(key, lambda: func(series, *params))
+
+
+@contextmanager
+def indicator_cache(cache: Optional[IndicatorCache] = None) -> Iterator[IndicatorCache]:
+    """Share indicator results computed on unchanged data within the block."""
+    cache = IndicatorCache() if cache is None else cache
+    token = _active.set(cache)
+    try:
+        yield cache
+    finally:
+        _active.reset(token)
@@ -1,9 +1,52 @@
 """Moving average indicator."""
 from __future__ import annotations
 
+import math
+from collections import deque
+from typing import Deque, Iterable
+
 from pandas import Series
 
+# Running sums are rebuilt from the window this often to stop float drift.
+RESYNC_INTERVAL = 4096
+
 
 def moving_average(series: Series, window: int) -> Series:
     """Calculate simple moving average."""
     return series.rolling(window=window).mean()
+
+
+class IncrementalMovingAverage:
+    """Simple moving average updated in O(1) per price.
+
+    Returns NaN until ``window`` prices have been seen, like ``moving_average``.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.window = int(window)
+        self._values: Deque[float] = deque(maxlen=self.window)
+        self._sum = 0.0
+        self._updates = 0
+        self.value = math.nan
+
+    def bootstrap(self, history: Iterable[float]) -> float:
+        """Feed historical prices and return the latest value."""
+        for price in history:
+            self.update(price)
+        return self.value
+
+    def update(self, price: float) -> float:
+        """Add one price and return the updated average."""
+        price = float(price)
+        if len(self._values) == self.window:
+            self._sum -= self._values[0]
+        self._values.append(price)
+        self._sum += price
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            self._sum = math.fsum(self._values)
+        if len(self._values) < self.window:
+            self.value = math.nan
+        else:
+            self.value = self._sum / self.window
+        return self.value
@@ -1,9 +1,15 @@
 """RSI indicator."""
 from __future__ import annotations
 
+import math
+from collections import deque
+from typing import Deque, Iterable, Optional
+
 import numpy as np
 import pandas as pd
 
+from .moving_average import RESYNC_INTERVAL
+
 
 def rsi(series: pd.Series, window: int) -> pd.Series:
     """Compute relative strength index."""
@@ -14,3 +20,64 @@ def rsi(series: pd.Series, window: int) -> pd.Series:
     avg_loss = pd.Series(loss).rolling(window).mean()
     rs = avg_gain / avg_loss
     return 100 - (100 / (1 + rs))
+
+
+class IncrementalRSI:
+    """Windowed RSI updated in O(1) per price.
+
+    Uses the same simple rolling means of gains and losses as ``rsi`` (not
+    Wilder smoothing), so values agree with the pandas version.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.window = int(window)
+        self._gains: Deque[float] = deque(maxlen=self.window)
+        self._losses: Deque[float] = deque(maxlen=self.window)
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._gain_count = 0
+        self._loss_count = 0
+        self._last: Optional[float] = None
+        self._updates = 0
+        self.value = math.nan
+
+    def bootstrap(self, history: Iterable[float]) -> float:
+        """Feed historical prices and return the latest value."""
+        for price in history:
+            self.update(price)
+        return self.value
+
+    def update(self, price: float) -> float:
+        """Add one price and return the updated RSI."""
+        price = float(price)
+        delta = 0.0 if self._last is None else price - self._last
+        self._last = price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if len(self._gains) == self.window:
+            old_gain, old_loss = self._gains[0], self._losses[0]
+            self._gain_sum -= old_gain
+            self._loss_sum -= old_loss
+            self._gain_count -= old_gain > 0
+            self._loss_count -= old_loss > 0
+        self._gains.append(gain)
+        self._losses.append(loss)
+        self._gain_sum += gain
+        self._loss_sum += loss
+        self._gain_count += gain > 0
+        self._loss_count += loss > 0
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            self._gain_sum = math.fsum(self._gains)
+            self._loss_sum = math.fsum(self._losses)
+        if len(self._gains) < self.window:
+            self.value = math.nan
+            return self.value
+        # Exact zeros keep the 0/0 and x/0 cases identical to pandas.
+        gain_sum = self._gain_sum if self._gain_count else 0.0
+        loss_sum = self._loss_sum if self._loss_count else 0.0
+        if loss_sum == 0:
+            self.value = 100.0 if gain_sum > 0 else math.nan
+        else:
+            self.value = 100 - (100 / (1 + gain_sum / loss_sum))
+        return self.value
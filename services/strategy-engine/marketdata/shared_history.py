@@ -0,0 +1,231 @@
+"""Shared-memory OHLCV history for sandboxed strategies."""
+from __future__ import annotations
+
+import mmap
+import os
+import secrets
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..indicators.cache import VERSION_ATTR
+
+COLUMNS: Tuple[str, ...] = ("timestamp", "open", "high", "low", "close", "volume")
+DEFAULT_CAPACITY = int(os.getenv("MARKET_HISTORY_CAPACITY", "100000"))
+# Segments a reader keeps mapped; the least recently used is unmapped.
+MAX_ATTACHED = 256
+# Where Linux exposes POSIX shared memory objects as files.
+_SHM_DIR = "/dev/shm"
+
+_HEADER = np.dtype(np.int64).itemsize * 2
+
+
+class HistoryError(Exception):
+    """Raised when shared history is missing or has been overwritten."""
+
+
+@dataclass(frozen=True)
+class HistoryRef:
+    """Constant-size handle to the latest ``length`` rows of one symbol."""
+
+    prefix: str
+    symbol_id: int
+    end: int
+    length: int
+    columns: Tuple[str, ...] = COLUMNS
+
+    @property
+    def name(self) -> str:
+        return f"{self.prefix}_{self.symbol_id}"
+
+
+class _ReadOnlySegment:
+    """Existing shared memory block mapped with ``PROT_READ``.
+
+    Writes through any view of it fault instead of reaching the owner's
+    data, and unlike ``SharedMemory`` it is not registered with the
+    resource tracker, which would unlink the owner's block at exit.
+    ``SharedMemory`` can only map read-write, so on Linux, where POSIX
+    shared memory objects are files under ``/dev/shm``, the file is opened
+    read-only and mapped with plain ``mmap``.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        fd = os.open(os.path.join(_SHM_DIR, name), os.O_RDONLY)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self._mmap)
+
+    def close(self) -> None:
+        self.buf.release()
+        self._mmap.close()
+
+
+def _attach(name: str) -> Any:
+    if os.path.isdir(_SHM_DIR):
+        return _ReadOnlySegment(name)
+    # Elsewhere the block is mapped read-write and reads are copied.
+    if sys.version_info >= (3, 13):  # pragma: no cover - platform dependent
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)  # pragma: no cover - platform dependent
+
+
+class RingBuffer:
+    """Fixed-capacity columnar ring buffer in one shared memory block.
+
+    Every row is written twice, at ``i % capacity`` and ``i % capacity +
+    capacity``, so the latest ``capacity`` rows are always one contiguous
+    slice and reads never copy. Readers (``create=False``) map the block
+    read-only; where that is not possible their reads are copies.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int = DEFAULT_CAPACITY,
+        columns: Sequence[str] = COLUMNS,
+        create: bool = True,
+    ) -> None:
+        self.columns = tuple(columns)
+        if create:
+            size = _HEADER + len(self.columns) * 2 * capacity * 8
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self._shm = _attach(name)
+        self._copy = not create and not isinstance(self._shm, _ReadOnlySegment)
+        self._header = np.ndarray((2,), dtype=np.int64, buffer=self._shm.buf)
+        if create:
+            self._header[:] = (capacity, 0)
+        self.capacity = int(self._header[0])
+        self._data = np.ndarray(
+            (len(self.columns), 2 * self.capacity),
+            dtype=np.float64,
+            buffer=self._shm.buf,
+            offset=_HEADER,
+        )
+        if not create:
+            self._data.setflags(write=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def count(self) -> int:
+        """Total rows ever appended."""
+        return int(self._header[1])
+
+    def append(self, row: Sequence[float]) -> None:
+        """Append one row ordered like ``columns``."""
+        count = int(self._header[1])
+        pos = count % self.capacity
+        self._data[:, pos] = row
+        self._data[:, pos + self.capacity] = row
+        self._header[1] = count + 1
+
+    def view(self, end: int, length: int) -> np.ndarray:
+        """Read-only ``(columns, length)`` view of the rows before ``end``."""
+        if length > self.capacity or length > end:
+            raise HistoryError("requested more rows than stored")
+        if self.count - end > self.capacity - length:
+            raise HistoryError("requested rows have been overwritten")
+        stop = end % self.capacity + self.capacity
+        out = self._data[:, stop - length : stop]
+        if self._copy:
+            return out.copy()
+        out.flags.writeable = False
+        return out
+
+    def frame(self, end: int, length: int) -> pd.DataFrame:
+        """Zero-copy DataFrame over ``view``, tagged with its data version."""
+        frame = pd.DataFrame(self.view(end, length).T, columns=list(self.columns), copy=False)
+        frame.attrs[VERSION_ATTR] = (self.name, end)
+        return frame
+
+    def close(self) -> None:
+        del self._header, self._data
+        try:
+            self._shm.close()
+        except BufferError:
+            # Frames still view the block; it is unmapped once they are freed.
+            pass
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+
+class SharedMarketData:
+    """Per-symbol ring buffers owned by the strategy engine process."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, columns: Sequence[str] = COLUMNS) -> None:
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self.prefix = f"af_{os.getpid()}_{secrets.token_hex(4)}"
+        self._ids: Dict[str, int] = {}
+        self._buffers: Dict[str, RingBuffer] = {}
+
+    def buffer(self, symbol: str) -> RingBuffer:
+        """Return the buffer for ``symbol``, creating it on first use."""
+        buf = self._buffers.get(symbol)
+        if buf is None:
+            sid = self._ids.setdefault(symbol, len(self._ids))
+            buf = RingBuffer(f"{self.prefix}_{sid}", self.capacity, self.columns)
+            self._buffers[symbol] = buf
+        return buf
+
+    def append(self, symbol: str, row: Sequence[float]) -> None:
+        self.buffer(symbol).append(row)
+
+    def ref(self, symbol: str, length: Optional[int] = None) -> HistoryRef:
+        """Handle to the latest ``length`` rows (all retained rows by default)."""
+        buf = self._buffers.get(symbol)
+        if buf is None:
+            raise HistoryError(f"no history for {symbol}")
+        end = buf.count
+        available = min(end, self.capacity)
+        length = min(length or available, available)
+        return HistoryRef(self.prefix, self._ids[symbol], end, length, self.columns)
+
+    def frame(self, symbol: str, length: Optional[int] = None) -> pd.DataFrame:
+        ref = self.ref(symbol, length)
+        return self._buffers[symbol].frame(ref.end, ref.length)
+
+    def close(self) -> None:
+        """Release and unlink every buffer."""
+        for buf in self._buffers.values():
+            buf.close()
+            buf.unlink()
+        self._buffers.clear()
+
+
+_attached: "OrderedDict[str, RingBuffer]" = OrderedDict()
+
+
+def resolve(ref: HistoryRef) -> pd.DataFrame:
+    """Map ``ref`` read-only in the calling process and return its rows."""
+    buf = _attached.get(ref.name)
+    if buf is None:
+        try:
+            buf = RingBuffer(ref.name, columns=ref.columns, create=False)
+        except FileNotFoundError as exc:
+            raise HistoryError(f"unknown history {ref.name}") from exc
+        _attached[ref.name] = buf
+        while len(_attached) > MAX_ATTACHED:
+            _attached.popitem(last=False)[1].close()
+    else:
+        _attached.move_to_end(ref.name)
+    return buf.frame(ref.end, ref.length)
+
+
+def detach() -> None:
+    """Unmap every segment ``resolve`` attached in this process."""
+    while _attached:
+        _attached.popitem()[1].close()
@@ -0,0 +1,164 @@
+"""On-disk columnar history partitioned by symbol and UTC day."""
+from __future__ import annotations
+
+import mmap
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+from .shared_history import COLUMNS
+
+DEFAULT_ROOT = os.getenv("MARKET_STORE_PATH", "data/history")
+DAY = 86400
+SUFFIX = ".f64"
+_EPOCH = date(1970, 1, 1)
+_ITEMSIZE = np.dtype(np.float64).itemsize
+
+
+class StoreError(Exception):
+    """Raised when history cannot be written to or read from the store."""
+
+
+def _day_name(day: int) -> str:
+    return (_EPOCH + timedelta(days=day)).isoformat()
+
+
+def _day_number(name: str) -> int:
+    return (date.fromisoformat(name) - _EPOCH).days
+
+
+class HistoryStore:
+    """Per-symbol, per-day partitions of float64 columns.
+
+    Each partition is one headerless file of native float64 values laid out
+    ``(columns, rows)`` and sorted by ``timestamp`` in epoch seconds; the
+    column names are recorded once in ``<root>/COLUMNS``. Reads memory-map
+    the files, so opening costs no resident memory until pages are touched
+    and slices within one day are zero-copy views.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_ROOT, columns: Sequence[str] = COLUMNS) -> None:
+        self.root = Path(root)
+        self.columns = tuple(columns)
+        if self.columns[0] != "timestamp":
+            raise StoreError("the first column must be timestamp")
+        meta = self.root / "COLUMNS"
+        if meta.exists():
+            stored = tuple(meta.read_text().split(","))
+            if stored != self.columns:
+                raise StoreError(f"store at {self.root} has columns {stored}")
+
+    def _dir(self, symbol: str) -> Path:
+        return self.root / quote(symbol, safe="")
+
+    def symbols(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(unquote(p.name) for p in self.root.iterdir() if p.is_dir())
+
+    def days(self, symbol: str) -> List[int]:
+        """Day numbers since the epoch that have a partition, in order."""
+        path = self._dir(symbol)
+        if not path.exists():
+            return []
+        return sorted(_day_number(p.stem) for p in path.glob(f"*{SUFFIX}"))
+
+    def _open(self, symbol: str, day: int) -> np.ndarray:
+        path = self._dir(symbol) / f"{_day_name(day)}{SUFFIX}"
+        with open(path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size % (len(self.columns) * _ITEMSIZE):
+                raise StoreError(f"{path} does not hold {len(self.columns)} float64 columns")
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(buf, dtype=np.float64).reshape(len(self.columns), -1)
+
+    def open(
+        self, symbol: str, start: Optional[float] = None, end: Optional[float] = None
+    ) -> List[np.ndarray]:
+        """Read-only ``(columns, rows)`` views of each day's rows in ``[start, end)``.
+
+        Only the timestamp pages needed to find the bounds are read.
+        """
+        first = None if start is None else int(start // DAY)
+        last = None if end is None else int(end // DAY)
+        views = []
+        for day in self.days(symbol):
+            if (first is not None and day < first) or (last is not None and day > last):
+                continue
+            values = self._open(symbol, day)
+            lo, hi = self._bounds(values[0], start, end)
+            if hi > lo:
+                views.append(values[:, lo:hi])
+        return views
+
+    def write(self, symbol: str, data: pd.DataFrame) -> None:
+        """Merge rows into their day partitions, keeping each sorted by time.
+
+        Rows are unique per timestamp: a rewritten timestamp replaces the
+        stored row, and within ``data`` the last row for it wins.
+        """
+        missing = [c for c in self.columns if c not in data.columns]
+        if missing:
+            raise StoreError(f"missing columns {missing}")
+        values = data[list(self.columns)].to_numpy(dtype=np.float64).T
+        days = np.floor(values[0] / DAY).astype(np.int64)
+        path = self._dir(symbol)
+        path.mkdir(parents=True, exist_ok=True)
+        meta = self.root / "COLUMNS"
+        if not meta.exists():
+            meta.write_text(",".join(self.columns))
+        existing = set(self.days(symbol))
+        for day in np.unique(days).tolist():
+            part = values[:, days == day]
+            if day in existing:
+                part = np.concatenate([np.asarray(self._open(symbol, day)), part], axis=1)
+            part = part[:, np.argsort(part[0], kind="stable")]
+            # The stable sort keeps rows in write order within a timestamp.
+            part = part[:, np.append(part[0, 1:] != part[0, :-1], True)]
+            target = path / f"{_day_name(day)}{SUFFIX}"
+            tmp = target.with_suffix(".tmp")
+            np.ascontiguousarray(part).tofile(tmp)
+            os.replace(tmp, target)
+
+    def partitions(
+        self, symbol: str, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Zero-copy frames over ``open``, one per day."""
+        for values in self.open(symbol, start, end):
+            yield pd.DataFrame(values.T, columns=list(self.columns), copy=False)
+
+    @staticmethod
+    def _bounds(ts: np.ndarray, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        lo = 0 if start is None else int(np.searchsorted(ts, start, side="left"))
+        hi = len(ts) if end is None else int(np.searchsorted(ts, end, side="left"))
+        return lo, hi
+
+    def read(self, symbol: str, start: Optional[float] = None, end: Optional[float] = None) -> pd.DataFrame:
+        """Rows in ``[start, end)``; a view when they fall in one partition."""
+        parts = list(self.partitions(symbol, start, end))
+        if not parts:
+            return pd.DataFrame({c: np.empty(0) for c in self.columns})
+        if len(parts) == 1:
+            return parts[0]
+        return pd.concat(parts, ignore_index=True)
+
+    def tail(self, symbol: str, rows: int) -> pd.DataFrame:
+        """The latest ``rows`` rows, e.g. to warm up live indicators."""
+        parts: List[np.ndarray] = []
+        needed = rows
+        for day in reversed(self.days(symbol)):
+            if needed <= 0:
+                break
+            values = self._open(symbol, day)
+            take = min(needed, values.shape[1])
+            parts.append(values[:, values.shape[1] - take :])
+            needed -= take
+        if not parts:
+            return pd.DataFrame({c: np.empty(0) for c in self.columns})
+        values = parts[0] if len(parts) == 1 else np.concatenate(parts[::-1], axis=1)
+        return pd.DataFrame(values.T, columns=list(self.columns), copy=False)
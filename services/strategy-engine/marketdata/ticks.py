@@ -0,0 +1,82 @@
+"""Market tick decoding and per-symbol rolling windows."""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+import pandas as pd
+
+from .shared_history import DEFAULT_CAPACITY, HistoryRef, SharedMarketData
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads
+
+# Strategies read ``close``; for ticks that is the last traded price.
+TICK_COLUMNS: Tuple[str, ...] = ("timestamp", "bid", "ask", "close")
+
+Tick = Tuple[str, float, float, float, float]
+
+
+class TickDecodeError(Exception):
+    """Raised when a market message is not a valid tick."""
+
+
+def _epoch(value: str) -> float:
+    ts = datetime.fromisoformat(value)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def decode_tick(raw: Any) -> Tick:
+    """Decode a ``market_tick.json`` payload into ``(symbol, ts, bid, ask, last)``."""
+    try:
+        msg = _loads(raw)
+        symbol = msg["symbol"]
+        if not isinstance(symbol, str):
+            raise TypeError("symbol must be a string")
+        return (
+            symbol,
+            _epoch(msg["timestamp"]),
+            float(msg["bid"]),
+            float(msg["ask"]),
+            float(msg["last"]),
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise TickDecodeError("invalid tick") from exc
+
+
+class TickIngestor:
+    """Decode ticks straight into preallocated per-symbol columns."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.history = SharedMarketData(capacity, TICK_COLUMNS)
+        self.received = 0
+        self.malformed = 0
+
+    def ingest(self, raw: Any) -> Optional[str]:
+        """Append one message; return its symbol or None if malformed."""
+        self.received += 1
+        try:
+            symbol, *row = decode_tick(raw)
+        except TickDecodeError:
+            self.malformed += 1
+            return None
+        self.history.append(symbol, row)
+        return symbol
+
+    def frame(self, symbol: str, length: Optional[int] = None) -> pd.DataFrame:
+        """Zero-copy DataFrame view of the latest ticks."""
+        return self.history.frame(symbol, length)
+
+    def ref(self, symbol: str, length: Optional[int] = None) -> HistoryRef:
+        """Shared-memory handle for sandboxed strategies."""
+        return self.history.ref(symbol, length)
+
+    def close(self) -> None:
+        self.history.close()
@@ -7,6 +7,6 @@ from datetime import datetime
 from .models import Signal
 
 
-def create_signal(action: str, price: Decimal, qty: Decimal) -> Signal:
+def create_signal(action: str, price: Decimal, qty: Decimal, symbol: str = "") -> Signal:
     """Create a trading signal object."""
-    return Signal(timestamp=datetime.utcnow(), action=action, price=price, quantity=qty)
+    return Signal(timestamp=datetime.utcnow(), action=action, price=price, quantity=qty, symbol=symbol)
@@ -2,6 +2,10 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from datetime import datetime
+from typing import Dict
+
+# Integer action codes used by vectorized signal arrays (0 means no signal).
+ACTION_CODES: Dict[str, int] = {"BUY": 1, "SELL": -1}
 
 
 @dataclass
@@ -12,3 +16,4 @@ class Signal:
     action: str
     price: Decimal
     quantity: Decimal
+    symbol: str = ""
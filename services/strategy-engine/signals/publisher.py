@@ -0,0 +1,206 @@
+"""Batched signal publishing to Redis."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+import backoff
+import redis.asyncio as aioredis
+
+from shared.utils.logging_utils import get_logger
+
+from .models import Signal
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+
+    def _dumps(obj: Dict[str, str]) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+
+    def _dumps(obj: Dict[str, str]) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+
+def encode_signal(signal: Signal) -> bytes:
+    """Serialize a signal with Decimals and timestamps as exact strings."""
+    return _dumps(
+        {
+            "action": signal.action,
+            "price": str(signal.price),
+            "quantity": str(signal.quantity),
+            "timestamp": signal.timestamp.isoformat(),
+            "symbol": signal.symbol,
+        }
+    )
+
+
+def decode_signal(raw: Any) -> Signal:
+    """Inverse of ``encode_signal``."""
+    data = _loads(raw)
+    return Signal(
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        action=data["action"],
+        price=Decimal(data["price"]),
+        quantity=Decimal(data["quantity"]),
+        symbol=data.get("symbol", ""),
+    )
+
+
+@dataclass
+class PublisherMetrics:
+    """Flush counters for monitoring."""
+
+    flushes: int = 0
+    signals: int = 0
+    failures: int = 0
+    dropped: int = 0
+    last_flush_size: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    total_flush_latency: float = 0.0
+
+    @property
+    def mean_flush_size(self) -> float:
+        return self.signals / self.flushes if self.flushes else 0.0
+
+    @property
+    def mean_flush_latency(self) -> float:
+        return self.total_flush_latency / self.flushes if self.flushes else 0.0
+
+
+class SignalPublisher:
+    """Buffer signals and flush them through one Redis pipeline.
+
+    A flush happens once ``max_batch`` signals are buffered or ``max_delay``
+    seconds after the background flusher last ran. With ``stream`` set the
+    signals are appended with XADD (trimmed to about ``maxlen`` entries)
+    instead of PUBLISH.
+
+    A batch that still fails after the retries goes back to the front of
+    the buffer and the background flusher keeps retrying it, so an outage
+    delays signals instead of losing them. At most ``max_pending`` signals
+    are held; beyond that the oldest are dropped and counted in
+    ``metrics.dropped``.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        channel: str = "signals",
+        max_batch: int = 100,
+        max_delay: float = 0.01,
+        stream: Optional[str] = None,
+        maxlen: int = 10000,
+        max_pending: int = 100000,
+    ) -> None:
+        self.redis = redis
+        self.channel = channel
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.stream = stream
+        self.maxlen = maxlen
+        self.max_pending = max_pending
+        self.metrics = PublisherMetrics()
+        self._buffer: List[bytes] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._failing = False
+
+    @classmethod
+    def from_env(cls, redis: aioredis.Redis) -> "SignalPublisher":
+        return cls(
+            redis,
+            max_batch=int(os.getenv("SIGNAL_BATCH_SIZE", "100")),
+            max_delay=float(os.getenv("SIGNAL_FLUSH_INTERVAL", "0.01")),
+            stream=os.getenv("SIGNAL_STREAM") or None,
+            maxlen=int(os.getenv("SIGNAL_STREAM_MAXLEN", "10000")),
+            max_pending=int(os.getenv("SIGNAL_MAX_PENDING", "100000")),
+        )
+
+    def start(self) -> None:
+        """Start the time-based background flusher."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the flusher and send anything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def publish(self, signal: Signal) -> None:
+        if self._task is not None and self._task.done():
+            self._task.result()
+        self._buffer.append(encode_signal(signal))
+        if len(self._buffer) >= self.max_batch:
+            if self._failing and self._task is not None:
+                # The flusher is retrying; keep publishers off the backoff.
+                self._trim()
+                return
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            start = time.perf_counter()
+            try:
+                await self._execute(batch)
+            except aioredis.RedisError:
+                self._buffer[:0] = batch
+                self._trim()
+                self._failing = True
+                self.metrics.failures += 1
+                raise
+            self._failing = False
+            latency = time.perf_counter() - start
+        m = self.metrics
+        m.flushes += 1
+        m.signals += len(batch)
+        m.last_flush_size = len(batch)
+        m.last_flush_latency = latency
+        m.max_flush_latency = max(m.max_flush_latency, latency)
+        m.total_flush_latency += latency
+
+    def _trim(self) -> None:
+        excess = len(self._buffer) - self.max_pending
+        if excess > 0:
+            del self._buffer[:excess]
+            self.metrics.dropped += excess
+
+    @backoff.on_exception(backoff.expo, aioredis.RedisError, max_tries=3)
+    async def _execute(self, batch: List[bytes]) -> None:
+        pipe = self.redis.pipeline(transaction=False)
+        for payload in batch:
+            if self.stream:
+                pipe.xadd(self.stream, {"signal": payload}, maxlen=self.maxlen, approximate=True)
+            else:
+                pipe.publish(self.channel, payload)
+        await pipe.execute()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.max_delay)
+            try:
+                await self.flush()
+            except aioredis.RedisError as exc:
+                logger.warning("Signal flush failed, %d signals pending: %s", len(self._buffer), exc)
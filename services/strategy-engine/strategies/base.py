@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from ..signals.models import Signal
@@ -24,3 +25,29 @@ class BaseStrategy:
     def generate_signal(self, data: pd.DataFrame) -> Optional[Signal]:
         """Return trading signal."""
         raise NotImplementedError
+
+    @property
+    def lookback(self) -> int:
+        """Bars before ``i`` that ``generate_signals`` reads to decide bar ``i``."""
+        raise NotImplementedError
+
+    def on_price(self, price: float) -> Optional[Signal]:
+        """Consume one new close in live mode and return any signal.
+
+        Equivalent to ``generate_signal`` on the history seen so far, but
+        backed by incremental indicators so each call is O(1).
+        """
+        raise NotImplementedError
+
+    def warm_up(self, data: pd.DataFrame) -> None:
+        """Prime streaming indicator state from historical closes."""
+        for price in data["close"]:
+            self.on_price(price)
+
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
+        """Return an action code per bar for the whole history.
+
+        Element ``i`` must equal the signal ``generate_signal`` would emit for
+        ``data.iloc[: i + 1]``, encoded with ``ACTION_CODES`` (0 for none).
+        """
+        raise NotImplementedError
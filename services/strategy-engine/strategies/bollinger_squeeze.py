@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from decimal import Decimal
+import math
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from ..indicators.bollinger import bollinger_bands
+from ..indicators.bollinger import IncrementalBollingerBands, bollinger_bands
+from ..indicators.cache import cached
 from ..signals.generator import create_signal
-from ..signals.models import Signal
+from ..signals.models import ACTION_CODES, Signal
 from .base import BaseStrategy, StrategyError
 
 
@@ -22,11 +25,16 @@ class BollingerSqueeze(BaseStrategy):
         super().__init__(name=name, position_size=position_size)
         self.window = window
         self.threshold = threshold
+        self._stream_bands = IncrementalBollingerBands(window)
+
+    @property
+    def lookback(self) -> int:
+        return max(self.window - 1, 0)
 
     def generate_signal(self, data: pd.DataFrame) -> Optional[Signal]:
         """Signal on band squeeze breakout."""
         try:
-            bands = bollinger_bands(data["close"], self.window)
+            bands = cached(bollinger_bands, data["close"], self.window)
         except Exception as exc:  # pragma: no cover
             raise StrategyError(str(exc)) from exc
         if bands.empty:
@@ -40,3 +48,30 @@ class BollingerSqueeze(BaseStrategy):
         if breakout_down:
             return create_signal("SELL", price, self.position_size)
         return None
+
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
+        """Vectorized squeeze breakout signals over the full history."""
+        try:
+            bands = cached(bollinger_bands, data["close"], self.window)
+        except Exception as exc:  # pragma: no cover
+            raise StrategyError(str(exc)) from exc
+        width = ((bands["upper"] - bands["lower"]) / bands["upper"]).to_numpy()
+        close = data["close"].to_numpy()
+        upper = bands["upper"].to_numpy()
+        lower = bands["lower"].to_numpy()
+        wide = width > self.threshold
+        actions = np.zeros(len(data), dtype=np.int8)
+        breakout_up = wide & (close > upper)
+        actions[breakout_up] = ACTION_CODES["BUY"]
+        actions[~breakout_up & wide & (close < lower)] = ACTION_CODES["SELL"]
+        return actions
+
+    def on_price(self, price: float) -> Optional[Signal]:
+        """Streaming squeeze breakout check on one new close."""
+        upper, lower = self._stream_bands.update(price)
+        width = (upper - lower) / upper if upper else math.nan
+        if width > self.threshold and price > upper:
+            return create_signal("BUY", Decimal(str(price)), self.position_size)
+        if width > self.threshold and price < lower:
+            return create_signal("SELL", Decimal(str(price)), self.position_size)
+        return None
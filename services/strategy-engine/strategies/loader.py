@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import importlib
-import logging
-import multiprocessing as mp
 import os
 import re
+import time
 from decimal import Decimal
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Tuple, Type
 
+import pandas as pd
+
+from ..marketdata.shared_history import HistoryRef
 from .base import BaseStrategy, StrategyError
+from .sandbox import SandboxPool, get_pool
 from shared.utils.logging_utils import get_logger
 
 _PATH_RE = re.compile(r"^[a-zA-Z0-9_.-]+$")
@@ -39,45 +42,101 @@ def _sanitize_params(params: Dict[str, str]) -> Dict[str, Any]:
         if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", key):
             continue
         try:
-            sanitized[key] = Decimal(val)
+            sanitized[key] = int(val) if re.fullmatch(r"-?\d+", val) else Decimal(val)
         except Exception:
             sanitized[key] = val
     return sanitized
 
 
 class SandboxedStrategy(BaseStrategy):
-    """Wrapper that runs strategy in a separate process."""
-
-    def __init__(self, strategy: BaseStrategy, timeout: float = 1.0) -> None:
+    """Wrapper that runs strategy in a persistent sandbox worker process.
+
+    The strategy instance stays resident in the worker; repeated calls with a
+    growing DataFrame only ship the rows appended since the previous call, and
+    a ``HistoryRef`` into shared memory ships no rows at all. Strategies of
+    different ``owner``s run in different worker processes.
+    """
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        timeout: float = 1.0,
+        pool: Optional[SandboxPool] = None,
+        owner: str = "",
+    ) -> None:
         super().__init__(name=strategy.name, position_size=strategy.position_size)
         self._strategy = strategy
         self._timeout = timeout
+        self._pool = pool or get_pool()
+        self._worker, self._sid = self._pool.register(strategy, owner)
+        self._sent: Optional[Tuple[int, int, Any, Any]] = None
+        self.last_latency: Optional[float] = None
+
+    @property
+    def lookback(self) -> int:
+        return self._strategy.lookback
 
     def generate_signal(self, data: Any) -> Any:
-        def _run(q: mp.Queue, df: Any) -> None:
+        return self._call(None, data)
+
+    def generate_signals(self, data: Any) -> Any:
+        return self._call("generate_signals", data)
+
+    def on_price(self, price: float) -> Any:
+        return self._call("on_price", price)
+
+    def warm_up(self, data: Any) -> None:
+        self._call("warm_up", data)
+
+    def close(self) -> None:
+        """Release the strategy from its sandbox worker."""
+        self._pool.unregister(self._worker, self._sid)
+
+    def _delta(self, data: Any) -> Tuple[str, Any]:
+        """Pick the rows the worker has not seen yet."""
+        if isinstance(data, HistoryRef):
+            return "generate_signal", data
+        if self._sent is not None and isinstance(data, pd.DataFrame) and not data.empty:
+            generation, length, first, last = self._sent
+            if (
+                generation == self._worker.generation
+                and length <= len(data)
+                and _row_key(data, 0) == first
+                and _row_key(data, length - 1) == last
+            ):
+                return "append", data.iloc[length:]
+        return "full", data
+
+    def _fingerprint(self, data: Any) -> Optional[Tuple[int, int, Any, Any]]:
+        if not isinstance(data, pd.DataFrame) or data.empty:
+            return None
+        return self._worker.generation, len(data), _row_key(data, 0), _row_key(data, len(data) - 1)
+
+    def _call(self, method: Optional[str], data: Any) -> Any:
+        start = time.perf_counter()
+        with self._worker.lock:
+            if method is None:
+                op, payload = self._delta(data)
+            else:
+                op, payload = method, data
             try:
-                q.put(self._strategy.generate_signal(df))
-            except Exception as exc:  # pragma: no cover - pass exception
-                q.put(exc)
-
-        q: mp.Queue = mp.Queue()
-        proc = mp.Process(target=_run, args=(q, data))
-        proc.start()
-        proc.join(self._timeout)
-        if proc.is_alive():
-            proc.terminate()
-            proc.join()
-            raise StrategyError("Execution timed out")
-        result = q.get()
-        if isinstance(result, Exception):
-            raise StrategyError(str(result))
+                result = self._worker.request(op, self._sid, payload, self._timeout)
+            except StrategyError:
+                self._sent = None
+                raise
+            if method is None:
+                self._sent = self._fingerprint(data)
+        self.last_latency = time.perf_counter() - start
+        logger.debug("Strategy %s call took %.3f ms", self.name, self.last_latency * 1000)
         return result
 
 
-def load_strategy(
-    path: str, name: str, position_size: Decimal, timeout: float = 1.0, **params: str
-) -> BaseStrategy:
-    """Securely load a whitelisted strategy."""
+def _row_key(data: pd.DataFrame, pos: int) -> Any:
+    return data.index[pos], tuple(data.iloc[pos])
+
+
+def resolve_strategy(path: str) -> Type[BaseStrategy]:
+    """Return the whitelisted strategy class at ``path``."""
     if not _PATH_RE.fullmatch(path):
         logger.warning("Rejected invalid path: %s", path)
         raise LoaderError("Invalid path")
@@ -90,8 +149,16 @@ def load_strategy(
         cls: Type[BaseStrategy] = getattr(module, class_name)
     except (ImportError, AttributeError) as exc:
         raise LoaderError(str(exc)) from exc
-    if not issubclass(cls, BaseStrategy):
+    if not isinstance(cls, type) or not issubclass(cls, BaseStrategy):
         raise LoaderError("Invalid strategy type")
+    return cls
+
+
+def load_strategy(
+    path: str, name: str, position_size: Decimal, timeout: float = 1.0, owner: str = "", **params: str
+) -> BaseStrategy:
+    """Securely load a whitelisted strategy into ``owner``'s sandbox workers."""
+    cls = resolve_strategy(path)
     strat = cls(name, position_size, **_sanitize_params(params))
     logger.info("Loaded strategy %s", path)
-    return SandboxedStrategy(strat, timeout)
+    return SandboxedStrategy(strat, timeout, owner=owner)
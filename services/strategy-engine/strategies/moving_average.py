@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Optional
+import math
+from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from ..indicators.moving_average import moving_average
+from ..indicators.moving_average import IncrementalMovingAverage, moving_average
+from ..indicators.cache import cached
 from ..signals.generator import create_signal
-from ..signals.models import Signal
+from ..signals.models import ACTION_CODES, Signal
 from .base import BaseStrategy, StrategyError
 
 
@@ -22,12 +25,21 @@ class MovingAverageCrossover(BaseStrategy):
         super().__init__(name=name, position_size=position_size)
         self.short_window = short_window
         self.long_window = long_window
+        self._stream_short = IncrementalMovingAverage(short_window)
+        self._stream_long = IncrementalMovingAverage(long_window)
+        self._stream_prev: Tuple[float, float] = (math.nan, math.nan)
+        self._stream_count = 0
+
+    @property
+    def lookback(self) -> int:
+        """The previous bar's averages need ``long_window`` earlier closes."""
+        return max(self.short_window, self.long_window, 0)
 
     def generate_signal(self, data: pd.DataFrame) -> Optional[Signal]:
         """Generate signal based on MA crossover."""
         try:
-            ma_short = moving_average(data["close"], self.short_window)
-            ma_long = moving_average(data["close"], self.long_window)
+            ma_short = cached(moving_average, data["close"], self.short_window)
+            ma_long = cached(moving_average, data["close"], self.long_window)
         except Exception as exc:  # pragma: no cover - panda errors
             raise StrategyError(str(exc)) from exc
         if len(ma_short) < 2 or len(ma_long) < 2:
@@ -40,3 +52,34 @@ class MovingAverageCrossover(BaseStrategy):
         if cross_down:
             return create_signal("SELL", price, self.position_size)
         return None
+
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
+        """Vectorized crossover signals over the full history."""
+        try:
+            ma_short = cached(moving_average, data["close"], self.short_window).to_numpy()
+            ma_long = cached(moving_average, data["close"], self.long_window).to_numpy()
+        except Exception as exc:  # pragma: no cover - panda errors
+            raise StrategyError(str(exc)) from exc
+        actions = np.zeros(len(data), dtype=np.int8)
+        if len(actions) < 2:
+            return actions
+        cross_up = (ma_short[:-1] < ma_long[:-1]) & (ma_short[1:] > ma_long[1:])
+        cross_down = (ma_short[:-1] > ma_long[:-1]) & (ma_short[1:] < ma_long[1:])
+        actions[1:][cross_up] = ACTION_CODES["BUY"]
+        actions[1:][cross_down] = ACTION_CODES["SELL"]
+        return actions
+
+    def on_price(self, price: float) -> Optional[Signal]:
+        """Streaming crossover check on one new close."""
+        ma_short = self._stream_short.update(price)
+        ma_long = self._stream_long.update(price)
+        prev_short, prev_long = self._stream_prev
+        self._stream_prev = (ma_short, ma_long)
+        self._stream_count += 1
+        if self._stream_count < 2:
+            return None
+        if prev_short < prev_long and ma_short > ma_long:
+            return create_signal("BUY", Decimal(str(price)), self.position_size)
+        if prev_short > prev_long and ma_short < ma_long:
+            return create_signal("SELL", Decimal(str(price)), self.position_size)
+        return None
@@ -4,11 +4,13 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from ..indicators.rsi import rsi
+from ..indicators.rsi import IncrementalRSI, rsi
+from ..indicators.cache import cached
 from ..signals.generator import create_signal
-from ..signals.models import Signal
+from ..signals.models import ACTION_CODES, Signal
 from .base import BaseStrategy, StrategyError
 
 
@@ -24,11 +26,17 @@ class RSIMeanReversion(BaseStrategy):
         self.window = window
         self.lower = lower
         self.upper = upper
+        self._stream_rsi = IncrementalRSI(window)
+
+    @property
+    def lookback(self) -> int:
+        """One extra close for the first price change."""
+        return max(self.window, 0)
 
     def generate_signal(self, data: pd.DataFrame) -> Optional[Signal]:
         """Generate signals based on RSI levels."""
         try:
-            rsi_vals = rsi(data["close"], self.window)
+            rsi_vals = cached(rsi, data["close"], self.window)
         except Exception as exc:  # pragma: no cover
             raise StrategyError(str(exc)) from exc
         if rsi_vals.empty:
@@ -40,3 +48,24 @@ class RSIMeanReversion(BaseStrategy):
         if current_rsi > self.upper:
             return create_signal("SELL", price, self.position_size)
         return None
+
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
+        """Vectorized RSI signals over the full history."""
+        try:
+            rsi_vals = cached(rsi, data["close"], self.window).to_numpy()
+        except Exception as exc:  # pragma: no cover
+            raise StrategyError(str(exc)) from exc
+        actions = np.zeros(len(data), dtype=np.int8)
+        buy = rsi_vals < self.lower
+        actions[buy] = ACTION_CODES["BUY"]
+        actions[~buy & (rsi_vals > self.upper)] = ACTION_CODES["SELL"]
+        return actions
+
+    def on_price(self, price: float) -> Optional[Signal]:
+        """Streaming RSI check on one new close."""
+        current_rsi = self._stream_rsi.update(price)
+        if current_rsi < self.lower:
+            return create_signal("BUY", Decimal(str(price)), self.position_size)
+        if current_rsi > self.upper:
+            return create_signal("SELL", Decimal(str(price)), self.position_size)
+        return None
@@ -0,0 +1,223 @@
+"""Persistent sandbox worker pool for strategy execution.
+
+Workers are keyed by owner: strategies registered for different owners
+never share a process, so one owner's strategy cannot read or tamper with
+another's resident state or history.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import threading
+from itertools import count
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..indicators.cache import IndicatorCache, indicator_cache
+from ..marketdata.shared_history import DEFAULT_CAPACITY, HistoryRef, detach, resolve
+from .base import BaseStrategy, StrategyError
+from shared.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv("STRATEGY_SANDBOX_WORKERS", "0")) or (os.cpu_count() or 1)
+STARTUP_TIMEOUT = 10.0
+
+
+def _worker_main(conn: Connection) -> None:
+    """Serve strategy calls until the parent closes the pipe."""
+    try:
+        with indicator_cache(IndicatorCache()):
+            _serve(conn)
+    finally:
+        detach()
+
+
+def _tail(strategy: BaseStrategy) -> int:
+    """Rows of appended history a strategy needs to decide the latest bar."""
+    try:
+        return max(int(strategy.lookback), 0) + 1
+    except NotImplementedError:
+        return DEFAULT_CAPACITY
+
+
+def _serve(conn: Connection) -> None:
+    strategies: Dict[int, BaseStrategy] = {}
+    tails: Dict[int, int] = {}
+    history: Dict[int, pd.DataFrame] = {}
+    while True:
+        try:
+            op, sid, payload = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        try:
+            if isinstance(payload, HistoryRef):
+                payload = resolve(payload)
+            if op == "load":
+                strategies[sid] = payload
+                tails[sid] = _tail(payload)
+                history.pop(sid, None)
+                result: Any = None
+            elif op == "drop":
+                strategies.pop(sid, None)
+                tails.pop(sid, None)
+                history.pop(sid, None)
+                result = None
+            elif op == "append":
+                frame = payload if sid not in history else pd.concat([history[sid], payload])
+                # Keep only what the strategy can read, or what the ingestor
+                # retains when it does not declare a lookback.
+                frame = frame.iloc[-tails[sid] :]
+                history[sid] = frame
+                result = strategies[sid].generate_signal(frame)
+            elif op == "full":
+                if isinstance(payload, pd.DataFrame):
+                    history[sid] = payload.iloc[-tails[sid] :]
+                result = strategies[sid].generate_signal(payload)
+            else:
+                result = getattr(strategies[sid], op)(payload)
+            conn.send((True, result))
+        except Exception as exc:  # pragma: no cover - relayed to parent
+            conn.send((False, f"{type(exc).__name__}: {exc}"))
+
+
+class _WorkerLost(Exception):
+    """The worker process hung or died and has to be replaced."""
+
+
+class _Worker:
+    """One long-lived sandbox process and the strategies resident in it."""
+
+    def __init__(self, ctx: Any, owner: str = "") -> None:
+        self._ctx = ctx
+        self.owner = owner
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.strategies: Dict[int, BaseStrategy] = {}
+        self._start()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._proc.pid
+
+    def _spawn(self) -> None:
+        self.conn, child = self._ctx.Pipe()
+        self._proc = self._ctx.Process(target=_worker_main, args=(child,), daemon=True)
+        self._proc.start()
+        child.close()
+
+    def _start(self) -> None:
+        """Spawn the process and reload the resident strategies.
+
+        A strategy whose reload fails is dropped. If its reload hangs or
+        kills the process, the worker respawns without it, so every
+        respawn has one strategy fewer and a bad strategy cannot keep the
+        worker restarting.
+        """
+        self._spawn()
+        pending = list(self.strategies.items())
+        while pending:
+            sid, strat = pending.pop(0)
+            try:
+                self._exchange("load", sid, strat, STARTUP_TIMEOUT)
+            except StrategyError as exc:
+                logger.error("Dropped sandboxed strategy %d on reload: %s", sid, exc)
+                del self.strategies[sid]
+            except _WorkerLost as exc:
+                logger.error("Dropped sandboxed strategy %d on reload: %s", sid, exc)
+                del self.strategies[sid]
+                self.close()
+                self.generation += 1
+                self._spawn()
+                pending = list(self.strategies.items())
+
+    def restart(self) -> None:
+        """Kill the process and respawn it with the resident strategies."""
+        self.close()
+        self.generation += 1
+        logger.warning("Restarted sandbox worker (generation %d)", self.generation)
+        self._start()
+
+    def _exchange(self, op: str, sid: int, payload: Any, timeout: float) -> Any:
+        try:
+            self.conn.send((op, sid, payload))
+            ready = self.conn.poll(timeout)
+        except (BrokenPipeError, EOFError, OSError) as exc:
+            raise _WorkerLost("Sandbox worker unavailable") from exc
+        if not ready:
+            raise _WorkerLost("Execution timed out")
+        try:
+            ok, value = self.conn.recv()
+        except EOFError as exc:
+            raise _WorkerLost("Sandbox worker exited") from exc
+        if not ok:
+            raise StrategyError(value)
+        return value
+
+    def request(self, op: str, sid: int, payload: Any, timeout: float) -> Any:
+        """Send one request; caller must hold ``lock``."""
+        try:
+            return self._exchange(op, sid, payload, timeout)
+        except _WorkerLost as exc:
+            self.restart()
+            raise StrategyError(str(exc)) from exc
+
+    def close(self) -> None:
+        self._proc.terminate()
+        self._proc.join()
+        self.conn.close()
+
+
+class SandboxPool:
+    """Sandbox processes with resident strategies, up to ``size`` per owner."""
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE) -> None:
+        self.size = max(1, size)
+        self._ctx = mp.get_context()
+        self._workers: Dict[str, List[_Worker]] = {}
+        self._ids = count()
+        self._lock = threading.Lock()
+
+    def register(self, strategy: BaseStrategy, owner: str = "") -> Tuple[_Worker, int]:
+        """Load ``strategy`` into the least busy worker of ``owner``."""
+        with self._lock:
+            workers = self._workers.setdefault(owner, [])
+            if len(workers) < self.size:
+                workers.append(_Worker(self._ctx, owner))
+            worker = min(workers, key=lambda w: len(w.strategies))
+            sid = next(self._ids)
+        with worker.lock:
+            worker.strategies[sid] = strategy
+            try:
+                worker.request("load", sid, strategy, STARTUP_TIMEOUT)
+            except StrategyError:
+                worker.strategies.pop(sid, None)
+                raise
+        return worker, sid
+
+    def unregister(self, worker: _Worker, sid: int) -> None:
+        with worker.lock:
+            if worker.strategies.pop(sid, None) is not None:
+                worker.request("drop", sid, None, STARTUP_TIMEOUT)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for workers in self._workers.values():
+                for worker in workers:
+                    worker.close()
+            self._workers.clear()
+
+
+_default_pool: Optional[SandboxPool] = None
+_default_lock = threading.Lock()
+
+
+def get_pool() -> SandboxPool:
+    """Return the process-wide sandbox pool."""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = SandboxPool()
+        return _default_pool
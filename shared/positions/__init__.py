@@ -0,0 +1,5 @@
+"""Position accounting shared by the PnL and risk services."""
+
+from .store import Position, PositionStore
+
+__all__ = ["Position", "PositionStore"]
@@ -0,0 +1,185 @@
+"""Slotted positions backed by struct-of-arrays float columns."""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+ZERO = Decimal("0")
+# Store column mirroring each Position field.
+_COLUMNS = {
+    "quantity": "quantities",
+    "avg_price": "avg_prices",
+    "realized": "realized",
+    "last_price": "last_prices",
+}
+
+
+class Position:
+    """One instrument's quantity, cost basis and realized PnL.
+
+    Values are exact Decimals. A position attached to a ``PositionStore``
+    also mirrors them into the store's float64 columns on every write,
+    including direct attribute assignment; reads stay plain slot loads.
+    """
+
+    __slots__ = ("quantity", "avg_price", "realized", "last_price", "_store", "_row")
+
+    def __init__(
+        self,
+        quantity: Decimal = ZERO,
+        avg_price: Decimal = ZERO,
+        realized: Decimal = ZERO,
+        last_price: Decimal = ZERO,
+    ) -> None:
+        self._store: Optional[PositionStore] = None
+        self.quantity = quantity
+        self.avg_price = avg_price
+        self.realized = realized
+        self.last_price = last_price
+        self._row = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        column = _COLUMNS.get(name)
+        if column is not None and self._store is not None:
+            getattr(self._store, column)[self._row] = float(value)
+
+    def update(self, qty: Decimal, price: Decimal) -> None:
+        """Apply a fill, realizing PnL on the closed part."""
+        same_side = self.quantity * qty >= 0
+        if same_side:
+            total_qty = self.quantity + qty
+            if total_qty:
+                self.avg_price = (
+                    (self.avg_price * self.quantity) + (price * qty)
+                ) / total_qty
+            self.quantity = total_qty
+        else:
+            closed = min(abs(qty), abs(self.quantity))
+            sign = Decimal("1") if self.quantity > 0 else Decimal("-1")
+            self.realized += (price - self.avg_price) * closed * sign
+            self.quantity += qty
+            if self.quantity == 0:
+                self.avg_price = ZERO
+            if abs(qty) > closed:
+                self.avg_price = price
+        self.last_price = price
+
+    def mark(self, price: Decimal) -> None:
+        self.last_price = price
+
+    @property
+    def unrealized(self) -> Decimal:
+        return (self.last_price - self.avg_price) * self.quantity
+
+    def copy(self) -> "Position":
+        """Detached copy that does not write to any store."""
+        return Position(self.quantity, self.avg_price, self.realized, self.last_price)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return (self.quantity, self.avg_price, self.realized, self.last_price) == (
+            other.quantity,
+            other.avg_price,
+            other.realized,
+            other.last_price,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Position(quantity={self.quantity!r}, avg_price={self.avg_price!r}, "
+            f"realized={self.realized!r}, last_price={self.last_price!r})"
+        )
+
+
+class PositionStore:
+    """Positions keyed by symbol with a row id per symbol.
+
+    Behaves like a read-mostly dict of ``Position`` objects; new symbols are
+    added with ``setdefault``. Every row is mirrored into float64 columns so
+    portfolio totals are computed in one vectorized pass.
+
+    The PnL service and the risk portfolio each own a store: the risk one
+    also holds reserved, unfilled orders, so only the accounting code is
+    shared, not the rows.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._positions: Dict[str, Position] = {}
+        self.symbols: List[str] = []
+        self.quantities = np.zeros(capacity)
+        self.avg_prices = np.zeros(capacity)
+        self.realized = np.zeros(capacity)
+        self.last_prices = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._positions
+
+    def __getitem__(self, symbol: str) -> Position:
+        return self._positions[symbol]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PositionStore):
+            return self._positions == other._positions
+        return self._positions == other
+
+    def __repr__(self) -> str:
+        return f"PositionStore({self._positions!r})"
+
+    def get(self, symbol: str, default: Optional[Position] = None) -> Optional[Position]:
+        return self._positions.get(symbol, default)
+
+    def keys(self):
+        return self._positions.keys()
+
+    def values(self):
+        return self._positions.values()
+
+    def items(self):
+        return self._positions.items()
+
+    def setdefault(self, symbol: str, default: Optional[Position] = None) -> Position:
+        """Return the position for ``symbol``, adding ``default`` (or a flat one)."""
+        pos = self._positions.get(symbol)
+        if pos is not None:
+            return pos
+        pos = default if default is not None else Position()
+        row = len(self.symbols)
+        if row == len(self.quantities):
+            self._grow()
+        pos._store = self
+        pos._row = row
+        self.symbols.append(symbol)
+        self._positions[symbol] = pos
+        self._sync(pos)
+        return pos
+
+    def _grow(self) -> None:
+        size = len(self.quantities) * 2
+        for name in ("quantities", "avg_prices", "realized", "last_prices"):
+            column = np.zeros(size)
+            column[: len(self.symbols)] = getattr(self, name)
+            setattr(self, name, column)
+
+    def _sync(self, pos: Position) -> None:
+        row = pos._row
+        self.quantities[row] = float(pos.quantity)
+        self.avg_prices[row] = float(pos.avg_price)
+        self.realized[row] = float(pos.realized)
+        self.last_prices[row] = float(pos.last_price)
+
+    def totals(self) -> Tuple[float, float]:
+        """``(realized, unrealized)`` summed over every position."""
+        n = len(self.symbols)
+        qty = self.quantities[:n]
+        unrealized = float(np.dot(self.last_prices[:n] - self.avg_prices[:n], qty))
+        return float(self.realized[:n].sum()), unrealized
@@ -24,9 +24,10 @@ class AuthMiddleware:
         auth = request.headers.get("authorization", "")
         token = auth.replace("Bearer ", "")
         try:
-            validate_token(token, request.app.state.service_name)
+            claims = validate_token(token, request.app.state.service_name)
         except AuthError as exc:
             res = JSONResponse({"detail": str(exc)}, status_code=401)
             await res(scope, receive, send)
             return
+        scope.setdefault("state", {})["claims"] = claims
         await self.app(scope, receive, send)
@@ -1,24 +1,25 @@
 from __future__ import annotations
 
-import asyncio
-import time
-from typing import Dict
+from typing import Any, Optional
+
+from shared.utils.gcra import GCRALimiter, RedisGCRALimiter
 
 
 class RateLimiter:
-    """Simple per-key rate limiter."""
+    """Simple per-key rate limiter.
+
+    State is in-process unless a Redis client is given, in which case it is
+    shared by every replica using the same ``prefix``.
+    """
 
-    def __init__(self, limit: int, window: int) -> None:
+    def __init__(self, limit: int, window: int, redis: Optional[Any] = None, prefix: str = "ratelimit:") -> None:
         self.limit = limit
         self.window = window
-        self.calls: Dict[str, list[float]] = {}
+        self._local = GCRALimiter(limit, window) if redis is None else None
+        self._redis = RedisGCRALimiter(redis, limit, window, prefix) if redis is not None else None
 
     async def allow(self, key: str) -> bool:
         """Return True if request allowed for key."""
-        now = time.monotonic()
-        calls = [c for c in self.calls.get(key, []) if now - c < self.window]
-        if len(calls) >= self.limit:
-            return False
-        calls.append(now)
-        self.calls[key] = calls
-        return True
+        if self._redis is not None:
+            return await self._redis.allow(key)
+        return self._local.allow(key)
@@ -0,0 +1,107 @@
+"""Per-key rate limiting with the generic cell rate algorithm (GCRA).
+
+Each key stores one theoretical arrival time (TAT), so a check is O(1) and
+memory is one float per active key. ``limit`` events are allowed in any
+burst, after which events are admitted every ``window / limit`` seconds.
+A key whose TAT has passed is indistinguishable from an unseen key, which
+makes idle eviction exact.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Slack for float rounding when intervals are not exactly representable.
+_EPSILON = 1e-9
+# Smallest number of calls between sweeps of idle keys.
+_MIN_SWEEP = 1024
+
+_REDIS_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+if tat - now > tolerance + 1e-9 then return 0 end
+local new = tat + interval
+redis.call('SET', KEYS[1], string.format('%.6f', new), 'PX', math.ceil((new - now) * 1000))
+return 1
+"""
+
+
+class GCRALimiter:
+    """In-process limiter allowing ``limit`` events per ``window`` seconds per key."""
+
+    def __init__(self, limit: int, window: float, clock: Callable[[], float] = time.monotonic) -> None:
+        if limit <= 0 or window <= 0:
+            raise ValueError("limit and window must be positive")
+        self.limit = limit
+        self.window = window
+        self.interval = window / limit
+        self.tolerance = window - self.interval
+        self.clock = clock
+        self._tat: Dict[Hashable, float] = {}
+        self._calls = 0
+        self._sweep_at = _MIN_SWEEP
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+    def check(self, key: Hashable, now: Optional[float] = None) -> bool:
+        """Whether an event for ``key`` would be allowed, without recording it."""
+        now = self.clock() if now is None else now
+        return self._tat.get(key, now) - now <= self.tolerance + _EPSILON
+
+    def headroom(self, key: Hashable, now: Optional[float] = None) -> int:
+        """How many events ``key`` would be allowed back to back at ``now``."""
+        now = self.clock() if now is None else now
+        slack = self.tolerance + _EPSILON - (max(self._tat.get(key, now), now) - now)
+        return int(slack // self.interval) + 1 if slack >= 0 else 0
+
+    def consume(self, key: Hashable, now: Optional[float] = None, count: int = 1) -> None:
+        """Record ``count`` events for ``key`` regardless of the limit."""
+        now = self.clock() if now is None else now
+        self._tat[key] = max(self._tat.get(key, now), now) + self.interval * count
+        self._calls += count
+        if self._calls >= self._sweep_at:
+            self.evict_idle(now)
+
+    def allow(self, key: Hashable, now: Optional[float] = None) -> bool:
+        """Record and allow an event for ``key`` if it fits the limit."""
+        now = self.clock() if now is None else now
+        if not self.check(key, now):
+            return False
+        self.consume(key, now)
+        return True
+
+    def evict_idle(self, now: Optional[float] = None) -> None:
+        """Forget keys that are fully replenished."""
+        now = self.clock() if now is None else now
+        self._tat = {k: tat for k, tat in self._tat.items() if tat > now}
+        self._calls = 0
+        # Sweeping at most once per surviving key keeps the cost O(1) amortized.
+        self._sweep_at = max(len(self._tat), _MIN_SWEEP)
+
+
+class RedisGCRALimiter:
+    """GCRA state kept in Redis and shared by every replica.
+
+    The check runs as one Lua script using the server clock, and keys
+    expire once they are fully replenished.
+    """
+
+    def __init__(self, redis: Any, limit: int, window: float, prefix: str = "ratelimit:") -> None:
+        if limit <= 0 or window <= 0:
+            raise ValueError("limit and window must be positive")
+        self.redis = redis
+        self.limit = limit
+        self.window = window
+        self.interval = window / limit
+        self.tolerance = window - self.interval
+        self.prefix = prefix
+        self._script = redis.register_script(_REDIS_SCRIPT)
+
+    async def allow(self, key: str) -> bool:
+        result = await self._script(keys=[self.prefix + key], args=[self.interval, self.tolerance])
+        return bool(int(result))
@@ -3,27 +3,72 @@ from __future__ import annotations
 """Unified input validation utilities."""
 
 import json
+import re
+from functools import lru_cache
 from html import escape
 from importlib import resources
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']").search
 
 
 class InputValidationError(Exception):
     """Raised when input validation fails."""
 
 
+@lru_cache(maxsize=None)
 def _load_schema(name: str) -> Dict[str, Any]:
     with resources.files('shared.schemas').joinpath(f"{name}.json").open() as f:
         return json.load(f)
 
 
+@lru_cache(maxsize=None)
+def _validator(name: str) -> Callable[[Any], None]:
+    """Compiled validator for a schema, built once per name.
+
+    Uses fastjsonschema when installed and falls back to jsonschema. Like
+    ``jsonschema.validate``, neither asserts ``format`` keywords or fills in
+    defaults.
+    """
+    schema = _load_schema(name)
+    if fastjsonschema is not None:
+        compiled = fastjsonschema.compile(schema, use_default=False, use_formats=False)
+
+        def check(payload: Any) -> None:
+            try:
+                compiled(payload)
+            except fastjsonschema.JsonSchemaValueException as exc:
+                raise InputValidationError(exc.message) from exc
+
+        return check
+
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
+    def check(payload: Any) -> None:
+        try:
+            validator.validate(payload)
+        except ValidationError as exc:
+            raise InputValidationError(str(exc)) from exc
+
+    return check
+
+
 def validate_schema(payload: Dict[str, Any], schema_name: str) -> Dict[str, Any]:
-    """Validate and sanitize payload against schema."""
-    schema = _load_schema(schema_name)
-    try:
-        validate(payload, schema)
-    except ValidationError as exc:
-        raise InputValidationError(str(exc)) from exc
-    return {k: escape(str(v)) if isinstance(v, str) else v for k, v in payload.items()}
+    """Validate and sanitize payload against schema.
+
+    The payload is returned as is when no string value needs escaping.
+    """
+    _validator(schema_name)(payload)
+    if not any(isinstance(v, str) and _NEEDS_ESCAPE(v) for v in payload.values()):
+        return payload
+    return {k: escape(v) if isinstance(v, str) else v for k, v in payload.items()}
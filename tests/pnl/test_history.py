@@ -0,0 +1,61 @@
+import importlib.util
+import sys
+from pathlib import Path
+from decimal import Decimal
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "pnl", Path("services/pnl/__init__.py").resolve()
+)
+mod = importlib.util.module_from_spec(spec)
+sys.modules["pnl"] = mod
+spec.loader.exec_module(mod)
+
+PnLHistory = mod.PnLHistory
+PnLService = mod.PnLService
+
+
+def test_ring_buffer_is_bounded_and_ordered() -> None:
+    history = PnLHistory(capacity=5, resolutions=())
+    for t in range(12):
+        history.append(float(t), 0.0, float(t), float(t))
+    assert len(history) == 5
+    rows = history.query()
+    assert rows[:, 0].tolist() == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert history.query(8.5, 10)[:, 0].tolist() == [9.0, 10.0]
+
+
+def test_tiers_grow_lazily_up_to_capacity() -> None:
+    history = PnLHistory(capacity=300, resolutions=(3600,))
+    assert all(len(ring.rows) <= 64 for ring in history._tiers.values())
+    for t in range(1000):
+        history.append(float(t), 0.0, float(t), float(t))
+    assert len(history._tiers[0].rows) == 300
+    assert len(history._tiers[3600].rows) <= 64
+    assert history.query()[:, 0].tolist() == [float(t) for t in range(700, 1000)]
+
+
+def test_downsampling_keeps_last_value_per_bucket() -> None:
+    history = PnLHistory(capacity=1000, resolutions=(60, 3600))
+    for t in range(0, 7200):
+        history.append(float(t), 0.0, 0.0, float(t))
+    minutes = history.query(resolution=60)
+    hours = history.query(resolution=3600)
+    assert len(minutes) == 120
+    assert minutes[0].tolist() == [0.0, 0.0, 0.0, 59.0]
+    assert hours[:, 0].tolist() == [0.0, 3600.0]
+    assert hours[:, 3].tolist() == [3599.0, 7199.0]
+    with pytest.raises(ValueError):
+        history.query(resolution=5)
+
+
+def test_snapshot_records_history() -> None:
+    tracker = PnLService(history=PnLHistory(capacity=10))
+    tracker.on_fill("BTC", Decimal("1"), Decimal("100"))
+    tracker.on_price("BTC", Decimal("110"))
+    tracker.snapshot(timestamp=1.0)
+    tracker.on_price("BTC", Decimal("120"))
+    tracker.snapshot(timestamp=2.0)
+    assert tracker.history.query()[:, 3].tolist() == [10.0, 20.0]
+    assert tracker.history.latest()["total"] == 20.0
@@ -0,0 +1,64 @@
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from decimal import Decimal
+
+import fakeredis
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "pnl", Path("services/pnl/__init__.py").resolve()
+)
+mod = importlib.util.module_from_spec(spec)
+sys.modules["pnl"] = mod
+spec.loader.exec_module(mod)
+
+PnLService = mod.PnLService
+
+
+def test_apply_marks_keeps_latest_and_skips_malformed() -> None:
+    tracker = PnLService()
+    tracker.on_fill("BTC", Decimal("1"), Decimal("100"))
+    tracker.on_fill("ETH", Decimal("2"), Decimal("10"))
+    version = tracker.price_version
+    batch = [
+        json.dumps({"symbol": "BTC", "price": "101"}),
+        "not json",
+        json.dumps({"symbol": "ETH", "price": "-1"}),
+        json.dumps({"symbol": "BTC", "price": "105"}),
+        json.dumps({"symbol": "ETH/USDT", "exchange": "x", "bid": "1", "ask": "2", "last": "1.5",
+                    "timestamp": "2024-01-01T00:00:00+00:00"}),
+        json.dumps({"symbol": "ETH", "last": "12"}),
+    ]
+    # ETH/USDT has a valid price but no position, so only two are marked.
+    assert tracker.apply_marks(batch) == 2
+    assert tracker.prices["BTC"] == Decimal("105")
+    assert tracker.prices["ETH"] == Decimal("12")
+    assert tracker.price_version == version + 2
+    metrics = tracker.mark_metrics
+    assert (metrics.messages, metrics.malformed, metrics.batches, metrics.marks) == (6, 2, 1, 2)
+    assert metrics.last_lag > 0
+
+
+@pytest.mark.asyncio
+async def test_listener_survives_bad_messages() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    tracker = PnLService()
+    tracker.on_fill("BTC", Decimal("1"), Decimal("100"))
+    task = asyncio.create_task(tracker.listen_market_data("market", redis=redis))
+    while not (await redis.pubsub_numsub("market"))[0][1]:
+        await asyncio.sleep(0.01)
+    await redis.publish("market", b"{bad")
+    for price in ("101", "102", "103"):
+        await redis.publish("market", json.dumps({"symbol": "BTC", "price": price}))
+    for _ in range(100):
+        if tracker.mark_metrics.messages == 4:
+            break
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert tracker.mark_metrics.malformed == 1
+    assert tracker.prices["BTC"] == Decimal("103")
@@ -48,6 +48,19 @@ def test_close_and_reverse() -> None:
     assert snap["total"] == -50.0
 
 
+def test_price_map_is_live_and_read_only() -> None:
+    tracker = PnLService()
+    prices = tracker.prices
+    tracker.on_fill("BTC", Decimal("1"), Decimal("100"))
+    version = tracker.price_version
+    tracker.on_price("BTC", Decimal("101"))
+    tracker.on_price("ETH", Decimal("5"))
+    assert prices == {"BTC": Decimal("101")}
+    assert tracker.price_version == version + 1
+    with pytest.raises(TypeError):
+        prices["BTC"] = Decimal("1")
+
+
 def test_close_position() -> None:
     tracker = PnLService()
     tracker.on_fill("BTC", Decimal("5"), Decimal("100"))
@@ -1,4 +1,6 @@
+import asyncio
 import importlib.util
+import random
 import sys
 from pathlib import Path
 from decimal import Decimal
@@ -32,3 +34,93 @@ async def test_concentration_limit(monkeypatch) -> None:
     big_order = risk_mod.Order(symbol="ETHUSDT", quantity=Decimal("5"), price=Decimal("200"), side="BUY")
     with pytest.raises(risk_mod.exceptions_mod.RiskLimitBreached):
         await manager.validate_order(big_order)
+
+
+@pytest.mark.asyncio
+async def test_validate_orders_applies_batch_cumulatively(monkeypatch) -> None:
+    monkeypatch.setenv("CONCENTRATION_LIMIT", "1")
+    risk_mod = load_risk_manager()
+    queue = asyncio.Queue()
+    manager = risk_mod.RiskManager(alert_queue=queue)
+    batch = [
+        risk_mod.Order("BTC", Decimal("4"), Decimal("10"), "BUY"),
+        risk_mod.Order("BTC", Decimal("4"), Decimal("10"), "BUY"),
+        risk_mod.Order("BTC", Decimal("4"), Decimal("10"), "BUY"),
+        risk_mod.Order("ETH", Decimal("4"), Decimal("10"), "BUY"),
+    ]
+    verdicts = await manager.validate_orders(batch)
+    assert verdicts == [None, None, "symbol position limit", None]
+    assert queue.qsize() == 1
+    assert manager.portfolio.positions == {}
+
+
+@pytest.mark.asyncio
+async def test_velocity_counts_only_accepted_orders(monkeypatch) -> None:
+    monkeypatch.setenv("CONCENTRATION_LIMIT", "1")
+    monkeypatch.setenv("VELOCITY_LIMIT", "2")
+    monkeypatch.setenv("VELOCITY_PER_SYMBOL", "true")
+    risk_mod = load_risk_manager()
+    manager = risk_mod.RiskManager()
+    too_big = risk_mod.Order("BTC", Decimal("11"), Decimal("1"), "BUY")
+    for _ in range(3):
+        with pytest.raises(risk_mod.exceptions_mod.RiskLimitBreached, match="symbol position"):
+            await manager.validate_order(too_big)
+    order = risk_mod.Order("BTC", Decimal("1"), Decimal("1"), "BUY")
+    await manager.validate_order(order)
+    await manager.validate_order(order)
+    with pytest.raises(risk_mod.exceptions_mod.RiskLimitBreached, match="velocity"):
+        await manager.validate_order(order)
+    await manager.validate_order(risk_mod.Order("ETH", Decimal("1"), Decimal("1"), "BUY"))
+
+
+@pytest.mark.asyncio
+async def test_validate_orders_values_trial_at_market_prices(monkeypatch) -> None:
+    monkeypatch.setenv("CONCENTRATION_LIMIT", "0.7")
+    monkeypatch.setenv("DAILY_LOSS_LIMIT", "10000")
+    monkeypatch.setenv("DRAWDOWN_LIMIT", "10000")
+    risk_mod = load_risk_manager()
+    manager = risk_mod.RiskManager()
+    await manager.on_fill(risk_mod.Order("BTC", Decimal("1"), Decimal("100"), "BUY"))
+    await manager.on_fill(risk_mod.Order("ETH", Decimal("1"), Decimal("100"), "BUY"))
+    # An off-market fill price must not revalue the BTC position for the
+    # orders after it.
+    batch = [
+        risk_mod.Order("BTC", Decimal("1"), Decimal("1000"), "BUY"),
+        risk_mod.Order("BTC", Decimal("0.01"), Decimal("100"), "BUY"),
+    ]
+    assert await manager.validate_orders(batch) == [None, None]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(4))
+async def test_validate_orders_matches_order_by_order_checks(monkeypatch, seed) -> None:
+    monkeypatch.setenv("POSITION_LIMIT_SYMBOL", "6")
+    monkeypatch.setenv("POSITION_LIMIT_TOTAL", "20")
+    monkeypatch.setenv("CONCENTRATION_LIMIT", "0.6")
+    monkeypatch.setenv("DAILY_LOSS_LIMIT", "700")
+    monkeypatch.setenv("DRAWDOWN_LIMIT", "500")
+    monkeypatch.setenv("VELOCITY_LIMIT", "25")
+    monkeypatch.setenv("VELOCITY_PER_SYMBOL", "true" if seed % 2 else "false")
+    risk_mod = load_risk_manager()
+    rng = random.Random(seed)
+    symbols = ["BTC", "ETH", "SOL", "ADA", "DOT"]
+    managers = []
+    for _ in range(2):
+        manager = risk_mod.RiskManager(clock=lambda: 0.0)
+        for sym in symbols[:3]:
+            await manager.on_fill(risk_mod.Order(sym, Decimal("2"), Decimal("50"), "BUY"))
+        managers.append(manager)
+    batch = [
+        risk_mod.Order(
+            rng.choice(symbols),
+            Decimal(rng.randint(-8, 8)) / 2,
+            Decimal(rng.randint(10, 120)),
+            "BUY",
+        )
+        for _ in range(300)
+    ]
+    batched = await managers[0].validate_orders(batch)
+    one_by_one = managers[1]._check_orders(batch, managers[1].pnl_service.prices)
+    assert batched == one_by_one
+    assert any(batched) and not all(batched)
+    assert managers[0].limits[-1].high_watermark == managers[1].limits[-1].high_watermark
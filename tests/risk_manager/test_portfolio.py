@@ -0,0 +1,76 @@
+import importlib.util
+import random
+import sys
+from pathlib import Path
+from decimal import Decimal
+import pytest
+
+
+def load_risk_manager():
+    spec = importlib.util.spec_from_file_location("risk_manager", Path("services/risk-manager/__init__.py").resolve())
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["risk_manager"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_running_aggregates_match_recompute(seed) -> None:
+    load_risk_manager()
+    portfolio = sys.modules["risk_manager.monitors.portfolio"].Portfolio()
+    rng = random.Random(seed)
+    symbols = ["BTC", "ETH", "SOL", "ADA"]
+    for _ in range(500):
+        sym = rng.choice(symbols)
+        price = Decimal(rng.randint(1, 5000)) / 4
+        if rng.random() < 0.6:
+            held = portfolio.positions.get(sym)
+            if held is not None and held.quantity and rng.random() < 0.2:
+                qty = -held.quantity
+            else:
+                qty = Decimal(rng.randint(-20, 20)) / 2
+            portfolio.update(sym, qty, price)
+        else:
+            portfolio.mark(sym, price)
+        assert (portfolio.gross_quantity, portfolio.gross_notional) == portfolio.recompute()
+
+
+@pytest.mark.asyncio
+async def test_pnl_marks_flow_into_portfolio() -> None:
+    risk_mod = load_risk_manager()
+    manager = risk_mod.RiskManager()
+    await manager.on_fill(risk_mod.Order("BTC", Decimal("2"), Decimal("10"), "BUY"))
+    manager.pnl_service.on_price("BTC", Decimal("15"))
+    assert manager.portfolio.gross_quantity == Decimal("2")
+    assert manager.portfolio.gross_notional == Decimal("30")
+
+
+def test_trial_leaves_original_untouched() -> None:
+    load_risk_manager()
+    portfolio = sys.modules["risk_manager.monitors.portfolio"].Portfolio()
+    portfolio.update("BTC", Decimal("2"), Decimal("10"))
+    portfolio.mark("BTC", Decimal("12"))
+    trial = portfolio.trial()
+    trial.update("BTC", Decimal("1"), Decimal("13"))
+    trial.update("ETH", Decimal("-1"), Decimal("5"))
+    assert (trial.gross_quantity, trial.gross_notional) == trial.recompute() == (Decimal("4"), Decimal("41"))
+    assert (portfolio.gross_quantity, portfolio.gross_notional) == (Decimal("2"), Decimal("24"))
+    assert portfolio.positions["BTC"].quantity == Decimal("2")
+    assert "ETH" not in portfolio.positions
+
+
+def test_trial_layer_sizes_and_views() -> None:
+    load_risk_manager()
+    portfolio = sys.modules["risk_manager.monitors.portfolio"].Portfolio()
+    portfolio.update("BTC", Decimal("2"), Decimal("10"))
+    portfolio.update("ETH", Decimal("1"), Decimal("5"))
+    trial = portfolio.trial()
+    trial.update("BTC", Decimal("1"), Decimal("13"))
+    trial.update("SOL", Decimal("3"), Decimal("2"))
+    positions = trial.positions
+    assert len(positions) == 3
+    items = positions.items()
+    assert sorted(sym for sym, _ in items) == sorted(sym for sym, _ in items) == ["BTC", "ETH", "SOL"]
+    assert sorted(p.quantity for p in positions.values()) == [Decimal("1"), Decimal("3"), Decimal("3")]
+    assert set(positions.keys()) == {"BTC", "ETH", "SOL"}
+    assert len(portfolio.positions) == 2
@@ -0,0 +1,54 @@
+import importlib.util
+import sys
+from pathlib import Path
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+
+def load_risk_manager():
+    for name in [m for m in sys.modules if m.startswith("risk_manager.")]:
+        del sys.modules[name]
+    spec = importlib.util.spec_from_file_location("risk_manager", Path("services/risk-manager/__init__.py").resolve())
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["risk_manager"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.mark.asyncio
+async def test_matrix_pnl_matches_per_scenario_loop(monkeypatch) -> None:
+    monkeypatch.setenv("CONCENTRATION_LIMIT", "1")
+    risk_mod = load_risk_manager()
+    scenarios = sys.modules["risk_manager.scenarios"]
+    manager = risk_mod.RiskManager()
+    await manager.on_fill(risk_mod.Order("BTC", Decimal("2"), Decimal("100"), "BUY"))
+    await manager.on_fill(risk_mod.Order("ETH", Decimal("-3"), Decimal("10"), "SELL"))
+    manager.pnl_service.on_price("BTC", Decimal("110"))
+    engine = manager.scenarios()
+    returns = scenarios.monte_carlo(np.array([[0.04, 0.01], [0.01, 0.09]]), 500, seed=1)
+    result = engine.evaluate(returns, confidence=0.95)
+    for row, pnl in zip(returns[:20], result.pnl[:20]):
+        expected = sum(
+            float(manager.stress_test({sym: pos.last_price * Decimal(str(r))}))
+            for sym, pos, r in zip(engine.symbols, manager.pnl_service.positions.values(), row)
+        )
+        assert pnl == pytest.approx(expected)
+    assert result.expected_shortfall >= result.var > 0
+
+
+def test_tail_risk_and_generators() -> None:
+    load_risk_manager()
+    scenarios = sys.modules["risk_manager.scenarios"]
+    pnl = np.arange(-50.0, 50.0)
+    var, es = scenarios.tail_risk(pnl, 0.9)
+    assert var == pytest.approx(40.1)
+    assert es == pytest.approx(45.5)
+    grid = scenarios.sigma_grid(np.array([0.1, 0.2]), k=2, steps=5)
+    assert grid[:, 1].tolist() == pytest.approx([-0.4, -0.2, 0.0, 0.2, 0.4])
+    assert scenarios.historical(np.array([[100.0], [110.0], [99.0]]))[:, 0] == pytest.approx([0.1, -0.1])
+    draws = scenarios.monte_carlo(np.array([[1.0, 0.8], [0.8, 1.0]]), 20000, seed=0)
+    assert np.corrcoef(draws.T)[0, 1] == pytest.approx(0.8, abs=0.02)
+    with pytest.raises(sys.modules["risk_manager.exceptions"].RiskError):
+        scenarios.ScenarioEngine(["A"], np.ones(1), np.ones(1)).evaluate(np.zeros((3, 2)))
@@ -0,0 +1,148 @@
+import asyncio
+import importlib.util
+import random
+import sys
+from pathlib import Path
+from decimal import Decimal
+import pytest
+
+
+def load_risk_manager():
+    for name in [m for m in sys.modules if m.startswith("risk_manager.")]:
+        del sys.modules[name]
+    spec = importlib.util.spec_from_file_location("risk_manager", Path("services/risk-manager/__init__.py").resolve())
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["risk_manager"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def stress_manager(monkeypatch):
+    monkeypatch.setenv("CONCENTRATION_LIMIT", "1")
+    monkeypatch.setenv("VELOCITY_LIMIT", "100000")
+    monkeypatch.setenv("DAILY_LOSS_LIMIT", "1000000")
+    monkeypatch.setenv("DRAWDOWN_LIMIT", "1000000")
+    monkeypatch.setenv("CIRCUIT_BREAKER_DRAWDOWN", "1000000")
+    risk_mod = load_risk_manager()
+    return risk_mod, risk_mod.RiskManager()
+
+
+async def run_producers(risk_mod, submit, fill, cancel) -> int:
+    rng = random.Random(7)
+    symbols = ["BTC", "ETH", "SOL", "ADA", "DOT", "XRP"]
+
+    async def producer(n: int) -> int:
+        accepted = 0
+        for _ in range(n):
+            order = risk_mod.Order(rng.choice(symbols), Decimal(rng.randint(1, 3)), Decimal("10"), "BUY")
+            try:
+                await submit(order)
+            except risk_mod.exceptions_mod.RiskLimitBreached:
+                continue
+            accepted += 1
+            # The venue answers later; other producers run meanwhile.
+            await asyncio.sleep(0)
+            if rng.random() < 0.2:
+                await cancel(order)
+            else:
+                await fill(order)
+        return accepted
+
+    return sum(await asyncio.gather(*(producer(50) for _ in range(40))))
+
+
+def overfilled(manager) -> bool:
+    portfolio = manager.portfolio
+    return portfolio.gross_quantity > 50 or any(abs(p.quantity) > 10 for p in portfolio.positions.values())
+
+
+@pytest.mark.asyncio
+async def test_unsequenced_producers_overfill(monkeypatch) -> None:
+    # Control for the test below: without the sequencer every producer
+    # validates against a book that misses the others' in-flight orders.
+    risk_mod, manager = stress_manager(monkeypatch)
+
+    async def cancel(order) -> None:
+        pass
+
+    await run_producers(risk_mod, manager.validate_order, manager.on_fill, cancel)
+    assert overfilled(manager)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_producers_never_overfill(monkeypatch) -> None:
+    risk_mod, manager = stress_manager(monkeypatch)
+    sequencer = risk_mod.RiskSequencer(manager)
+    sequencer.start()
+    accepted = await run_producers(risk_mod, sequencer.submit, sequencer.fill, sequencer.cancel)
+    await sequencer.close()
+
+    portfolio = manager.portfolio
+    assert accepted > 0
+    assert not overfilled(manager)
+    assert (portfolio.gross_quantity, portfolio.gross_notional) == portfolio.recompute()
+    # Every reservation was filled or released, so both books agree.
+    booked = manager.pnl_service.positions
+    assert {s: p.quantity for s, p in portfolio.positions.items() if p.quantity} == {
+        s: p.quantity for s, p in booked.items() if p.quantity
+    }
+
+
+@pytest.mark.asyncio
+async def test_close_finishes_queued_requests(monkeypatch) -> None:
+    risk_mod, manager = stress_manager(monkeypatch)
+    gate = asyncio.Event()
+    validate = manager.validate_order
+
+    async def slow_validate(order) -> None:
+        await gate.wait()
+        await validate(order)
+
+    manager.validate_order = slow_validate
+    sequencer = risk_mod.RiskSequencer(manager)
+    sequencer.start()
+    first = risk_mod.Order("BTC", Decimal("1"), Decimal("10"), "BUY")
+    second = risk_mod.Order("ETH", Decimal("1"), Decimal("10"), "BUY")
+    pending = [asyncio.create_task(sequencer.submit(o)) for o in (first, second)]
+    await asyncio.sleep(0)
+    closing = asyncio.create_task(sequencer.close())
+    await asyncio.sleep(0)
+    with pytest.raises(risk_mod.exceptions_mod.RiskError):
+        await sequencer.submit(risk_mod.Order("SOL", Decimal("1"), Decimal("10"), "BUY"))
+    gate.set()
+    await asyncio.wait_for(asyncio.gather(closing, *pending), 1)
+    assert set(manager.portfolio.positions) == {"BTC", "ETH"}
+    assert not manager.pnl_service.positions
+
+
+@pytest.mark.asyncio
+async def test_cancelled_writer_resolves_in_flight_request(monkeypatch) -> None:
+    risk_mod, manager = stress_manager(monkeypatch)
+
+    started = asyncio.Event()
+
+    async def hang(order) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    manager.validate_order = hang
+    sequencer = risk_mod.RiskSequencer(manager)
+    sequencer.start()
+    pending = asyncio.create_task(sequencer.submit(risk_mod.Order("BTC", Decimal("1"), Decimal("10"), "BUY")))
+    queued = asyncio.create_task(sequencer.submit(risk_mod.Order("ETH", Decimal("1"), Decimal("10"), "BUY")))
+    await started.wait()
+    while not sequencer._queue.qsize():
+        await asyncio.sleep(0)
+    sequencer._task.cancel()
+    with pytest.raises(risk_mod.exceptions_mod.RiskError, match="closed"):
+        await asyncio.wait_for(queued, 1)
+    with pytest.raises(risk_mod.exceptions_mod.RiskError, match="closed"):
+        await asyncio.wait_for(pending, 1)
+
+
+@pytest.mark.asyncio
+async def test_requires_started_sequencer() -> None:
+    risk_mod = load_risk_manager()
+    sequencer = risk_mod.RiskSequencer(risk_mod.RiskManager())
+    with pytest.raises(risk_mod.exceptions_mod.RiskError):
+        await sequencer.fill(risk_mod.Order("BTC", Decimal("1"), Decimal("10"), "BUY"))
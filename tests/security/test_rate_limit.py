@@ -15,3 +15,14 @@ async def test_rate_limiter():
     assert not await limiter.allow("k")
     await asyncio.sleep(1)
     assert await limiter.allow("k")
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_shared_through_redis():
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    a = rl_mod.RateLimiter(limit=1, window=60, redis=fakeredis.FakeAsyncRedis(server=server))
+    b = rl_mod.RateLimiter(limit=1, window=60, redis=fakeredis.FakeAsyncRedis(server=server))
+    assert await a.allow("k")
+    assert not await b.allow("k")
@@ -0,0 +1,41 @@
+import random
+from decimal import Decimal
+
+from shared.positions import Position, PositionStore
+
+
+def test_totals_match_decimal_sums() -> None:
+    store = PositionStore(capacity=2)
+    rng = random.Random(3)
+    for _ in range(300):
+        sym = f"S{rng.randint(0, 40)}"
+        price = Decimal(rng.randint(1, 400)) / 4
+        if rng.random() < 0.7:
+            store.setdefault(sym).update(Decimal(rng.randint(-5, 5)), price)
+        elif sym in store:
+            store[sym].mark(price)
+    realized, unrealized = store.totals()
+    assert realized == float(sum(p.realized for p in store.values()))
+    assert abs(unrealized - float(sum(p.unrealized for p in store.values()))) < 1e-6
+    assert len(store.symbols) == len(store) > 2
+
+
+def test_copy_is_detached() -> None:
+    store = PositionStore()
+    pos = store.setdefault("BTC")
+    pos.update(Decimal("2"), Decimal("10"))
+    clone = pos.copy()
+    clone.update(Decimal("3"), Decimal("20"))
+    assert store["BTC"] == Position(Decimal("2"), Decimal("10"), Decimal("0"), Decimal("10"))
+    assert store.quantities[0] == 2.0
+
+
+def test_direct_writes_reach_the_columns() -> None:
+    store = PositionStore()
+    pos = store.setdefault("BTC")
+    pos.quantity = Decimal("3")
+    pos.avg_price = Decimal("10")
+    pos.realized = Decimal("-1.5")
+    pos.last_price = Decimal("12")
+    assert (store.quantities[0], store.avg_prices[0], store.realized[0], store.last_prices[0]) == (3.0, 10.0, -1.5, 12.0)
+    assert store.totals() == (-1.5, 6.0)
@@ -0,0 +1,34 @@
+import time
+from decimal import Decimal
+from importlib import import_module
+
+import pandas as pd
+
+BaseStrategy = import_module(
+    "services.strategy-engine.strategies.base"
+).BaseStrategy
+
+
+class LengthProbe(BaseStrategy):
+    """Reports how many rows the sandbox hands it."""
+
+    def __init__(self, name: str, size: Decimal, lookback: int = 4) -> None:
+        super().__init__(name, size)
+        self._lookback = lookback
+
+    @property
+    def lookback(self) -> int:
+        return self._lookback
+
+    def generate_signal(self, data: pd.DataFrame) -> int:
+        return len(data)
+
+
+class SlowLoadStrategy(BaseStrategy):
+    """Hangs whenever a worker unpickles it."""
+
+    def __init__(self, name: str, size: Decimal) -> None:
+        super().__init__(name, size)
+
+    def __setstate__(self, state: dict) -> None:
+        time.sleep(3600)
@@ -0,0 +1,78 @@
+import importlib
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+analytics = importlib.import_module("services.strategy-engine.backtesting.analytics")
+bt_mod = importlib.import_module("services.strategy-engine.backtesting.engine")
+ma_mod = importlib.import_module("services.strategy-engine.strategies.moving_average")
+
+
+def minute_bars(n: int = 3 * 1440) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    ts = 1_704_067_200.0 + np.arange(n) * 60.0
+    return pd.DataFrame({"timestamp": ts, "close": 100 + rng.normal(0, 0.2, n).cumsum()})
+
+
+@pytest.fixture
+def run():
+    data = minute_bars()
+    bt = bt_mod.Backtester(slippage=Decimal("0.001"), commission=Decimal("0.0005"))
+    result = bt.run_vectorized(data, ma_mod.MovingAverageCrossover("ma", Decimal("2"), 5, 30))
+    return data, result
+
+
+def test_metrics_match_a_trade_by_trade_calculation(run):
+    data, result = run
+    perf = analytics.analyze(result, data, periods_per_year=365 * 1440)
+    close = data["close"].to_numpy()
+    held, cash, equity = 0.0, 0.0, []
+    fills = {int(i): t for i, t in zip(result.arrays.index, result.trades)}
+    for i, price in enumerate(close):
+        if i in fills:
+            held += 2 if fills[i].signal.action == "BUY" else -2
+            cash = float(fills[i].pnl)
+        equity.append(cash + held * price)
+    np.testing.assert_allclose(perf.equity, equity, atol=1e-9)
+    returns = np.diff(equity, prepend=0.0)
+    assert perf.sharpe == pytest.approx(returns.mean() / returns.std(ddof=1) * np.sqrt(365 * 1440))
+    peak = np.maximum.accumulate(np.maximum(equity, 0.0))
+    assert perf.max_drawdown == pytest.approx(max(peak - equity))
+    assert perf.trades == len(result.trades)
+    assert perf.turnover == pytest.approx(sum(2 * float(t.signal.price) for t in result.trades))
+    assert 0.0 <= perf.win_rate <= 1.0
+    assert perf.summary()["profit"] == pytest.approx(equity[-1])
+
+
+def test_rolling_and_period_rollups(run):
+    data, result = run
+    perf = analytics.analyze(result, data)
+    rolling = perf.rolling(60)
+    assert list(rolling.columns) == ["return", "sharpe", "sortino", "drawdown"]
+    assert rolling["return"].iloc[-1] == pytest.approx(perf.equity[-1] - perf.equity[-61])
+    assert (rolling["drawdown"].dropna() >= 0).all()
+    daily = perf.rollup("D")
+    assert len(daily) == 3
+    assert daily["return"].sum() == pytest.approx(perf.profit)
+    assert daily["trades"].sum() == perf.trades
+    monthly = perf.rollup("M")
+    assert len(monthly) == 1
+    with pytest.raises(analytics.AnalyticsError):
+        analytics.analyze(result, data[["close"]]).rollup("D")
+
+
+def test_no_trades_gives_flat_curve():
+    data = pd.DataFrame({"close": [1.0, 1.0, 1.0]})
+    perf = analytics.analyze(bt_mod.BacktestResult(), data)
+    assert perf.profit == 0.0 and perf.trades == 0 and perf.max_drawdown == 0.0
+    assert np.isnan(perf.sharpe) and np.isnan(perf.win_rate)
+
+
+def test_loop_results_without_arrays_are_rejected():
+    data = minute_bars(300)
+    result = bt_mod.Backtester().run(data, ma_mod.MovingAverageCrossover("ma", Decimal("1"), 5, 30))
+    assert result.trades and result.arrays is None
+    with pytest.raises(analytics.AnalyticsError, match="run_vectorized"):
+        analytics.analyze(result, data)
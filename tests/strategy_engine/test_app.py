@@ -18,3 +18,28 @@ def test_add_and_list_strategy():
     resp2 = client.get("/strategies")
     assert resp2.status_code == 200
     assert payload["path"] in resp2.json()
+
+
+def test_history_sized_to_strategy_lookback():
+    import json
+
+    ticks_mod = __import__("services.strategy-engine.marketdata.ticks", fromlist=["TickIngestor"])
+    ma_mod = __import__("services.strategy-engine.strategies.moving_average", fromlist=["MovingAverageCrossover"])
+    loader_mod = __import__("services.strategy-engine.strategies.loader", fromlist=["SandboxedStrategy"])
+    ingestor = ticks_mod.TickIngestor(capacity=100)
+    direct = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3)
+    sandboxed = loader_mod.SandboxedStrategy(ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3))
+    try:
+        for i in range(50):
+            tick = {"symbol": "BTC", "bid": i, "ask": i, "last": i, "timestamp": "2024-01-01T00:00:00Z"}
+            ingestor.ingest(json.dumps(tick).encode())
+        build = app_mod._history(ingestor, "BTC")
+        frame = build(direct)
+        assert len(frame) == direct.lookback + 1
+        assert frame["close"].iloc[-1] == 49.0
+        ref = build(sandboxed)
+        assert ref.length == direct.lookback + 1
+        assert (sandboxed.generate_signal(ref) is None) == (direct.generate_signal(frame) is None)
+    finally:
+        sandboxed.close()
+        ingestor.close()
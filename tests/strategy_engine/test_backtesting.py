@@ -1,11 +1,26 @@
+import numpy as np
 import pandas as pd
+import pytest
 from decimal import Decimal
 
 BACKTEST = "services.strategy-engine.backtesting.engine"
 MA_CROSS = "services.strategy-engine.strategies.moving_average"
+RSI_STRAT = "services.strategy-engine.strategies.rsi_mean_reversion"
+BOLL_STRAT = "services.strategy-engine.strategies.bollinger_squeeze"
 
 bt_mod = __import__(BACKTEST, fromlist=["Backtester"])
 ma_mod = __import__(MA_CROSS, fromlist=["MovingAverageCrossover"])
+rsi_mod = __import__(RSI_STRAT, fromlist=["RSIMeanReversion"])
+boll_mod = __import__(BOLL_STRAT, fromlist=["BollingerSqueeze"])
+
+
+def random_walk(n: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({"close": 100 + rng.normal(0, 1, n).cumsum()})
+
+
+def trade_tuples(result):
+    return [(t.signal.action, t.signal.price, t.signal.quantity, t.pnl) for t in result.trades]
 
 
 def test_backtester_runs():
@@ -14,3 +29,175 @@ def test_backtester_runs():
     bt = bt_mod.Backtester()
     result = bt.run(data, strat)
     assert isinstance(result.profit, Decimal)
+
+
+def test_vectorized_matches_loop():
+    data = random_walk()
+    bt = bt_mod.Backtester(slippage=Decimal("0.001"), commission=Decimal("0.0005"))
+    strategies = [
+        ma_mod.MovingAverageCrossover("ma", Decimal("2"), 5, 20),
+        rsi_mod.RSIMeanReversion("rsi", Decimal("1")),
+        boll_mod.BollingerSqueeze("boll", Decimal("1"), threshold=0.01),
+    ]
+    for strat in strategies:
+        expected = bt.run(data, strat)
+        actual = bt.run_vectorized(data, strat)
+        assert expected.trades
+        assert trade_tuples(actual) == trade_tuples(expected)
+        assert actual.profit == expected.profit
+
+
+def test_vectorized_no_trades():
+    data = pd.DataFrame({"close": [1.0, 1.0, 1.0]})
+    strat = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3)
+    result = bt_mod.Backtester().run_vectorized(data, strat)
+    assert result.trades == []
+    assert result.profit == Decimal("0")
+
+
+def test_parameter_sweep_ranks_and_matches_single_runs():
+    sweep_mod = __import__("services.strategy-engine.backtesting.sweep", fromlist=["run_sweep"])
+    path = "services.strategy-engine.strategies.moving_average.MovingAverageCrossover"
+    data = random_walk()
+    combos = sweep_mod.parameter_grid({"short_window": [3, 5], "long_window": [10, 20]})
+    table = sweep_mod.run_sweep(path, data, combos, processes=2)
+    assert len(table) == 4
+    assert {"sharpe", "max_drawdown", "win_rate"} <= set(table.columns)
+    assert list(table["profit"]) == sorted(table["profit"], reverse=True)
+    row = table.iloc[0]
+    strat = ma_mod.MovingAverageCrossover("ma", Decimal("1"), int(row["short_window"]), int(row["long_window"]))
+    assert bt_mod.Backtester().run_vectorized(data, strat).profit == row["profit"]
+
+
+def test_random_sample_decodes_grid_indices():
+    sweep_mod = __import__("services.strategy-engine.backtesting.sweep", fromlist=["random_sample"])
+    grid = {"a": [1, 2, 3], "b": ["x", "y"], "c": [0.1, 0.2, 0.3, 0.4]}
+    combos = sweep_mod.parameter_grid(grid)
+    picks = sweep_mod.random_sample(grid, 10, seed=3)
+    assert len({tuple(p.values()) for p in picks}) == 10
+    assert all(p in combos and list(p) == ["a", "b", "c"] for p in picks)
+    assert sorted(combos, key=str) == sorted(sweep_mod.random_sample(grid, 100, seed=3), key=str)
+    # 100**10 combinations; building the grid would never finish.
+    huge = {f"p{i}": list(range(100)) for i in range(10)}
+    assert len(sweep_mod.random_sample(huge, 5, seed=1)) == 5
+
+
+def test_indicator_cache_reuses_series():
+    cache_mod = __import__("services.strategy-engine.indicators.cache", fromlist=["cached"])
+    data = random_walk()
+    with cache_mod.indicator_cache() as cache:
+        ma_mod.MovingAverageCrossover("a", Decimal("1"), 5, 20).generate_signals(data)
+        ma_mod.MovingAverageCrossover("b", Decimal("1"), 5, 30).generate_signals(data)
+    assert len(cache) == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_fast_numeric_modes_track_decimal():
+    data = random_walk(2000)
+    bt = bt_mod.Backtester(slippage=Decimal("0.001"), commission=Decimal("0.0005"))
+    strat = rsi_mod.RSIMeanReversion("rsi", Decimal("0.3"))
+    exact = bt.run_vectorized(data, strat)
+    for mode in (bt_mod.FLOAT, bt_mod.FIXED):
+        fast = bt.run_vectorized(data, strat, numeric=mode)
+        assert [t.signal.action for t in fast.trades] == [t.signal.action for t in exact.trades]
+        assert abs(fast.profit - exact.profit) < Decimal("1e-6")
+        assert bt.numeric_deviation(data, strat, mode) < Decimal("1e-6")
+    lean = bt.run_vectorized(data, strat, numeric=bt_mod.FLOAT, trades=False)
+    assert lean.trades == []
+    assert len(lean.arrays.pnl) == len(exact.trades)
+
+
+def test_fixed_mode_refuses_int64_overflow():
+    data = random_walk(2000)
+    bt = bt_mod.Backtester()
+    strat = rsi_mod.RSIMeanReversion("rsi", Decimal("1e9"))
+    with pytest.raises(OverflowError):
+        bt.run_vectorized(data, strat, numeric=bt_mod.FIXED)
+    assert bt.run_vectorized(data, strat, numeric=bt_mod.FLOAT).profit
+
+
+def test_chunked_matches_in_memory_run():
+    data = random_walk(1000)
+    bt = bt_mod.Backtester(slippage=Decimal("0.001"), commission=Decimal("0.0005"))
+    strategies = [
+        ma_mod.MovingAverageCrossover("ma", Decimal("2"), 5, 20),
+        rsi_mod.RSIMeanReversion("rsi", Decimal("1")),
+        boll_mod.BollingerSqueeze("boll", Decimal("1"), threshold=0.01),
+    ]
+    for strat in strategies:
+        expected = bt.run_vectorized(data, strat)
+        for size in (1, 7, 128):
+            chunks = (data.iloc[i : i + size] for i in range(0, len(data), size))
+            actual = bt.run_chunked(chunks, strat)
+            assert trade_tuples(actual) == trade_tuples(expected)
+            assert actual.profit == expected.profit
+            np.testing.assert_array_equal(actual.arrays.index, expected.arrays.index)
+        fast = bt.run_vectorized(data, strat, numeric=bt_mod.FLOAT, trades=False)
+        chunks = (data.iloc[i : i + 100] for i in range(0, len(data), 100))
+        lean = bt.run_chunked(chunks, strat, numeric=bt_mod.FLOAT, trades=False)
+        np.testing.assert_array_equal(lean.arrays.pnl, fast.arrays.pnl)
+
+
+def test_chunked_requires_declared_lookback():
+    base_mod = __import__("services.strategy-engine.strategies.base", fromlist=["BaseStrategy"])
+    loader_mod = __import__("services.strategy-engine.strategies.loader", fromlist=["SandboxedStrategy"])
+
+    class NoLookback(base_mod.BaseStrategy):
+        def generate_signals(self, data):
+            return np.zeros(len(data), dtype=np.int8)
+
+    data = random_walk(50)
+    with pytest.raises(base_mod.StrategyError, match="lookback"):
+        bt_mod.Backtester().run_chunked([data.iloc[:25], data.iloc[25:]], NoLookback("none", Decimal("1")))
+    strat = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 5, 20)
+    sandboxed = loader_mod.SandboxedStrategy(strat)
+    try:
+        assert sandboxed.lookback == strat.lookback
+        chunks = [data.iloc[:25], data.iloc[25:]]
+        assert trade_tuples(bt_mod.Backtester().run_chunked(chunks, sandboxed)) == trade_tuples(
+            bt_mod.Backtester().run_vectorized(data, strat)
+        )
+    finally:
+        sandboxed.close()
+
+
+def test_chunked_holds_one_chunk_plus_lookback():
+    data = random_walk(1000)
+    strat = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 5, 20)
+    seen = []
+    signals = strat.generate_signals
+
+    def spy(frame):
+        seen.append(len(frame))
+        return signals(frame)
+
+    strat.generate_signals = spy
+    chunks = (data.iloc[i : i + 50] for i in range(0, len(data), 50))
+    result = bt_mod.Backtester().run_chunked(chunks, strat)
+    assert max(seen) == 50 + strat.lookback
+    assert result.profit == bt_mod.Backtester().run_vectorized(data, strat).profit
+    assert bt_mod.Backtester().run_chunked(iter([]), strat).trades == []
+
+
+def test_run_many_shares_indicators_and_combines_equity():
+    data = random_walk(1000)
+    bt = bt_mod.Backtester(slippage=Decimal("0.001"))
+    strategies = [
+        ma_mod.MovingAverageCrossover("ma_5_20", Decimal("2"), 5, 20),
+        ma_mod.MovingAverageCrossover("ma_5_50", Decimal("1"), 5, 50),
+        ma_mod.MovingAverageCrossover("ma_20_50", Decimal("1"), 20, 50),
+        rsi_mod.RSIMeanReversion("rsi", Decimal("1")),
+    ]
+    multi = bt.run_many(data, strategies)
+    assert multi.indicators["misses"] == 4
+    assert multi.indicators["hits"] == 3
+    for strat in strategies:
+        single = bt.run_vectorized(data, strat)
+        assert trade_tuples(multi.results[strat.name]) == trade_tuples(single)
+    ma = multi.results["ma_5_20"]
+    held = float(sum(2 if t.signal.action == "BUY" else -2 for t in ma.trades))
+    final = float(ma.profit) + held * data["close"].iloc[-1]
+    assert multi.curves["ma_5_20"].iloc[-1] == pytest.approx(final)
+    np.testing.assert_allclose(multi.equity.to_numpy(), multi.curves.sum(axis=1).to_numpy())
+    with pytest.raises(ValueError):
+        bt.run_many(data, strategies[:1] * 2)
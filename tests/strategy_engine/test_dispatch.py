@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+
+dispatch_mod = __import__("services.strategy-engine.dispatch", fromlist=["MarketQueue"])
+base_mod = __import__("services.strategy-engine.strategies.base", fromlist=["BaseStrategy"])
+gen_mod = __import__("services.strategy-engine.signals.generator", fromlist=["create_signal"])
+
+
+class SleepyStrategy(base_mod.BaseStrategy):
+    def __init__(self, name: str, delay: float) -> None:
+        super().__init__(name=name, position_size=Decimal("1"))
+        self.delay = delay
+
+    def generate_signal(self, data) -> Optional[object]:
+        time.sleep(self.delay)
+        return gen_mod.create_signal("BUY", Decimal(str(self.delay)), self.position_size)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy():
+    queue = dispatch_mod.MarketQueue(maxsize=2)
+    for item in ["a", "b", "c"]:
+        queue.put_nowait(item)
+    assert queue.dropped == 1
+    assert [await queue.get(), await queue.get()] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_keeps_latest_per_symbol():
+    queue = dispatch_mod.MarketQueue(maxsize=10, policy=dispatch_mod.COALESCE)
+    queue.put_nowait("btc-1", "BTC/USDT")
+    queue.put_nowait("eth-1", "ETH/USDT")
+    queue.put_nowait("btc-2", "BTC/USDT")
+    assert len(queue) == 2
+    assert [await queue.get(), await queue.get()] == ["btc-2", "eth-1"]
+
+
+@pytest.mark.asyncio
+async def test_signals_published_in_completion_order_with_deadline():
+    dispatcher = dispatch_mod.StrategyDispatcher(max_workers=4, deadline=0.3)
+    strategies = [SleepyStrategy("slow", 0.2), SleepyStrategy("fast", 0.01), SleepyStrategy("stuck", 1.0)]
+    start = time.perf_counter()
+    prices = [sig.price async for sig in dispatcher.run(strategies, None)]
+    assert prices == [Decimal("0.01"), Decimal("0.2")]
+    assert time.perf_counter() - start < 0.9
+    dispatcher.shutdown()
+
+
+class HungStrategy(base_mod.BaseStrategy):
+    def __init__(self, name: str, release: threading.Event) -> None:
+        super().__init__(name=name, position_size=Decimal("1"))
+        self.release = release
+        self.calls = 0
+
+    def generate_signal(self, data) -> Optional[object]:
+        self.calls += 1
+        self.release.wait()
+        return None
+
+
+@pytest.mark.asyncio
+async def test_hung_strategies_do_not_stall_dispatch():
+    release = threading.Event()
+    dispatcher = dispatch_mod.StrategyDispatcher(max_workers=2, deadline=0.05)
+    hung = [HungStrategy("hung-a", release), HungStrategy("hung-b", release)]
+    fast = SleepyStrategy("fast", 0.0)
+    try:
+        for _ in range(10):
+            prices = [sig.price async for sig in dispatcher.run([fast, *hung], None)]
+            assert prices == [Decimal("0.0")]
+        # Each hung strategy holds one thread and is skipped until it returns.
+        assert [h.calls for h in hung] == [1, 1]
+        assert dispatcher.replaced == 1
+    finally:
+        release.set()
+    for _ in range(100):
+        if not dispatcher._busy:
+            break
+        await asyncio.sleep(0.01)
+    assert [sig.price async for sig in dispatcher.run(hung[:1] + [fast], None)] == [Decimal("0.0")]
+    assert hung[0].calls == 2
+    dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_returns_before_slow_strategies_finish():
+    dispatcher = dispatch_mod.StrategyDispatcher(max_workers=2, deadline=1.0)
+    received = []
+
+    async def sink(signal) -> None:
+        received.append(signal.price)
+
+    slow = SleepyStrategy("slow", 0.1)
+    assert dispatcher.dispatch([slow], None, sink) == 1
+    assert dispatcher.dispatch([slow], None, sink) == 0
+    assert received == []
+    await asyncio.sleep(0.3)
+    assert received == [Decimal("0.1")]
+    dispatcher.shutdown()
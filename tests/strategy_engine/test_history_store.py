@@ -0,0 +1,84 @@
+import importlib
+import mmap
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+store_mod = importlib.import_module("services.strategy-engine.marketdata.store")
+bt_mod = importlib.import_module("services.strategy-engine.backtesting.engine")
+ma_mod = importlib.import_module("services.strategy-engine.strategies.moving_average")
+
+DAY = store_mod.DAY
+
+
+def bars(start: float, n: int, step: float = 60.0) -> pd.DataFrame:
+    ts = start + np.arange(n) * step
+    close = 100 + np.sin(ts / 3600.0) * 5
+    return pd.DataFrame(
+        {"timestamp": ts, "open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return store_mod.HistoryStore(tmp_path)
+
+
+def test_partitions_by_day_and_slices_without_copy(store):
+    data = bars(0.0, 3 * 1440)
+    store.write("BTC/USDT", data)
+    assert store.symbols() == ["BTC/USDT"]
+    assert store.days("BTC/USDT") == [0, 1, 2]
+    frame = store.read("BTC/USDT", DAY + 600, DAY + 1200)
+    assert frame["timestamp"].tolist() == [DAY + t for t in range(600, 1200, 60)]
+    base = frame["close"].to_numpy()
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, memoryview) and isinstance(base.obj, mmap.mmap)
+    assert not frame["close"].to_numpy().flags.writeable
+    pd.testing.assert_frame_equal(store.read("BTC/USDT"), data)
+
+
+def test_write_merges_out_of_order_rows(store):
+    data = bars(0.0, 100)
+    store.write("ETH/USDT", data.iloc[50:])
+    store.write("ETH/USDT", data.iloc[:50])
+    pd.testing.assert_frame_equal(store.read("ETH/USDT"), data)
+    with pytest.raises(store_mod.StoreError):
+        store.write("ETH/USDT", data[["timestamp", "close"]])
+
+
+def test_rewrites_are_idempotent_and_last_write_wins(store):
+    data = bars(DAY - 3600, 120)
+    store.write("BTC/USDT", data)
+    store.write("BTC/USDT", data)
+    pd.testing.assert_frame_equal(store.read("BTC/USDT"), data)
+    fixed = data.iloc[[10, 70]].copy()
+    fixed["close"] = [1.0, 2.0]
+    store.write("BTC/USDT", pd.concat([fixed.assign(close=0.0), fixed]))
+    frame = store.read("BTC/USDT")
+    assert len(frame) == len(data)
+    assert frame["close"].iloc[[10, 70]].tolist() == [1.0, 2.0]
+
+
+def test_store_feeds_backtest_and_warm_up(store):
+    data = bars(DAY - 3600, 600)
+    store.write("BTC/USDT", data)
+    strat = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 5, 20)
+    bt = bt_mod.Backtester()
+    from_store = bt.run_vectorized(store.read("BTC/USDT"), strat)
+    in_memory = bt.run_vectorized(data, strat)
+    assert from_store.profit == in_memory.profit
+    assert len(from_store.trades) == len(in_memory.trades)
+
+    tail = store.tail("BTC/USDT", 100)
+    assert tail["timestamp"].tolist() == data["timestamp"].iloc[-100:].tolist()
+    warmed = ma_mod.MovingAverageCrossover("warmed", Decimal("1"), 5, 20)
+    full = ma_mod.MovingAverageCrossover("full", Decimal("1"), 5, 20)
+    warmed.warm_up(tail)
+    full.warm_up(data)
+    for price in (90.0, 110.0, 90.0):
+        a, b = warmed.on_price(price), full.on_price(price)
+        assert (a and a.action) == (b and b.action)
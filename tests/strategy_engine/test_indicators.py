@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+import pytest
 
 MA = "services.strategy-engine.indicators.moving_average"
 RSI = "services.strategy-engine.indicators.rsi"
@@ -25,3 +27,120 @@ def test_bollinger_bands():
     series = pd.Series([1, 2, 3, 4, 5])
     bands = boll_mod.bollinger_bands(series, 2)
     assert set(bands.columns) == {"upper", "lower"}
+
+
+def random_walk(n: int = 5000) -> pd.Series:
+    rng = np.random.default_rng(11)
+    return pd.Series(100 + rng.normal(0, 1, n).cumsum())
+
+
+TOLERANCE = 1e-8
+
+
+def test_incremental_moving_average_matches_pandas():
+    series = random_walk()
+    stream = ma_mod.IncrementalMovingAverage(20)
+    values = [stream.update(p) for p in series]
+    np.testing.assert_allclose(values, ma_mod.moving_average(series, 20), rtol=TOLERANCE, equal_nan=True)
+
+
+def test_incremental_rsi_matches_pandas():
+    series = random_walk()
+    stream = rsi_mod.IncrementalRSI(14)
+    values = [stream.update(p) for p in series]
+    np.testing.assert_allclose(values, rsi_mod.rsi(series, 14), rtol=TOLERANCE, equal_nan=True)
+
+
+def test_incremental_rsi_flat_prices():
+    stream = rsi_mod.IncrementalRSI(2)
+    values = [stream.update(p) for p in [1, 2, 2, 2]]
+    expected = rsi_mod.rsi(pd.Series([1, 2, 2, 2]), 2)
+    np.testing.assert_allclose(values, expected, equal_nan=True)
+
+
+def test_incremental_bollinger_matches_pandas():
+    series = random_walk()
+    stream = boll_mod.IncrementalBollingerBands(20)
+    values = np.array([stream.update(p) for p in series])
+    bands = boll_mod.bollinger_bands(series, 20)
+    np.testing.assert_allclose(values[:, 0], bands["upper"], rtol=TOLERANCE, equal_nan=True)
+    np.testing.assert_allclose(values[:, 1], bands["lower"], rtol=TOLERANCE, equal_nan=True)
+
+
+def test_bootstrap_from_history():
+    series = random_walk(100)
+    stream = ma_mod.IncrementalMovingAverage(10)
+    assert stream.bootstrap(series[:-1]) == pytest.approx(series[:-1].tail(10).mean())
+    assert stream.update(series.iloc[-1]) == pytest.approx(series.tail(10).mean())
+
+
+def test_indicator_cache_lru_and_memory_cap():
+    cache_mod = __import__("services.strategy-engine.indicators.cache", fromlist=["IndicatorCache"])
+    series = random_walk(1000)
+    cache = cache_mod.IndicatorCache(max_entries=2)
+    with cache_mod.indicator_cache(cache):
+        for window in (5, 10, 5, 20):
+            cache_mod.cached(ma_mod.moving_average, series, window)
+    assert cache.stats()["hits"] == 1
+    assert cache.evictions == 1
+    assert len(cache) == 2
+    small = cache_mod.IndicatorCache(max_bytes=1000)
+    with cache_mod.indicator_cache(small):
+        cache_mod.cached(ma_mod.moving_average, series, 5)
+    assert len(small) == 0
+
+
+def test_indicator_cache_follows_data_version():
+    cache_mod = __import__("services.strategy-engine.indicators.cache", fromlist=["IndicatorCache"])
+    series = random_walk(100)
+    with cache_mod.indicator_cache() as cache:
+        series.attrs[cache_mod.VERSION_ATTR] = ("BTC", 1)
+        cache_mod.cached(ma_mod.moving_average, series, 5)
+        series.attrs[cache_mod.VERSION_ATTR] = ("BTC", 2)
+        cache_mod.cached(ma_mod.moving_average, series, 5)
+    assert cache.misses == 2
+
+
+def test_indicator_cache_misses_after_in_place_edit():
+    cache_mod = __import__("services.strategy-engine.indicators.cache", fromlist=["IndicatorCache"])
+    series = random_walk(100)
+    with cache_mod.indicator_cache() as cache:
+        before = cache_mod.cached(ma_mod.moving_average, series, 5)
+        series.iloc[50] += 10.0
+        after = cache_mod.cached(ma_mod.moving_average, series, 5)
+        again = cache_mod.cached(ma_mod.moving_average, series.copy(), 5)
+    assert cache.misses == 2 and cache.hits == 1
+    assert after.iloc[52] == pytest.approx(before.iloc[52] + 2.0)
+    assert again.equals(after)
+
+
+def test_indicator_cache_keys_on_index():
+    cache_mod = __import__("services.strategy-engine.indicators.cache", fromlist=["IndicatorCache"])
+    series = random_walk(100)
+    shifted = pd.Series(series.to_numpy(), index=series.index + 1000)
+    with cache_mod.indicator_cache() as cache:
+        first = cache_mod.cached(ma_mod.moving_average, series, 5)
+        second = cache_mod.cached(ma_mod.moving_average, shifted, 5)
+        cache_mod.cached(ma_mod.moving_average, shifted.copy(), 5)
+    assert (cache.misses, cache.hits) == (2, 1)
+    assert second.index.equals(shifted.index)
+    np.testing.assert_array_equal(first.to_numpy(), second.to_numpy())
+
+
+def test_bollinger_bands_under_cache_with_shifted_index():
+    from decimal import Decimal
+
+    cache_mod = __import__("services.strategy-engine.indicators.cache", fromlist=["indicator_cache"])
+    squeeze_mod = __import__("services.strategy-engine.strategies.bollinger_squeeze", fromlist=["BollingerSqueeze"])
+    series = random_walk(300)
+    expected = boll_mod.bollinger_bands(series, 20)
+    frame = pd.DataFrame({"close": series.to_numpy()}, index=pd.date_range("2024-01-01", periods=300, freq="min"))
+    strat = squeeze_mod.BollingerSqueeze("boll", Decimal("1"), threshold=0.05)
+    plain = strat.generate_signals(pd.DataFrame({"close": series}))
+    with cache_mod.indicator_cache():
+        boll_mod.bollinger_bands(series, 20)
+        bands = boll_mod.bollinger_bands(frame["close"], 20)
+        shifted = strat.generate_signals(frame)
+    assert bands.index.equals(frame.index)
+    np.testing.assert_array_equal(bands.to_numpy(), expected.to_numpy())
+    np.testing.assert_array_equal(shifted, plain)
@@ -9,6 +9,10 @@ MA_PATH = (
     "services.strategy-engine.strategies.moving_average.MovingAverageCrossover"
 )
 loader_mod = importlib.import_module(LOADER)
+sandbox_mod = importlib.import_module("services.strategy-engine.strategies.sandbox")
+ma_mod = importlib.import_module("services.strategy-engine.strategies.moving_average")
+hang_mod = importlib.import_module("tests.strategy_engine.hang_strategy")
+probe_mod = importlib.import_module("tests.strategy_engine.probe_strategy")
 
 
 def test_load_strategy_allowed():
@@ -39,3 +43,76 @@ def test_sandbox_timeout(monkeypatch):
     strat = loader_mod.load_strategy(path, "hang", Decimal("1"), timeout=0.1)
     with pytest.raises(loader_mod.StrategyError):
         strat.generate_signal(pd.DataFrame())
+
+
+def test_sandbox_worker_is_reused():
+    strat = loader_mod.load_strategy(
+        MA_PATH, "reuse", Decimal("1"), short_window="2", long_window="3"
+    )
+    pid = strat._worker.pid
+    data = pd.DataFrame({"close": [1.0, 2.0, 3.0, 2.0, 1.0]})
+    strat.generate_signal(data.iloc[:3])
+    strat.generate_signal(data)
+    assert strat._worker.pid == pid
+    assert strat.last_latency is not None and strat.last_latency < 1.0
+
+
+def test_sandbox_appends_only_new_rows():
+    direct = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3)
+    strat = loader_mod.SandboxedStrategy(direct)
+    data = pd.DataFrame({"close": [1.0, 2.0, 3.0, 4.0, 5.0, 4.0, 3.0, 2.0, 3.0, 4.0]})
+    for i in range(1, len(data) + 1):
+        expected = direct.generate_signal(data.iloc[:i])
+        assert strat._delta(data.iloc[:i])[0] == ("append" if i > 1 else "full")
+        result = strat.generate_signal(data.iloc[:i])
+        assert (result and result.action) == (expected and expected.action)
+
+
+def test_sandbox_respawns_after_timeout(monkeypatch):
+    path = "tests.strategy_engine.hang_strategy.HangStrategy"
+    monkeypatch.setenv("STRATEGY_ALLOWLIST", f"{MA_PATH},{path}")
+    importlib.reload(loader_mod)
+    pool = sandbox_mod.SandboxPool(size=1)
+    hang = loader_mod.SandboxedStrategy(
+        hang_mod.HangStrategy("hang", Decimal("1")), timeout=0.1, pool=pool
+    )
+    ma = loader_mod.SandboxedStrategy(ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3), pool=pool)
+    pid = hang._worker.pid
+    with pytest.raises(loader_mod.StrategyError):
+        hang.generate_signal(pd.DataFrame())
+    assert hang._worker.pid != pid
+    assert ma.generate_signal(pd.DataFrame({"close": [1.0, 2.0, 3.0]})) is None
+    pool.shutdown()
+
+
+def test_sandbox_history_is_bounded_by_lookback():
+    probe = loader_mod.SandboxedStrategy(probe_mod.LengthProbe("probe", Decimal("1"), lookback=4))
+    data = pd.DataFrame({"close": [float(i) for i in range(50)]})
+    lengths = [probe.generate_signal(data.iloc[:i]) for i in range(1, len(data) + 1)]
+    assert probe._delta(data)[0] == "append"
+    assert lengths[:5] == [1, 2, 3, 4, 5]
+    assert set(lengths[5:]) == {5}
+    probe.close()
+
+
+def test_sandbox_workers_are_not_shared_between_owners():
+    pool = sandbox_mod.SandboxPool(size=1)
+    ma = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3)
+    alice = loader_mod.SandboxedStrategy(ma, pool=pool, owner="alice")
+    alice_again = loader_mod.SandboxedStrategy(ma, pool=pool, owner="alice")
+    bob = loader_mod.SandboxedStrategy(ma, pool=pool, owner="bob")
+    assert alice._worker is alice_again._worker
+    assert bob._worker is not alice._worker
+    assert bob._worker.pid != alice._worker.pid
+    pool.shutdown()
+
+
+def test_hanging_reload_is_dropped_instead_of_restarting_forever(monkeypatch):
+    monkeypatch.setattr(sandbox_mod, "STARTUP_TIMEOUT", 0.2)
+    pool = sandbox_mod.SandboxPool(size=1)
+    ma = loader_mod.SandboxedStrategy(ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3), pool=pool)
+    with pytest.raises(loader_mod.StrategyError, match="timed out"):
+        loader_mod.SandboxedStrategy(probe_mod.SlowLoadStrategy("slow", Decimal("1")), pool=pool)
+    assert list(ma._worker.strategies) == [ma._sid]
+    assert ma.generate_signal(pd.DataFrame({"close": [1.0, 2.0, 3.0]})) is None
+    pool.shutdown()
@@ -0,0 +1,100 @@
+import importlib
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pf_mod = importlib.import_module("services.strategy-engine.backtesting.portfolio")
+bt_mod = importlib.import_module("services.strategy-engine.backtesting.engine")
+ma_mod = importlib.import_module("services.strategy-engine.strategies.moving_average")
+base_mod = importlib.import_module("services.strategy-engine.strategies.base")
+
+
+def feed(n: int, offset: float = 0.0, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"timestamp": np.arange(n) * 60.0 + offset, "close": 100 + rng.normal(0, 1, n).cumsum()})
+
+
+class Recorder(base_mod.BaseStrategy):
+    def __init__(self, name: str, seen: list) -> None:
+        super().__init__(name=name, position_size=Decimal("1"))
+        self.seen = seen
+
+    def on_price(self, price: float):
+        self.seen.append((self.name, price))
+        return None
+
+
+def crossover(name: str) -> object:
+    return ma_mod.MovingAverageCrossover(name, Decimal("1"), 5, 20)
+
+
+def test_events_are_merged_in_time_order_and_routed_by_symbol():
+    feeds = {"A": feed(50), "B": feed(50, 30.0, seed=1), "C": feed(50, 0.0, seed=2)}
+    seen: list = []
+    bt = pf_mod.PortfolioBacktester()
+    bt.subscribe("A", Recorder("A", seen))
+    bt.subscribe("C", Recorder("C", seen))
+    result = bt.run(feeds)
+    assert result.events == 150
+    merged = list(pf_mod.merge_events(feeds))
+    assert [e[0] for e in merged] == sorted(e[0] for e in merged)
+    assert merged[:3] == [(0.0, 0, feeds["A"]["close"][0]), (0.0, 2, feeds["C"]["close"][0]), (30.0, 1, feeds["B"]["close"][0])]
+    streamed = {s: zip(f["timestamp"], f["close"]) for s, f in feeds.items()}
+    assert list(pf_mod.merge_events(streamed)) == merged
+    assert seen == [("A" if sid == 0 else "C", price) for _, sid, price in merged if sid != 1]
+    with pytest.raises(pf_mod.PortfolioError):
+        bt.run({"A": feeds["A"]})
+
+
+def test_chunked_merge_matches_heap_merge_across_boundaries(monkeypatch):
+    import heapq
+
+    monkeypatch.setattr(pf_mod, "MERGE_CHUNK", 3)
+    rng = np.random.default_rng(5)
+    feeds = {
+        s: [(float(t), float(i)) for i, t in enumerate(np.sort(rng.integers(0, 20, n)))]
+        for s, n in [("A", 17), ("B", 1), ("C", 0), ("D", 25)]
+    }
+    expected = list(heapq.merge(*([(t, sid, p) for t, p in f] for sid, f in enumerate(feeds.values()))))
+    streamed = {s: iter(f) for s, f in feeds.items()}
+    assert list(pf_mod.merge_events(streamed)) == expected
+    mixed = dict(feeds, A=pd.DataFrame(feeds["A"], columns=["timestamp", "close"]))
+    assert list(pf_mod.merge_events(mixed)) == expected
+
+
+def test_positions_follow_pnl_accounting():
+    data = feed(2000)
+    bt = pf_mod.PortfolioBacktester(slippage=Decimal("0.001"), commission=Decimal("0.0005"))
+    bt.subscribe("A", crossover("A"))
+    result = bt.run({"A": data})
+    single = bt_mod.Backtester(Decimal("0.001"), Decimal("0.0005")).run_vectorized(data, crossover("x"))
+    assert [(f.signal.action, f.signal.symbol) for f in result.fills] == [(t.signal.action, "A") for t in single.trades]
+    pos = result.positions["A"]
+    last = Decimal(str(data["close"].iloc[-1]))
+    assert pos.last_price == last
+    assert abs(result.profit - (single.profit + pos.quantity * last)) < Decimal("1e-12")
+    assert result.fills[0].signal.timestamp.timestamp() > 0
+
+
+def test_risk_limits_reject_orders(monkeypatch):
+    monkeypatch.setenv("CONCENTRATION_LIMIT", "1")
+    monkeypatch.setenv("DAILY_LOSS_LIMIT", "1000000")
+    monkeypatch.setenv("DRAWDOWN_LIMIT", "1000000")
+    monkeypatch.setenv("CIRCUIT_BREAKER_DRAWDOWN", "1000000")
+    monkeypatch.setenv("VELOCITY_LIMIT", "2")
+    monkeypatch.setenv("VELOCITY_WINDOW", "3600")
+    feeds = {"A": feed(2000), "B": feed(2000, 30.0, seed=1)}
+    free = pf_mod.PortfolioBacktester()
+    limited = pf_mod.PortfolioBacktester(risk=True)
+    for bt in (free, limited):
+        for symbol in feeds:
+            bt.subscribe(symbol, crossover(symbol))
+    unlimited = free.run(feeds)
+    result = limited.run(feeds)
+    assert result.rejected and {reason for _, reason in result.rejected} == {"velocity limit"}
+    assert len(result.fills) + len(result.rejected) == len(unlimited.fills)
+    fills = [f.signal.timestamp.timestamp() for f in result.fills]
+    assert len(fills) <= 2 + (fills[-1] - fills[0]) / 1800
+    assert result.risk.portfolio.positions["A"].quantity == result.positions["A"].quantity
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import fakeredis
+import pytest
+
+pub_mod = __import__("services.strategy-engine.signals.publisher", fromlist=["SignalPublisher"])
+models = __import__("services.strategy-engine.signals.models", fromlist=["Signal"])
+
+
+def make_signal(price: str) -> object:
+    return models.Signal(datetime(2024, 1, 1, 12, 0, 0, 5), "BUY", Decimal(price), Decimal("0.10"))
+
+
+def test_encode_round_trip_is_exact():
+    sig = make_signal("101.2500")
+    assert pub_mod.decode_signal(pub_mod.encode_signal(sig)) == sig
+    sig.symbol = "BTC/USDT"
+    assert pub_mod.decode_signal(pub_mod.encode_signal(sig)) == sig
+
+
+@pytest.mark.asyncio
+async def test_flushes_on_batch_size():
+    redis = fakeredis.FakeAsyncRedis()
+    pubsub = redis.pubsub()
+    await pubsub.subscribe("signals")
+    await pubsub.get_message(timeout=0.1)
+    publisher = pub_mod.SignalPublisher(redis, max_batch=3)
+    for price in ["1", "2"]:
+        await publisher.publish(make_signal(price))
+    assert publisher.metrics.flushes == 0
+    await publisher.publish(make_signal("3"))
+    assert publisher.metrics.flushes == 1
+    assert publisher.metrics.last_flush_size == 3
+    received = [await pubsub.get_message(timeout=0.1) for _ in range(3)]
+    assert [pub_mod.decode_signal(m["data"]).price for m in received] == [Decimal("1"), Decimal("2"), Decimal("3")]
+
+
+@pytest.mark.asyncio
+async def test_stream_mode_flushes_on_close():
+    redis = fakeredis.FakeAsyncRedis()
+    publisher = pub_mod.SignalPublisher(redis, max_batch=100, max_delay=60, stream="signals", maxlen=5)
+    publisher.start()
+    for i in range(8):
+        await publisher.publish(make_signal(str(i)))
+    await publisher.close()
+    entries = await redis.xrange("signals")
+    assert 5 <= len(entries) <= 8
+    assert pub_mod.decode_signal(entries[-1][1][b"signal"]).price == Decimal("7")
+    assert publisher.metrics.signals == 8
+
+
+@pytest.mark.asyncio
+async def test_recovers_after_outage(monkeypatch):
+    server = fakeredis.FakeServer()
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    publisher = pub_mod.SignalPublisher(redis, max_batch=2, max_delay=0.01, stream="signals", max_pending=5)
+    # Skip the backoff sleeps; the flusher loop is what retries here.
+    monkeypatch.setattr(publisher, "_execute", pub_mod.SignalPublisher._execute.__wrapped__.__get__(publisher))
+    publisher.start()
+    server.connected = False
+    with pytest.raises(pub_mod.aioredis.RedisError):
+        for i in range(2):
+            await publisher.publish(make_signal(str(i)))
+    for i in range(2, 7):
+        await publisher.publish(make_signal(str(i)))
+    await asyncio.sleep(0.05)
+    assert publisher.metrics.failures >= 2
+    assert publisher.metrics.dropped == 2
+    server.connected = True
+    for _ in range(50):
+        if publisher.metrics.signals:
+            break
+        await asyncio.sleep(0.01)
+    await publisher.publish(make_signal("7"))
+    await publisher.close()
+    entries = await redis.xrange("signals")
+    prices = [pub_mod.decode_signal(e[1][b"signal"]).price for e in entries]
+    assert prices == [Decimal(str(i)) for i in range(2, 8)]
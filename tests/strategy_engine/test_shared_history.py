@@ -0,0 +1,75 @@
+import importlib
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+SHARED = "services.strategy-engine.marketdata.shared_history"
+shm_mod = importlib.import_module(SHARED)
+loader_mod = importlib.import_module("services.strategy-engine.strategies.loader")
+ma_mod = importlib.import_module("services.strategy-engine.strategies.moving_average")
+
+
+@pytest.fixture
+def history():
+    store = shm_mod.SharedMarketData(capacity=8)
+    yield store
+    store.close()
+
+
+def bar(i: float) -> list:
+    return [i, i, i + 1, i - 1, i, 10.0]
+
+
+def test_ring_buffer_wraps_without_copy(history):
+    for i in range(20):
+        history.append("BTC/USDT", bar(float(i)))
+    frame = history.frame("BTC/USDT")
+    assert list(frame["close"]) == [float(i) for i in range(12, 20)]
+    assert not frame["close"].to_numpy().flags.writeable
+    assert np.shares_memory(frame.to_numpy(), history.buffer("BTC/USDT")._data)
+
+
+def test_overwritten_rows_rejected(history):
+    for i in range(5):
+        history.append("ETH/USDT", bar(float(i)))
+    ref = history.ref("ETH/USDT", 5)
+    for i in range(5):
+        history.append("ETH/USDT", bar(float(i)))
+    with pytest.raises(shm_mod.HistoryError):
+        shm_mod.resolve(ref)
+
+
+def test_sandbox_reads_shared_history(history):
+    direct = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3)
+    strat = loader_mod.SandboxedStrategy(direct)
+    for price in [5.0, 4.0, 3.0, 4.0, 5.0, 6.0]:
+        history.append("BTC/USDT", bar(price))
+        expected = direct.generate_signal(history.frame("BTC/USDT"))
+        result = strat.generate_signal(history.ref("BTC/USDT"))
+        assert (result and result.action) == (expected and expected.action)
+    strat.close()
+
+
+def test_resolved_history_cannot_be_written(history):
+    for i in range(4):
+        history.append("BTC/USDT", bar(float(i)))
+    frame = shm_mod.resolve(history.ref("BTC/USDT"))
+    values = frame["close"].to_numpy()
+    with pytest.raises(ValueError):
+        values.setflags(write=True)
+    with pytest.raises(ValueError):
+        values[0] = -1.0
+    assert list(history.frame("BTC/USDT")["close"]) == [0.0, 1.0, 2.0, 3.0]
+    shm_mod.detach()
+
+
+def test_resolve_unmaps_least_recently_used(history, monkeypatch):
+    monkeypatch.setattr(shm_mod, "MAX_ATTACHED", 2)
+    shm_mod.detach()
+    for symbol in ["A", "B", "C"]:
+        history.append(symbol, bar(1.0))
+        shm_mod.resolve(history.ref(symbol))
+    assert list(shm_mod._attached) == [history.ref(s).name for s in ["B", "C"]]
+    shm_mod.detach()
+    assert not shm_mod._attached
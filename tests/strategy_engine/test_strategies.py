@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from decimal import Decimal
 
@@ -8,6 +9,9 @@ BOLL_STRAT = "services.strategy-engine.strategies.bollinger_squeeze"
 ma_mod = __import__(MA_CROSS, fromlist=["MovingAverageCrossover"])
 rsi_mod = __import__(RSI_STRAT, fromlist=["RSIMeanReversion"])
 boll_mod = __import__(BOLL_STRAT, fromlist=["BollingerSqueeze"])
+ACTION_CODES = __import__(
+    "services.strategy-engine.signals.models", fromlist=["ACTION_CODES"]
+).ACTION_CODES
 
 
 def sample_data() -> pd.DataFrame:
@@ -30,3 +34,29 @@ def test_bollinger_strategy():
     strat = boll_mod.BollingerSqueeze("boll", Decimal("1"))
     sig = strat.generate_signal(sample_data())
     assert sig is None or sig.action in {"BUY", "SELL"}
+
+
+def test_streaming_matches_vectorized():
+    rng = np.random.default_rng(3)
+    data = pd.DataFrame({"close": 100 + rng.normal(0, 1, 1000).cumsum()})
+    strategies = [
+        ma_mod.MovingAverageCrossover("ma", Decimal("1"), 5, 20),
+        rsi_mod.RSIMeanReversion("rsi", Decimal("1")),
+        boll_mod.BollingerSqueeze("boll", Decimal("1"), threshold=0.01),
+    ]
+    for strat in strategies:
+        streamed = []
+        for price in data["close"]:
+            sig = strat.on_price(price)
+            streamed.append(ACTION_CODES[sig.action] if sig else 0)
+        assert any(streamed)
+        assert streamed == strat.generate_signals(data).tolist()
+
+
+def test_warm_up_then_stream():
+    data = sample_data()
+    strat = ma_mod.MovingAverageCrossover("ma", Decimal("1"), 2, 3)
+    strat.warm_up(data.iloc[:-1])
+    sig = strat.on_price(data["close"].iloc[-1])
+    expected = strat.generate_signal(data)
+    assert (sig and sig.action) == (expected and expected.action)
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+ticks_mod = __import__("services.strategy-engine.marketdata.ticks", fromlist=["TickIngestor"])
+
+
+def tick(last: str, symbol: str = "BTC/USDT") -> bytes:
+    return json.dumps(
+        {
+            "symbol": symbol,
+            "exchange": "binance",
+            "bid": last,
+            "ask": last,
+            "last": last,
+            "timestamp": "2024-01-01T00:00:00Z",
+        }
+    ).encode()
+
+
+def test_decode_tick():
+    symbol, ts, bid, ask, last = ticks_mod.decode_tick(tick("101.5"))
+    assert symbol == "BTC/USDT"
+    assert ts == 1704067200.0
+    assert (bid, ask, last) == (101.5, 101.5, 101.5)
+
+
+def test_decode_rejects_malformed():
+    with pytest.raises(ticks_mod.TickDecodeError):
+        ticks_mod.decode_tick(b'{"symbol": "BTC/USDT"}')
+    with pytest.raises(ticks_mod.TickDecodeError):
+        ticks_mod.decode_tick(b"not json")
+
+
+def test_ingestor_rolling_window():
+    ingestor = ticks_mod.TickIngestor(capacity=3)
+    try:
+        for price in ["1", "2", "3", "4"]:
+            assert ingestor.ingest(tick(price)) == "BTC/USDT"
+        assert ingestor.ingest(b"{}") is None
+        assert ingestor.malformed == 1
+        frame = ingestor.frame("BTC/USDT")
+        assert list(frame["close"]) == [2.0, 3.0, 4.0]
+        assert ingestor.ref("BTC/USDT").length == 3
+    finally:
+        ingestor.close()
@@ -0,0 +1,49 @@
+import fakeredis
+import pytest
+
+from shared.utils.gcra import GCRALimiter, RedisGCRALimiter
+
+
+def test_allows_limit_per_window_per_key() -> None:
+    limiter = GCRALimiter(limit=3, window=1.0)
+    assert [limiter.allow("a", now=0.0) for _ in range(4)] == [True, True, True, False]
+    assert limiter.allow("b", now=0.0)
+    assert not limiter.allow("a", now=0.3)
+    assert limiter.allow("a", now=0.34)
+    assert limiter.check("a", now=2.0)
+
+
+def test_check_does_not_consume_and_idle_keys_are_evicted() -> None:
+    limiter = GCRALimiter(limit=1, window=10.0)
+    assert limiter.check("a", now=0.0)
+    assert limiter.check("a", now=0.0)
+    limiter.consume("a", now=0.0)
+    assert not limiter.check("a", now=5.0)
+    for i in range(5000):
+        limiter.allow(f"k{i}", now=100.0 + i)
+    assert len(limiter) < 1100
+
+
+def test_headroom_matches_repeated_checks() -> None:
+    limiter = GCRALimiter(limit=5, window=1.0)
+    limiter.consume("a", now=0.0, count=2)
+    assert limiter.headroom("a", now=0.0) == 3
+    assert limiter.headroom("b", now=0.0) == 5
+    allowed = 0
+    while limiter.allow("a", now=0.0):
+        allowed += 1
+    assert allowed == 3
+    assert limiter.headroom("a", now=0.0) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_limiter_is_shared_between_clients() -> None:
+    server = fakeredis.FakeServer()
+    first = RedisGCRALimiter(fakeredis.FakeAsyncRedis(server=server), limit=2, window=60)
+    second = RedisGCRALimiter(fakeredis.FakeAsyncRedis(server=server), limit=2, window=60)
+    assert await first.allow("user")
+    assert await second.allow("user")
+    assert not await first.allow("user")
+    assert await second.allow("other")
+    ttl = await first.redis.pttl("ratelimit:user")
+    assert 0 < ttl <= 60_000
@@ -0,0 +1,32 @@
+import pytest
+
+import shared.validation as validation
+from shared.validation import InputValidationError, validate_schema
+
+
+@pytest.fixture(params=["fast", "jsonschema"])
+def backend(request, monkeypatch):
+    if request.param == "jsonschema":
+        monkeypatch.setattr(validation, "fastjsonschema", None)
+    validation._validator.cache_clear()
+    yield request.param
+    validation._validator.cache_clear()
+
+
+def test_validators_are_compiled_once(backend) -> None:
+    payload = {"path": "a.b", "position_size": "1"}
+    for _ in range(5):
+        validate_schema(payload, "strategy_request")
+    info = validation._validator.cache_info()
+    assert (info.misses, info.hits) == (1, 4)
+    with pytest.raises(InputValidationError):
+        validate_schema({"path": "a.b", "position_size": "x"}, "strategy_request")
+
+
+def test_sanitize_copies_only_when_escaping(backend) -> None:
+    clean = {"path": "a.b", "position_size": "1", "params": {"k": "v"}}
+    assert validate_schema(clean, "strategy_request") is clean
+    dirty = {"path": "<a>", "position_size": "1"}
+    result = validate_schema(dirty, "strategy_request")
+    assert result == {"path": "&lt;a&gt;", "position_size": "1"}
+    assert dirty["path"] == "<a>"
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Compare the per-bar and vectorized backtest paths on synthetic bars.
+
+The vectorized path is timed in Decimal, float64 and fixed-point modes, with
+the largest cumulative PnL deviation of the fast modes from Decimal.
+
+The per-bar loop re-evaluates every prefix, so its cost grows with the
+square of the bar count: by default it only runs up to 10,000 bars and is
+reported as skipped above that. Raise ``--loop-max`` to time it at 100,000
+bars (minutes); 1,000,000 bars takes hours.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+engine = importlib.import_module("services.strategy-engine.backtesting.engine")
+rsi_mod = importlib.import_module("services.strategy-engine.strategies.rsi_mean_reversion")
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def synthetic_bars(n: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({"close": 100 + rng.normal(0, 0.5, n).cumsum()})
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument(
+        "--loop-max",
+        type=int,
+        default=10_000,
+        help="largest size to run through the quadratic per-bar loop (default 10000; "
+        "larger sizes are reported as skipped)",
+    )
+    args = parser.parse_args(argv)
+    bt = engine.Backtester(slippage=Decimal("0.001"), commission=Decimal("0.0005"))
+    strat = rsi_mod.RSIMeanReversion("bench", Decimal("0.1"))
+    print(
+        f"{'bars':>10} {'loop (s)':>10} {'decimal (s)':>12} {'float (s)':>10}"
+        f" {'fixed (s)':>10} {'float dev':>10} {'fixed dev':>10}"
+    )
+    for size in args.sizes:
+        data = synthetic_bars(size)
+        vec = timed(bt.run_vectorized, data, strat)
+        fast = timed(lambda: bt.run_vectorized(data, strat, numeric=engine.FLOAT, trades=False))
+        fixed = timed(lambda: bt.run_vectorized(data, strat, numeric=engine.FIXED, trades=False))
+        loop = f"{timed(bt.run, data, strat):.3f}" if size <= args.loop_max else "skipped"
+        float_dev = bt.numeric_deviation(data, strat, engine.FLOAT)
+        fixed_dev = bt.numeric_deviation(data, strat, engine.FIXED)
+        print(
+            f"{size:>10} {loop:>10} {vec:>12.4f} {fast:>10.4f} {fixed:>10.4f}"
+            f" {float(float_dev):>10.1e} {float(fixed_dev):>10.1e}"
+        )
+    if any(size > args.loop_max for size in args.sizes):
+        print(f"loop skipped above --loop-max={args.loop_max} bars")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Peak memory and time of chunked versus in-memory vectorized backtests.
+
+Bars are generated chunk by chunk, so the chunked run never holds the whole
+history; the in-memory run builds the full frame first.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+engine = importlib.import_module("services.strategy-engine.backtesting.engine")
+ma_mod = importlib.import_module("services.strategy-engine.strategies.moving_average")
+
+
+def chunks(rows: int, size: int, seed: int = 42) -> Iterator[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    last = 100.0
+    for start in range(0, rows, size):
+        close = last + rng.normal(0, 0.05, min(size, rows - start)).cumsum()
+        last = float(close[-1])
+        yield pd.DataFrame({"close": close})
+
+
+def measure(func) -> tuple[float, float, object]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--chunk", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    bt = engine.Backtester(slippage=Decimal("0.001"), commission=Decimal("0.0005"))
+    strat = ma_mod.MovingAverageCrossover("bench", Decimal("0.1"), 50, 200)
+
+    chunked_s, chunked_mib, chunked = measure(
+        lambda: bt.run_chunked(chunks(args.rows, args.chunk), strat, numeric=engine.FLOAT, trades=False)
+    )
+    full_s, full_mib, full = measure(
+        lambda: bt.run_vectorized(
+            pd.concat(chunks(args.rows, args.chunk), ignore_index=True), strat, numeric=engine.FLOAT, trades=False
+        )
+    )
+    same = np.array_equal(chunked.arrays.pnl, full.arrays.pnl)
+    print(f"rows={args.rows:,} chunk={args.chunk:,} fills={len(full.arrays.pnl):,} identical={same}")
+    print(f"{'mode':<10} {'seconds':>8} {'peak MiB':>9}")
+    print(f"{'in-memory':<10} {full_s:>8.2f} {full_mib:>9.1f}")
+    print(f"{'chunked':<10} {chunked_s:>8.2f} {chunked_mib:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Open a year of minute bars from the HistoryStore versus parsing CSV."""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+store_mod = importlib.import_module("services.strategy-engine.marketdata.store")
+
+
+def rss() -> int:
+    """Resident set size in bytes (Linux)."""
+    with open("/proc/self/statm") as fh:
+        return int(fh.read().split()[1]) * 4096
+
+
+def minute_bars(days: int) -> pd.DataFrame:
+    ts = np.arange(days * 1440) * 60.0 + 1_704_067_200.0
+    close = 100 + np.random.default_rng(0).normal(0, 0.05, len(ts)).cumsum()
+    return pd.DataFrame(
+        {"timestamp": ts, "open": close, "high": close + 0.1, "low": close - 0.1, "close": close, "volume": 1.0}
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args(argv)
+    data = minute_bars(args.days)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = Path(tmp) / "bars.csv"
+        data.to_csv(csv, index=False)
+        store = store_mod.HistoryStore(Path(tmp) / "store")
+        store.write("BTC/USDT", data)
+        del data
+
+        start = time.perf_counter()
+        pd.read_csv(csv)
+        parse = time.perf_counter() - start
+
+        before = rss()
+        start = time.perf_counter()
+        parts = store.open("BTC/USDT")
+        opened = time.perf_counter() - start
+        after_open = rss()
+        touched = sum(float(p[4, -1]) for p in parts)
+        after_touch = rss()
+        start = time.perf_counter()
+        frames = list(store.partitions("BTC/USDT"))
+        framed = time.perf_counter() - start
+        start = time.perf_counter()
+        frame = store.read("BTC/USDT")
+        concat = time.perf_counter() - start
+
+        print(f"rows={len(frame):,} partitions={len(parts)} (sum of last closes {touched:,.0f})")
+        print(f"pd.read_csv:                {parse * 1e3:>8.1f} ms")
+        print(f"open every partition:       {opened * 1e3:>8.1f} ms, +{(after_open - before) / 2**20:.1f} MiB resident")
+        print(f"partitions() as DataFrames: {framed * 1e3:>8.1f} ms")
+        print(f"touch one row per day:      +{(after_touch - after_open) / 2**20:.1f} MiB resident")
+        print(f"read() into one DataFrame:  {concat * 1e3:>8.1f} ms")
+        del parts, frames, frame
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
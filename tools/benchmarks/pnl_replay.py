@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Replay recorded market ticks through PnLService, per message versus batched."""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+spec = importlib.util.spec_from_file_location("pnl", ROOT / "services/pnl/__init__.py")
+pnl = importlib.util.module_from_spec(spec)
+sys.modules["pnl"] = pnl
+spec.loader.exec_module(pnl)
+
+
+def record(path: Path, n: int, symbols: int) -> None:
+    """Write ``n`` synthetic ``market_tick.json`` lines."""
+    with path.open("w") as fh:
+        for i in range(n):
+            price = 100 + (i * 7919) % 500 / 100
+            fh.write(
+                json.dumps(
+                    {
+                        "symbol": f"S{i % symbols:03d}/USDT",
+                        "exchange": "binance",
+                        "bid": f"{price - 0.01:.2f}",
+                        "ask": f"{price + 0.01:.2f}",
+                        "last": f"{price:.2f}",
+                        "timestamp": "2024-01-01T00:00:00+00:00",
+                    }
+                )
+                + "\n"
+            )
+
+
+def service(symbols: int):
+    tracker = pnl.PnLService()
+    for i in range(symbols):
+        tracker.on_fill(f"S{i:03d}/USDT", Decimal("1"), Decimal("100"))
+    return tracker
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--file", type=Path, help="recorded ticks, one JSON message per line")
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = Path(tmp) / "ticks.jsonl"
+            record(path, args.messages, args.symbols)
+        lines = path.read_bytes().splitlines()
+
+    tracker = service(args.symbols)
+    start = time.perf_counter()
+    for raw in lines:
+        data = json.loads(raw)
+        tracker.on_price(data["symbol"], Decimal(str(data.get("price", data.get("last")))))
+    single = len(lines) / (time.perf_counter() - start)
+
+    tracker = service(args.symbols)
+    start = time.perf_counter()
+    for i in range(0, len(lines), args.batch):
+        tracker.apply_marks(lines[i : i + args.batch])
+    batched = len(lines) / (time.perf_counter() - start)
+    m = tracker.mark_metrics
+
+    print(f"messages={len(lines)} batch={args.batch} marks applied={m.marks} malformed={m.malformed}")
+    print(f"per message on_price: {single:>12,.0f} msg/s")
+    print(f"apply_marks batches:  {batched:>12,.0f} msg/s ({batched / single:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Event throughput of the portfolio backtester.
+
+No-op strategies isolate the engine's merge and routing overhead; a run
+with MA crossovers and risk checks shows the cost with real work.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+portfolio = importlib.import_module("services.strategy-engine.backtesting.portfolio")
+base = importlib.import_module("services.strategy-engine.strategies.base")
+ma_mod = importlib.import_module("services.strategy-engine.strategies.moving_average")
+
+
+class NoOp(base.BaseStrategy):
+    def on_price(self, price: float) -> None:
+        return None
+
+
+def feeds(symbols: int, bars: int, seed: int = 42) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        f"SYM{i}": pd.DataFrame(
+            {
+                "timestamp": np.arange(bars) * 60.0 + rng.uniform(0, 60),
+                "close": 100 + rng.normal(0, 0.1, bars).cumsum(),
+            }
+        )
+        for i in range(symbols)
+    }
+
+
+def timed(bt, data) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = bt.run(data)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=10)
+    parser.add_argument("--bars", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    # Loose limits so the risk case measures checks on orders that fill.
+    for name, value in {
+        "POSITION_LIMIT_SYMBOL": "1000000",
+        "POSITION_LIMIT_TOTAL": "1000000000",
+        "CONCENTRATION_LIMIT": "1",
+        "VELOCITY_LIMIT": "1000000000",
+        "DAILY_LOSS_LIMIT": "1000000000",
+        "DRAWDOWN_LIMIT": "1000000000",
+        "CIRCUIT_BREAKER_DRAWDOWN": "1000000000",
+    }.items():
+        os.environ.setdefault(name, value)
+    data = feeds(args.symbols, args.bars)
+    streamed = {s: list(zip(f["timestamp"].tolist(), f["close"].tolist())) for s, f in data.items()}
+    print(f"symbols={args.symbols} bars/symbol={args.bars:,}")
+    print(f"{'case':<28} {'seconds':>8} {'events/s':>12} {'fills':>7}")
+    cases = [
+        ("no-op, frame merge", NoOp, False, data),
+        ("no-op, chunked merge", NoOp, False, streamed),
+        ("MA 5/20", lambda s, q: ma_mod.MovingAverageCrossover(s, q, 5, 20), False, data),
+        ("MA 5/20 + risk limits", lambda s, q: ma_mod.MovingAverageCrossover(s, q, 5, 20), True, data),
+    ]
+    for label, make, risk, inputs in cases:
+        bt = portfolio.PortfolioBacktester(risk=risk)
+        for symbol in data:
+            bt.subscribe(symbol, make(symbol, Decimal("0.1")))
+        elapsed, result = timed(bt, inputs)
+        print(f"{label:<28} {elapsed:>8.2f} {result.events / elapsed:>12,.0f} {len(result.fills):>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
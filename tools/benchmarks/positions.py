@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Memory and snapshot cost of PositionStore versus per-symbol dataclasses."""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from shared.positions import PositionStore  # noqa: E402
+
+
+@dataclass
+class LegacyPosition:
+    """The dataclass PnLService used before PositionStore."""
+
+    quantity: Decimal = Decimal("0")
+    avg_price: Decimal = Decimal("0")
+    realized: Decimal = Decimal("0")
+    last_price: Decimal = Decimal("0")
+
+
+def build_legacy(n: int) -> dict:
+    return {
+        f"SYM{i}": LegacyPosition(Decimal(i % 7 + 1), Decimal(100 + i % 50), Decimal(i % 3), Decimal(101 + i % 50))
+        for i in range(n)
+    }
+
+
+def build_store(n: int) -> PositionStore:
+    store = PositionStore()
+    for i in range(n):
+        store.setdefault(f"SYM{i}").update(Decimal(i % 7 + 1), Decimal(100 + i % 50))
+        store[f"SYM{i}"].mark(Decimal(101 + i % 50))
+    return store
+
+
+def measure(build, n: int):
+    tracemalloc.start()
+    value = build(n)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=50_000)
+    args = parser.parse_args(argv)
+    n = args.positions
+
+    legacy, legacy_bytes = measure(build_legacy, n)
+    store, store_bytes = measure(build_store, n)
+    print(f"positions={n}")
+    print(f"dataclass dict: {legacy_bytes / n:>8.0f} bytes/position")
+    print(f"PositionStore:  {store_bytes / n:>8.0f} bytes/position ({legacy_bytes / store_bytes:.2f}x smaller)")
+
+    start = time.perf_counter()
+    realized = sum(p.realized for p in legacy.values())
+    unrealized = sum((p.last_price - p.avg_price) * p.quantity for p in legacy.values())
+    float(realized + unrealized)
+    loop = time.perf_counter() - start
+    start = time.perf_counter()
+    store.totals()
+    vec = time.perf_counter() - start
+    print(f"snapshot Decimal loop: {loop * 1e3:>8.2f} ms")
+    print(f"snapshot totals():     {vec * 1e3:>8.2f} ms ({loop / vec:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
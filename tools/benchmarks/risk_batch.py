@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Orders/sec of validate_order in a loop versus RiskManager.validate_orders."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+
+def load_risk_manager():
+    spec = importlib.util.spec_from_file_location("risk_manager", ROOT / "services/risk-manager/__init__.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["risk_manager"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+async def build(risk_mod, positions: int):
+    manager = risk_mod.RiskManager()
+    for i in range(positions):
+        await manager.on_fill(risk_mod.Order(f"SYM{i}", Decimal("1"), Decimal(100 + i % 50), "BUY"))
+    return manager
+
+
+async def run(positions: int, orders: int, repeat: int) -> float:
+    risk_mod = load_risk_manager()
+    targets = {f"SYM{i}": Decimal(1 + i % 3) for i in range(orders)}
+    manager = await build(risk_mod, positions)
+    basket = manager.rebalance(targets)
+
+    async def loop_once() -> None:
+        for order in basket:
+            try:
+                await manager.validate_order(order)
+            except risk_mod.exceptions_mod.RiskLimitBreached:
+                pass
+
+    # Best of ``repeat`` runs per path; validation leaves the portfolio as it is.
+    loop = batch = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await loop_once()
+        loop = max(loop, len(basket) / (time.perf_counter() - start))
+        start = time.perf_counter()
+        verdicts = await manager.validate_orders(basket)
+        batch = max(batch, len(basket) / (time.perf_counter() - start))
+
+    rejected = sum(v is not None for v in verdicts)
+    print(f"positions={positions} orders={len(basket)} rejected in batch={rejected}")
+    print(f"validate_order loop: {loop:>12,.0f} orders/s")
+    print(f"validate_orders:     {batch:>12,.0f} orders/s ({batch / loop:.1f}x)")
+    return batch / loop
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=1_000)
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-speedup", type=float, default=1.25, help="fail below this batch/loop ratio")
+    args = parser.parse_args(argv)
+    # Keep limits out of the way so both paths check every limit per order.
+    for name, value in {
+        "POSITION_LIMIT_SYMBOL": "1000000",
+        "POSITION_LIMIT_TOTAL": "1000000000",
+        "CONCENTRATION_LIMIT": "1",
+        "VELOCITY_LIMIT": "1000000000",
+        "DAILY_LOSS_LIMIT": "1000000000",
+        "DRAWDOWN_LIMIT": "1000000000",
+        "CIRCUIT_BREAKER_DRAWDOWN": "1000000000",
+    }.items():
+        os.environ.setdefault(name, value)
+    speedup = asyncio.run(run(args.positions, args.orders, args.repeat))
+    if speedup < args.min_speedup:
+        print(f"validate_orders is only {speedup:.2f}x the loop, expected at least {args.min_speedup}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""validate_order latency with many open positions, live vs rebuilt price map."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+
+def load_risk_manager():
+    spec = importlib.util.spec_from_file_location("risk_manager", ROOT / "services/risk-manager/__init__.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["risk_manager"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+async def per_order(risk_mod, positions: int, orders: int, rebuild: bool) -> float:
+    pnl_cls = risk_mod.app_mod.PnLService
+    if rebuild:
+        # The previous PnLService.prices: a fresh dict on every access.
+        class pnl_cls(pnl_cls):  # type: ignore[no-redef]
+            @property
+            def prices(self):
+                return {sym: pos.last_price for sym, pos in self.positions.items()}
+
+    manager = risk_mod.RiskManager(pnl_service=pnl_cls())
+    for i in range(positions):
+        await manager.on_fill(risk_mod.Order(f"SYM{i}", Decimal("1"), Decimal(100 + i % 50), "BUY"))
+    order = risk_mod.Order("SYM0", Decimal("1"), Decimal("100"), "BUY")
+    start = time.perf_counter()
+    for _ in range(orders):
+        await manager.validate_order(order)
+    return (time.perf_counter() - start) / orders
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--orders", type=int, default=200)
+    args = parser.parse_args(argv)
+    for name, value in {
+        "POSITION_LIMIT_SYMBOL": "1000000",
+        "POSITION_LIMIT_TOTAL": "1000000000",
+        "CONCENTRATION_LIMIT": "1",
+        "VELOCITY_LIMIT": "1000000000",
+        "DAILY_LOSS_LIMIT": "1000000000",
+        "DRAWDOWN_LIMIT": "1000000000",
+        "CIRCUIT_BREAKER_DRAWDOWN": "1000000000",
+    }.items():
+        os.environ.setdefault(name, value)
+    risk_mod = load_risk_manager()
+    for positions in args.positions:
+        old = asyncio.run(per_order(risk_mod, positions, args.orders, rebuild=True))
+        new = asyncio.run(per_order(risk_mod, positions, args.orders, rebuild=False))
+        print(
+            f"positions={positions:>6}: rebuilt dict {old * 1e6:>9,.1f} us/order, "
+            f"live view {new * 1e6:>7,.1f} us/order ({old / new:.0f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Time the risk scenario engine on a positions x scenarios matrix."""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+
+def load_scenarios():
+    spec = importlib.util.spec_from_file_location("risk_manager", ROOT / "services/risk-manager/__init__.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["risk_manager"] = mod
+    spec.loader.exec_module(mod)
+    return sys.modules["risk_manager.scenarios"]
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    value = func()
+    print(f"{label:<34} {time.perf_counter() - start:>8.3f} s")
+    return value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=5_000)
+    parser.add_argument("--scenarios", type=int, default=10_000)
+    parser.add_argument("--mc-positions", type=int, default=500, help="width of the Monte Carlo run")
+    args = parser.parse_args(argv)
+    scenarios = load_scenarios()
+    rng = np.random.default_rng(0)
+    p, n = args.positions, args.scenarios
+    engine = scenarios.ScenarioEngine(
+        [f"S{i}" for i in range(p)], rng.integers(-100, 100, p).astype(float), rng.uniform(1, 500, p)
+    )
+    print(f"positions={p} scenarios={n}")
+
+    prices = np.cumprod(1 + rng.normal(0, 0.01, (n + 1, p)), axis=0)
+    hist = timed("historical shocks", lambda: scenarios.historical(prices))
+    result = timed("evaluate historical (float64)", lambda: engine.evaluate(hist))
+    print(f"  VaR99={result.var:,.0f} ES99={result.expected_shortfall:,.0f}")
+    hist32 = hist.astype(np.float32)
+    timed("evaluate historical (float32)", lambda: engine.evaluate(hist32))
+    grid = timed("sigma grid", lambda: scenarios.sigma_grid(np.full(p, 0.02), k=3, steps=n))
+    timed("evaluate sigma grid", lambda: engine.evaluate(grid))
+
+    m = args.mc_positions
+    a = rng.normal(0, 0.01, (m, m))
+    cov = a @ a.T + np.eye(m) * 1e-4
+    mc_engine = scenarios.ScenarioEngine([f"S{i}" for i in range(m)], np.ones(m), np.full(m, 100.0))
+    draws = timed(f"monte carlo draws ({m} positions)", lambda: scenarios.monte_carlo(cov, n, seed=1))
+    timed("evaluate monte carlo", lambda: mc_engine.evaluate(draws))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
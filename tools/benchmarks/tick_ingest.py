@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Messages/sec of the old pandas tick path versus the TickIngestor."""
+from __future__ import annotations
+
+import argparse
+import importlib
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+ticks = importlib.import_module("services.strategy-engine.marketdata.ticks")
+
+
+def messages(n: int) -> list[bytes]:
+    return [
+        json.dumps(
+            {
+                "symbol": "BTC/USDT" if i % 2 else "ETH/USDT",
+                "exchange": "binance",
+                "bid": f"{100 + i % 50}.25",
+                "ask": f"{100 + i % 50}.75",
+                "last": f"{100 + i % 50}.5",
+                "timestamp": "2024-01-01T00:00:00.123456+00:00",
+            }
+        ).encode()
+        for i in range(n)
+    ]
+
+
+def rate(func, msgs: list[bytes]) -> float:
+    start = time.perf_counter()
+    for raw in msgs:
+        func(raw)
+    return len(msgs) / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    args = parser.parse_args(argv)
+    msgs = messages(args.messages)
+
+    def pandas_path(raw: bytes) -> None:
+        pd.read_json(io.StringIO(f"[{raw.decode()}]"))
+
+    ingestor = ticks.TickIngestor(capacity=10_000)
+
+    def ingest_path(raw: bytes) -> None:
+        ingestor.frame(ingestor.ingest(raw))
+
+    try:
+        before = rate(pandas_path, msgs[: max(1, args.messages // 10)])
+        ingest = rate(ingestor.ingest, msgs)
+        viewed = rate(ingest_path, msgs)
+    finally:
+        ingestor.close()
+    print(f"decoder: {ticks._loads.__module__}")
+    print(f"pd.read_json per message: {before:>12,.0f} msg/s")
+    print(f"TickIngestor.ingest:      {ingest:>12,.0f} msg/s ({ingest / before:.0f}x)")
+    print(f"ingest + DataFrame view:  {viewed:>12,.0f} msg/s ({viewed / before:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Requests/sec through ValidationMiddleware with the old and cached validators."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from html import escape
+from pathlib import Path
+from typing import Any, Dict
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+import jsonschema  # noqa: E402
+
+import shared.validation as validation  # noqa: E402
+import shared.validation.fastapi as middleware  # noqa: E402
+
+
+def legacy_validate(payload: Dict[str, Any], schema_name: str) -> Dict[str, Any]:
+    """validate_schema as it was: reload, rebuild and copy on every call."""
+    schema = json.loads((ROOT / "shared" / "schemas" / f"{schema_name}.json").read_text())
+    try:
+        jsonschema.validate(payload, schema)
+    except jsonschema.ValidationError as exc:
+        raise validation.InputValidationError(str(exc)) from exc
+    return {k: escape(str(v)) if isinstance(v, str) else v for k, v in payload.items()}
+
+
+async def app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def rate(n: int) -> float:
+    mw = middleware.ValidationMiddleware(app, {"/item": "strategy_request"})
+    body = json.dumps({"path": "strategies.rsi", "position_size": "1.5", "params": {"window": "14"}}).encode()
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/item",
+        "headers": [(b"content-type", b"application/json")],
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message) -> None:
+        pass
+
+    start = time.perf_counter()
+    for _ in range(n):
+        await mw(dict(scope), receive, send)
+    return n / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args(argv)
+    cached = middleware.validate_schema
+    middleware.validate_schema = legacy_validate
+    before = asyncio.run(rate(args.requests))
+    middleware.validate_schema = cached
+    fallback = validation.fastjsonschema
+    validation.fastjsonschema = None
+    validation._validator.cache_clear()
+    jsonschema_rate = asyncio.run(rate(args.requests))
+    validation.fastjsonschema = fallback
+    validation._validator.cache_clear()
+    fast = asyncio.run(rate(args.requests))
+    print(f"reload + jsonschema.validate: {before:>10,.0f} req/s")
+    print(f"cached jsonschema validator:  {jsonschema_rate:>10,.0f} req/s ({jsonschema_rate / before:.1f}x)")
+    if fallback is not None:
+        print(f"cached fastjsonschema:        {fast:>10,.0f} req/s ({fast / before:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
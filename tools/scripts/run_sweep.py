@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Run a parallel backtest parameter sweep from the command line.
+
+Example::
+
+    python tools/scripts/run_sweep.py data.csv \\
+        services.strategy-engine.strategies.moving_average.MovingAverageCrossover \\
+        --param short_window=5,10,20 --param long_window=50,100
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+sweep = importlib.import_module("services.strategy-engine.backtesting.sweep")
+
+
+def _value(raw: str) -> Any:
+    try:
+        return int(raw)
+    except ValueError:
+        return float(raw)
+
+
+def parse_grid(specs: List[str]) -> Dict[str, List[Any]]:
+    grid: Dict[str, List[Any]] = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if not name or not values:
+            raise SystemExit(f"invalid --param {spec!r}, expected name=v1,v2")
+        grid[name] = [_value(v) for v in values.split(",")]
+    return grid
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Backtest parameter sweep")
+    parser.add_argument("data", help="CSV file with a close column")
+    parser.add_argument("strategy", help="strategy path from the loader allowlist")
+    parser.add_argument("--param", action="append", default=[], help="name=v1,v2,...")
+    parser.add_argument("--samples", type=int, help="random sample size instead of the full grid")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--position-size", type=Decimal, default=Decimal("1"))
+    parser.add_argument("--slippage", type=Decimal, default=Decimal("0"))
+    parser.add_argument("--commission", type=Decimal, default=Decimal("0"))
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    grid = parse_grid(args.param)
+    if args.samples:
+        combos = sweep.random_sample(grid, args.samples, args.seed)
+    else:
+        combos = sweep.parameter_grid(grid)
+    table = sweep.run_sweep(
+        args.strategy,
+        pd.read_csv(args.data),
+        combos,
+        position_size=args.position_size,
+        slippage=args.slippage,
+        commission=args.commission,
+        processes=args.processes,
+    )
+    print(table.head(args.top).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())